@@ -0,0 +1,59 @@
+"""hierarchy closure tables
+
+Revision ID: 3b8e51d0c7a4
+Revises: 747b76747a26
+Create Date: 2026-10-17 16:20:13.584902
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b8e51d0c7a4"
+down_revision: Union[str, None] = "747b76747a26"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+HIERARCHIES = [
+    ("location_closure", "locations"),
+    ("department_closure", "departments"),
+    ("category_closure", "categories"),
+]
+
+
+def upgrade() -> None:
+    for closure, table in HIERARCHIES:
+        op.create_table(
+            closure,
+            sa.Column("ancestor_id", sa.Integer(), nullable=False),
+            sa.Column("descendant_id", sa.Integer(), nullable=False),
+            sa.Column("depth", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(["ancestor_id"], [f"{table}.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(["descendant_id"], [f"{table}.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("ancestor_id", "descendant_id"),
+        )
+        op.create_index(f"ix_{closure}_descendant_id", closure, ["descendant_id"], unique=False)
+        op.execute(
+            f"""
+            INSERT INTO {closure} (ancestor_id, descendant_id, depth)
+            WITH RECURSIVE paths (ancestor_id, descendant_id, depth) AS (
+                SELECT id, id, 0 FROM {table}
+                UNION ALL
+                SELECT paths.ancestor_id, child.id, paths.depth + 1
+                FROM paths JOIN {table} child ON child.parent_id = paths.descendant_id
+                -- parent_id was never checked for cycles; stop a walk that comes back around.
+                WHERE child.id <> paths.ancestor_id
+            )
+            SELECT ancestor_id, descendant_id, depth FROM paths
+            """
+        )
+
+
+def downgrade() -> None:
+    for closure, _ in reversed(HIERARCHIES):
+        op.drop_index(f"ix_{closure}_descendant_id", table_name=closure)
+        op.drop_table(closure)
@@ -0,0 +1,70 @@
+"""asset search indexes
+
+Revision ID: 747b76747a26
+Revises: fd9cca5c2bd8
+Create Date: 2026-10-17 15:02:44.913207
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "747b76747a26"
+down_revision: Union[str, None] = "fd9cca5c2bd8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        "assets",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR, persisted=True),
+            nullable=True,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_assets_search_vector",
+            "assets",
+            ["search_vector"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for column in ("asset_tag", "serial_number"):
+            op.create_index(
+                f"ix_assets_{column}_trgm",
+                "assets",
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in (
+            "ix_assets_serial_number_trgm",
+            "ix_assets_asset_tag_trgm",
+            "ix_assets_search_vector",
+        ):
+            op.drop_index(name, table_name="assets", postgresql_concurrently=True, if_exists=True)
+    op.drop_column("assets", "search_vector")
@@ -0,0 +1,32 @@
+"""depreciation_entries asset/period index
+
+Revision ID: 7bfa4eec8164
+Revises: a0af3e0bfea4
+Create Date: 2026-10-17 10:03:15.662840
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7bfa4eec8164"
+down_revision: Union[str, None] = "a0af3e0bfea4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_depreciation_entries_asset_id_period_end",
+        "depreciation_entries",
+        ["asset_id", "period_end", "id"],
+        unique=False,
+        postgresql_include=["book_value"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_depreciation_entries_asset_id_period_end", table_name="depreciation_entries")
@@ -0,0 +1,49 @@
+"""asset_book_states
+
+Revision ID: a0af3e0bfea4
+Revises: 52570fda615b
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a0af3e0bfea4"
+down_revision: Union[str, None] = "52570fda615b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "asset_book_states",
+        sa.Column("asset_id", sa.Integer(), nullable=False),
+        sa.Column("last_period_end", sa.Date(), nullable=False),
+        sa.Column("accumulated_depreciation", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column("book_value", sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["asset_id"], ["assets.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("asset_id"),
+    )
+    op.execute(
+        """
+        INSERT INTO asset_book_states (asset_id, last_period_end, accumulated_depreciation, book_value)
+        SELECT DISTINCT ON (asset_id) asset_id, period_end, accumulated_depreciation, book_value
+        FROM depreciation_entries
+        ORDER BY asset_id, period_end DESC, id DESC
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("asset_book_states")
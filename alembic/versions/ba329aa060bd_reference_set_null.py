@@ -0,0 +1,44 @@
+"""reference set null
+
+Revision ID: ba329aa060bd
+Revises: e5a9d3c27f18
+Create Date: 2026-10-17 21:14:32.508116
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "ba329aa060bd"
+down_revision: Union[str, None] = "e5a9d3c27f18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Deletes are single DELETE statements now, so clearing the references to a deleted
+# row (which the ORM used to do row by row) is left to the foreign keys.
+FOREIGN_KEYS = [
+    ("assets", "category_id", "categories"),
+    ("assets", "location_id", "locations"),
+    ("assets", "department_id", "departments"),
+    ("assets", "vendor_id", "vendors"),
+    ("categories", "parent_id", "categories"),
+    ("locations", "parent_id", "locations"),
+    ("departments", "parent_id", "departments"),
+]
+
+
+def upgrade() -> None:
+    for table, column, referent in FOREIGN_KEYS:
+        name = f"{table}_{column}_fkey"
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(name, table, referent, [column], ["id"], ondelete="SET NULL")
+
+
+def downgrade() -> None:
+    for table, column, referent in FOREIGN_KEYS:
+        name = f"{table}_{column}_fkey"
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(name, table, referent, [column], ["id"])
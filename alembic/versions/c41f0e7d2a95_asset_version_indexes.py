@@ -0,0 +1,69 @@
+"""asset version indexes
+
+Revision ID: c41f0e7d2a95
+Revises: 3b8e51d0c7a4
+Create Date: 2026-10-17 18:02:47.318406
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c41f0e7d2a95"
+down_revision: Union[str, None] = "3b8e51d0c7a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Conditional list requests read count(*) and max(updated_at) under the list's
+# filters, so the filter indexes carry updated_at to keep that an index-only scan.
+FILTER_INDEXES = [
+    ("ix_assets_status_id", ["status", "id"]),
+    ("ix_assets_category_id_id", ["category_id", "id"]),
+    ("ix_assets_location_id_id", ["location_id", "id"]),
+    ("ix_assets_department_id_id", ["department_id", "id"]),
+    ("ix_assets_vendor_id", ["vendor_id"]),
+]
+
+
+def _rebuild(name: str, columns: list[str], include: list[str]) -> None:
+    # Build the replacement alongside the old index so reads never lose it.
+    op.create_index(
+        f"{name}_new",
+        "assets",
+        columns,
+        unique=False,
+        postgresql_include=include,
+        postgresql_concurrently=True,
+        if_not_exists=True,
+    )
+    op.drop_index(name, table_name="assets", postgresql_concurrently=True, if_exists=True)
+    op.execute(f"ALTER INDEX {name}_new RENAME TO {name}")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in FILTER_INDEXES:
+            _rebuild(name, columns, ["updated_at"])
+        op.create_index(
+            "ix_assets_updated_at",
+            "assets",
+            ["updated_at"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_assets_updated_at",
+            table_name="assets",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        for name, columns in reversed(FILTER_INDEXES):
+            _rebuild(name, columns, [])
@@ -0,0 +1,58 @@
+"""touch updated_at on set null
+
+Revision ID: d7f2c81b4e60
+Revises: ba329aa060bd
+Create Date: 2026-10-17 22:40:18.203517
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d7f2c81b4e60"
+down_revision: Union[str, None] = "ba329aa060bd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# ON DELETE SET NULL rewrites the referencing rows without going through the ORM's
+# onupdate, so the rows it clears would keep an updated_at (and with it an ETag and
+# Last-Modified) from before the change.
+REFERENCES = [
+    ("assets", ["category_id", "location_id", "department_id", "vendor_id"]),
+    ("categories", ["parent_id"]),
+    ("locations", ["parent_id"]),
+    ("departments", ["parent_id"]),
+]
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE FUNCTION touch_updated_at() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.updated_at := now();
+            RETURN NEW;
+        END;
+        $$
+        """
+    )
+    for table, columns in REFERENCES:
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_touch_updated_at
+            BEFORE UPDATE OF {", ".join(columns)} ON {table}
+            FOR EACH ROW
+            WHEN (NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at)
+            EXECUTE FUNCTION touch_updated_at()
+            """
+        )
+
+
+def downgrade() -> None:
+    for table, _ in reversed(REFERENCES):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_touch_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS touch_updated_at()")
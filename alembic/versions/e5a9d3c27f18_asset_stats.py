@@ -0,0 +1,117 @@
+"""asset stats
+
+Revision ID: e5a9d3c27f18
+Revises: c41f0e7d2a95
+Create Date: 2026-10-17 19:26:05.941733
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a9d3c27f18"
+down_revision: Union[str, None] = "c41f0e7d2a95"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Each asset counts once under 'all' and once under its category, location and
+# department; a missing reference is member 0.
+APPLY_CHANGES = """
+    INSERT INTO asset_stats AS s (dimension, member_id, status, asset_count, total_value)
+    SELECT
+        member.dimension,
+        member.member_id,
+        changes.status,
+        sum(changes.sign),
+        sum(changes.sign * coalesce(changes.current_value, 0))
+    FROM ({changes}) AS changes
+    CROSS JOIN LATERAL (
+        VALUES
+            ('all', 0),
+            ('category', coalesce(changes.category_id, 0)),
+            ('location', coalesce(changes.location_id, 0)),
+            ('department', coalesce(changes.department_id, 0))
+    ) AS member (dimension, member_id)
+    GROUP BY member.dimension, member.member_id, changes.status
+    HAVING sum(changes.sign) <> 0 OR sum(changes.sign * coalesce(changes.current_value, 0)) <> 0
+    -- A fixed lock order keeps concurrent writers from deadlocking on the counters.
+    ORDER BY member.dimension, member.member_id, changes.status
+    ON CONFLICT (dimension, member_id, status) DO UPDATE
+    SET asset_count = s.asset_count + excluded.asset_count,
+        total_value = s.total_value + excluded.total_value
+"""
+
+CHANGED = "SELECT {sign} AS sign, status, current_value, category_id, location_id, department_id FROM {rows}"
+
+# (operation, transition tables, changed rows)
+TRIGGERS = [
+    ("insert", "NEW TABLE AS new_assets", CHANGED.format(sign=1, rows="new_assets")),
+    (
+        "update",
+        "OLD TABLE AS old_assets NEW TABLE AS new_assets",
+        CHANGED.format(sign=-1, rows="old_assets")
+        + " UNION ALL "
+        + CHANGED.format(sign=1, rows="new_assets"),
+    ),
+    ("delete", "OLD TABLE AS old_assets", CHANGED.format(sign=-1, rows="old_assets")),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "asset_stats",
+        sa.Column("dimension", sa.String(length=20), nullable=False),
+        sa.Column("member_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            postgresql.ENUM(
+                "AVAILABLE",
+                "ASSIGNED",
+                "IN_MAINTENANCE",
+                "RETIRED",
+                "DISPOSED",
+                name="assetstatus",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column("asset_count", sa.BigInteger(), nullable=False),
+        sa.Column("total_value", sa.Numeric(precision=16, scale=2), nullable=False),
+        sa.PrimaryKeyConstraint("dimension", "member_id", "status"),
+    )
+    op.execute(APPLY_CHANGES.format(changes=CHANGED.format(sign=1, rows="assets")))
+    # Statement-level triggers see every write path (ORM flushes, bulk updates, the
+    # importer's INSERT ... SELECT, FK actions) and fold a whole statement into one
+    # upsert per touched counter, in the writer's own transaction.
+    for operation, referencing, changes in TRIGGERS:
+        op.execute(
+            f"""
+            CREATE FUNCTION asset_stats_{operation}() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                {APPLY_CHANGES.format(changes=changes)};
+                RETURN NULL;
+            END;
+            $$
+            """
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER asset_stats_{operation}
+            AFTER {operation.upper()} ON assets
+            REFERENCING {referencing}
+            FOR EACH STATEMENT EXECUTE FUNCTION asset_stats_{operation}()
+            """
+        )
+
+
+def downgrade() -> None:
+    for operation, _, _ in reversed(TRIGGERS):
+        op.execute(f"DROP TRIGGER IF EXISTS asset_stats_{operation} ON assets")
+        op.execute(f"DROP FUNCTION IF EXISTS asset_stats_{operation}()")
+    op.drop_table("asset_stats")
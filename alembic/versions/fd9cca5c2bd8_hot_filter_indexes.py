@@ -0,0 +1,66 @@
+"""hot filter indexes
+
+Revision ID: fd9cca5c2bd8
+Revises: 066386081bd6
+Create Date: 2026-10-17 13:41:08.207551
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "fd9cca5c2bd8"
+down_revision: Union[str, None] = "066386081bd6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns, partial predicate)
+INDEXES = [
+    # List filters are followed by ORDER BY id LIMIT n, so each filter column is
+    # paired with id to let the page be read straight off the index.
+    ("ix_assets_status_id", "assets", ["status", "id"], None),
+    ("ix_assets_category_id_id", "assets", ["category_id", "id"], None),
+    ("ix_assets_location_id_id", "assets", ["location_id", "id"], None),
+    ("ix_assets_department_id_id", "assets", ["department_id", "id"], None),
+    ("ix_assets_vendor_id", "assets", ["vendor_id"], None),
+    ("ix_assignments_asset_id_assigned_at", "assignments", ["asset_id", "assigned_at"], None),
+    (
+        "ix_assignments_open_asset_id",
+        "assignments",
+        ["asset_id", "assigned_at"],
+        "returned_at IS NULL",
+    ),
+    ("ix_maintenance_records_asset_id_id", "maintenance_records", ["asset_id", "id"], None),
+    ("ix_maintenance_schedules_asset_id", "maintenance_schedules", ["asset_id"], None),
+    (
+        "ix_maintenance_schedules_active_next_due",
+        "maintenance_schedules",
+        ["next_due"],
+        "is_active",
+    ),
+    ("ix_attachments_asset_id", "attachments", ["asset_id"], None),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
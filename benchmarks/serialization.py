@@ -0,0 +1,90 @@
+import argparse
+import timeit
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from functools import partial
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy.engine.result import IteratorResult, SimpleResultMetaData
+
+from src.core.serialization import row_serializer
+from src.models import Asset
+from src.models.asset import AssetStatus
+from src.schemas.asset import AssetResponse
+from src.schemas.common import PaginatedResponse
+
+
+def _values(index: int) -> dict:
+    now = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    return {
+        "id": index,
+        "name": f"Laptop {index}",
+        "asset_tag": f"TAG-{index:08d}",
+        "serial_number": f"SN{index:010d}",
+        "description": "14-inch developer laptop with docking station and two chargers",
+        "status": AssetStatus.ASSIGNED,
+        "purchase_date": date(2024, 6, 1),
+        "purchase_price": Decimal("1899.00"),
+        "current_value": Decimal("1424.25"),
+        "warranty_expiry": date(2027, 6, 1),
+        "category_id": index % 50 + 1,
+        "location_id": index % 200 + 1,
+        "department_id": index % 100 + 1,
+        "vendor_id": index % 10 + 1,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def _meta(rows: int) -> dict:
+    return {
+        "total": rows,
+        "total_exact": True,
+        "page": 1,
+        "page_size": rows,
+        "pages": 1,
+        "next_cursor": None,
+    }
+
+
+def orm_path(entities: list[Asset]) -> bytes:
+    # What FastAPI does for response_model: validate from attributes, dump, then encode.
+    adapter = TypeAdapter(PaginatedResponse[AssetResponse])
+    page = adapter.validate_python(
+        {"items": entities, **_meta(len(entities))}, from_attributes=True
+    )
+    return JSONResponse(adapter.dump_python(page, mode="json")).body
+
+
+def row_path(rows: list) -> bytes:
+    return row_serializer(AssetResponse).dump_page(rows, **_meta(len(rows)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare response serialization paths")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    names = list(AssetResponse.model_fields)
+    for size in args.sizes:
+        values = [_values(index) for index in range(1, size + 1)]
+        entities = [Asset(**value) for value in values]
+        rows = IteratorResult(
+            SimpleResultMetaData(names), iter([tuple(v[name] for name in names) for v in values])
+        ).all()
+
+        number = max(1, 10_000 // size)
+        results = {}
+        for label, func, data in (("orm", orm_path, entities), ("rows", row_path, rows)):
+            best = min(timeit.repeat(partial(func, data), number=number, repeat=args.repeat))
+            results[label] = best / number * 1000
+        print(
+            f"{size:>7} rows  orm {results['orm']:9.3f} ms  rows {results['rows']:9.3f} ms  "
+            f"speedup {results['orm'] / results['rows']:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
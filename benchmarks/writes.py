@@ -0,0 +1,97 @@
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import async_session, engine
+from src.models import Asset
+from src.repositories.base import BaseRepository
+
+
+class OrmRepository(BaseRepository):
+    # The unit-of-work path the repository used before: load, flush, then refresh.
+    async def create(self, data: dict[str, Any]) -> Any:
+        instance = self.model(**data)
+        self.session.add(instance)
+        await self.session.flush()
+        await self.session.refresh(instance)
+        return instance
+
+    async def update(self, id: int, data: dict[str, Any]) -> Any:
+        instance = await self.get(id)
+        if not instance:
+            return None
+        for key, value in data.items():
+            if value is not None:
+                setattr(instance, key, value)
+        await self.session.flush()
+        await self.session.refresh(instance)
+        return instance
+
+    async def delete(self, id: int) -> bool:
+        instance = await self.get(id)
+        if not instance:
+            return False
+        await self.session.delete(instance)
+        await self.session.flush()
+        return True
+
+
+def _values(label: str, index: int) -> dict:
+    return {"name": f"Bench {index}", "asset_tag": f"BENCH-{label}-{index:08d}"}
+
+
+async def _run(session: AsyncSession, repo: BaseRepository, label: str, rows: int) -> dict:
+    timings = {}
+    started = time.perf_counter()
+    ids = [(await repo.create(_values(label, index))).id for index in range(rows)]
+    timings["create"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for id in ids:
+        await repo.update(id, {"name": f"Renamed {id}"})
+    timings["update"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for id in ids:
+        await repo.delete(id)
+    timings["delete"] = time.perf_counter() - started
+    # Nothing is kept; every round starts from the same table.
+    await session.rollback()
+    return {operation: seconds / rows * 1000 for operation, seconds in timings.items()}
+
+
+async def _bench(rows: int, repeat: int) -> None:
+    results: dict[str, dict[str, float]] = {}
+    for label, repository in (("orm", OrmRepository), ("statement", BaseRepository)):
+        for _ in range(repeat):
+            async with async_session() as session:
+                timings = await _run(session, repository(session, Asset), label, rows)
+            best = results.setdefault(label, timings)
+            for operation, ms in timings.items():
+                best[operation] = min(best[operation], ms)
+    await engine.dispose()
+
+    for operation in ("create", "update", "delete"):
+        orm, statement = results["orm"][operation], results["statement"][operation]
+        print(
+            f"{operation:>7}  orm {orm:8.3f} ms  statement {statement:8.3f} ms  "
+            f"speedup {orm / statement:5.2f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare per-row write latency of the ORM and single-statement paths "
+        "against DATABASE_URL; every round is rolled back"
+    )
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(_bench(args.rows, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
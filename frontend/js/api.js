@@ -78,8 +78,8 @@ class ApiClient {
         return this.get('/assets', params);
     }
 
-    async getAsset(id) {
-        return this.get(`/assets/${id}`);
+    async getAsset(id, params = {}) {
+        return this.get(`/assets/${id}`, params);
     }
 
     async createAsset(data) {
@@ -107,6 +107,10 @@ class ApiClient {
         return this.get('/categories', params);
     }
 
+    async getCategoryTree(params = {}) {
+        return this.get('/categories/tree', params);
+    }
+
     async getCategory(id) {
         return this.get(`/categories/${id}`);
     }
@@ -128,6 +132,10 @@ class ApiClient {
         return this.get('/locations', params);
     }
 
+    async getLocationTree(params = {}) {
+        return this.get('/locations/tree', params);
+    }
+
     async getLocation(id) {
         return this.get(`/locations/${id}`);
     }
@@ -149,6 +157,10 @@ class ApiClient {
         return this.get('/departments', params);
     }
 
+    async getDepartmentTree(params = {}) {
+        return this.get('/departments/tree', params);
+    }
+
     async getDepartment(id) {
         return this.get(`/departments/${id}`);
     }
@@ -263,6 +275,11 @@ class ApiClient {
     async getDepreciationReport() {
         return this.get('/reports/depreciation');
     }
+
+    // Stats
+    async getStatsOverview() {
+        return this.get('/stats/overview');
+    }
 }
 
 export const api = new ApiClient(API_BASE_URL);
@@ -6,7 +6,7 @@ import { openModal, closeModal, confirm } from '../components/modal.js';
 import { showSuccess, showError } from '../components/toast.js';
 import {
     getFormData, setFormData, formatDate, formatCurrency,
-    getStatusBadge, formatFileSize, createLoadingSpinner
+    getStatusBadge, formatFileSize, createLoadingSpinner, flattenTree
 } from '../utils.js';
 
 let table = null;
@@ -80,14 +80,14 @@ const Assets = {
     async loadLookupData() {
         try {
             const [catRes, locRes, deptRes, vendRes] = await Promise.all([
-                api.getCategories({ page: 1, page_size: 100 }),
-                api.getLocations({ page: 1, page_size: 100 }),
-                api.getDepartments({ page: 1, page_size: 100 }),
+                api.getCategoryTree(),
+                api.getLocationTree(),
+                api.getDepartmentTree(),
                 api.getVendors({ page: 1, page_size: 100 })
             ]);
-            categories = catRes.items || [];
-            locations = locRes.items || [];
-            departments = deptRes.items || [];
+            categories = flattenTree(catRes);
+            locations = flattenTree(locRes);
+            departments = flattenTree(deptRes);
             vendors = vendRes.items || [];
         } catch (error) {
             console.error('Error loading lookup data:', error);
@@ -139,9 +139,11 @@ const Assets = {
                     render: (val) => formatDate(val)
                 }
             ],
-            fetchData: (params) => {
+            fetchData: async (params) => {
                 const filters = this.getFilters(container);
-                return api.getAssets({ ...params, ...filters });
+                const response = await api.getAssets({ ...params, ...filters, facets: true });
+                this.updateFacetCounts(container, response.facets);
+                return response;
             },
             emptyMessage: 'No assets found. Add your first asset!',
             onRowClick: (row) => this.viewAsset(row.id),
@@ -183,6 +185,25 @@ const Assets = {
         return filters;
     },
 
+    updateFacetCounts(container, facets) {
+        if (!facets) return;
+        const selects = {
+            status: '#filter-status',
+            category_id: '#filter-category',
+            location_id: '#filter-location',
+            department_id: '#filter-department'
+        };
+        Object.entries(selects).forEach(([facet, sel]) => {
+            const counts = Object.fromEntries(
+                (facets[facet] || []).map(item => [String(item.value), item.count])
+            );
+            container.querySelectorAll(`${sel} option[value]:not([value=""])`).forEach(option => {
+                option.dataset.label ??= option.textContent;
+                option.textContent = `${option.dataset.label} (${counts[option.value] || 0})`;
+            });
+        });
+    },
+
     bindEvents(container) {
         container.querySelector('#add-asset-btn').addEventListener('click', () => {
             this.openAssetModal();
@@ -216,11 +237,10 @@ const Assets = {
 
     async viewAsset(id) {
         try {
-            const asset = await api.getAsset(id);
-            const category = categories.find(c => c.id === asset.category_id);
-            const location = locations.find(l => l.id === asset.location_id);
-            const department = departments.find(d => d.id === asset.department_id);
-            const vendor = vendors.find(v => v.id === asset.vendor_id);
+            const asset = await api.getAsset(id, {
+                include: 'category,location,department,vendor'
+            });
+            const { category, location, department, vendor } = asset;
 
             const content = `
                 <div class="space-y-6">
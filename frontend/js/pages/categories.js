@@ -4,7 +4,7 @@ import { api } from '../api.js';
 import { DataTable } from '../components/table.js';
 import { openModal, closeModal, confirm } from '../components/modal.js';
 import { showSuccess, showError } from '../components/toast.js';
-import { getFormData, setFormData, getDepreciationMethodLabel } from '../utils.js';
+import { getFormData, setFormData, getDepreciationMethodLabel, flattenTree } from '../utils.js';
 
 let table = null;
 let categories = [];
@@ -36,8 +36,7 @@ const Categories = {
 
     async loadCategories() {
         try {
-            const response = await api.getCategories({ page: 1, page_size: 100 });
-            categories = response.items || [];
+            categories = flattenTree(await api.getCategoryTree());
         } catch (error) {
             console.error('Error loading categories:', error);
             categories = [];
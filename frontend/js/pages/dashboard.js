@@ -9,15 +9,16 @@ const Dashboard = {
         container.innerHTML = createLoadingSpinner();
 
         try {
-            const [assetsResponse, upcomingMaintenance] = await Promise.all([
-                api.getAssets({ page: 1, page_size: 100 }),
+            const [overview, assetsResponse, upcomingMaintenance] = await Promise.all([
+                api.getStatsOverview(),
+                api.getAssets({ page: 1, page_size: 5, sort: '-id', total: 'none' }),
                 api.getUpcomingMaintenance(30)
             ]);
 
             const assets = assetsResponse.items || [];
             const maintenance = upcomingMaintenance || [];
 
-            this.render(container, assets, maintenance);
+            this.render(container, overview, assets, maintenance);
         } catch (error) {
             console.error('Error loading dashboard:', error);
             showError('Failed to load dashboard data');
@@ -30,19 +31,20 @@ const Dashboard = {
         }
     },
 
-    render(container, assets, maintenance) {
-        // Calculate stats
+    render(container, overview, recentAssets, maintenance) {
+        const byStatus = Object.fromEntries(
+            overview.by_status.map(item => [item.status, item.asset_count])
+        );
         const stats = {
-            total: assets.length,
-            available: assets.filter(a => a.status === 'available').length,
-            assigned: assets.filter(a => a.status === 'assigned').length,
-            inMaintenance: assets.filter(a => a.status === 'in_maintenance').length,
-            retired: assets.filter(a => a.status === 'retired').length,
-            totalValue: assets.reduce((sum, a) => sum + (a.current_value || 0), 0)
+            total: overview.asset_count,
+            available: byStatus.available || 0,
+            assigned: byStatus.assigned || 0,
+            inMaintenance: byStatus.in_maintenance || 0,
+            retired: byStatus.retired || 0,
+            disposed: byStatus.disposed || 0,
+            totalValue: overview.total_value
         };
 
-        const recentAssets = assets.slice(0, 5);
-
         container.innerHTML = `
             <div class="mb-6">
                 <h1 class="text-2xl font-bold text-gray-800">Dashboard</h1>
@@ -182,6 +184,10 @@ const Dashboard = {
                         <div class="w-4 h-4 rounded bg-gray-500"></div>
                         <span class="text-sm text-gray-600">Retired: ${stats.retired}</span>
                     </div>
+                    <div class="flex items-center gap-2">
+                        <div class="w-4 h-4 rounded bg-red-500"></div>
+                        <span class="text-sm text-gray-600">Disposed: ${stats.disposed}</span>
+                    </div>
                 </div>
                 <!-- Simple bar chart -->
                 <div class="mt-4 h-8 flex rounded-lg overflow-hidden">
@@ -190,11 +196,39 @@ const Dashboard = {
                         <div class="bg-blue-500" style="width: ${(stats.assigned / stats.total) * 100}%"></div>
                         <div class="bg-yellow-500" style="width: ${(stats.inMaintenance / stats.total) * 100}%"></div>
                         <div class="bg-gray-500" style="width: ${(stats.retired / stats.total) * 100}%"></div>
+                        <div class="bg-red-500" style="width: ${(stats.disposed / stats.total) * 100}%"></div>
                     ` : `
                         <div class="bg-gray-200 w-full"></div>
                     `}
                 </div>
             </div>
+
+            <!-- Breakdowns -->
+            <div class="grid grid-cols-1 lg:grid-cols-3 gap-6 mt-6">
+                ${this.renderBreakdown('By Category', overview.by_category, 'Uncategorized')}
+                ${this.renderBreakdown('By Location', overview.by_location, 'No location')}
+                ${this.renderBreakdown('By Department', overview.by_department, 'No department')}
+            </div>
+        `;
+    },
+
+    renderBreakdown(title, groups, emptyLabel) {
+        return `
+            <div class="card">
+                <h2 class="text-lg font-semibold text-gray-800 mb-4">${title}</h2>
+                ${groups.length > 0 ? `
+                    <div class="space-y-2">
+                        ${groups.slice(0, 5).map(group => `
+                            <div class="flex items-center justify-between">
+                                <span class="text-sm text-gray-700">${group.group_name || emptyLabel}</span>
+                                <span class="text-sm text-gray-500">${group.asset_count} (${formatCurrency(group.total_value)})</span>
+                            </div>
+                        `).join('')}
+                    </div>
+                ` : `
+                    <p class="text-gray-500 text-center py-4">No assets yet</p>
+                `}
+            </div>
         `;
     }
 };
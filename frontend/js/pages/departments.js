@@ -4,7 +4,7 @@ import { api } from '../api.js';
 import { DataTable } from '../components/table.js';
 import { openModal, closeModal, confirm } from '../components/modal.js';
 import { showSuccess, showError } from '../components/toast.js';
-import { getFormData, setFormData } from '../utils.js';
+import { getFormData, setFormData, flattenTree } from '../utils.js';
 
 let table = null;
 let departments = [];
@@ -36,8 +36,7 @@ const Departments = {
 
     async loadDepartments() {
         try {
-            const response = await api.getDepartments({ page: 1, page_size: 100 });
-            departments = response.items || [];
+            departments = flattenTree(await api.getDepartmentTree());
         } catch (error) {
             console.error('Error loading departments:', error);
             departments = [];
@@ -4,7 +4,7 @@ import { api } from '../api.js';
 import { DataTable } from '../components/table.js';
 import { openModal, closeModal, confirm } from '../components/modal.js';
 import { showSuccess, showError } from '../components/toast.js';
-import { getFormData, setFormData } from '../utils.js';
+import { getFormData, setFormData, flattenTree } from '../utils.js';
 
 let table = null;
 let locations = [];
@@ -36,8 +36,7 @@ const Locations = {
 
     async loadLocations() {
         try {
-            const response = await api.getLocations({ page: 1, page_size: 100 });
-            locations = response.items || [];
+            locations = flattenTree(await api.getLocationTree());
         } catch (error) {
             console.error('Error loading locations:', error);
             locations = [];
@@ -95,6 +95,14 @@ export function debounce(func, wait) {
     };
 }
 
+export function flattenTree(nodes, depth = 0, result = []) {
+    for (const node of nodes) {
+        result.push({ ...node, depth });
+        flattenTree(node.children || [], depth + 1, result);
+    }
+    return result;
+}
+
 export function escapeHtml(text) {
     if (!text) return '';
     const div = document.createElement('div');
@@ -3,12 +3,16 @@ from fastapi import APIRouter
 from src.api.v1.routes import (
     assets,
     attachments,
+    cache,
     categories,
     departments,
     depreciation,
+    exports,
+    jobs,
     locations,
     maintenance,
     qrcode,
+    stats,
     vendors,
 )
 
@@ -23,3 +27,7 @@ router.include_router(maintenance.router, prefix="/maintenance", tags=["Maintena
 router.include_router(attachments.router, tags=["Attachments"])
 router.include_router(qrcode.router, tags=["QR Codes"])
 router.include_router(depreciation.router, tags=["Depreciation"])
+router.include_router(jobs.router, prefix="/jobs", tags=["Jobs"])
+router.include_router(exports.router, prefix="/exports", tags=["Exports"])
+router.include_router(cache.router, prefix="/cache", tags=["Cache"])
+router.include_router(stats.router, prefix="/stats", tags=["Stats"])
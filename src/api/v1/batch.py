@@ -0,0 +1,73 @@
+from collections.abc import Sequence
+from typing import Any
+
+from fastapi import HTTPException
+from pydantic import BaseModel, ValidationError
+
+from src.api.v1.dependencies import Includes
+from src.core.serialization import JSONBytesResponse, RowSerializer
+from src.repositories.base import BaseRepository
+from src.schemas.common import BatchError, BatchGetResponse, BatchMode
+
+
+def parse_items(
+    schema: type[BaseModel], items: Sequence[dict[str, Any]]
+) -> tuple[dict[int, Any], dict[int, str]]:
+    parsed: dict[int, Any] = {}
+    errors: dict[int, str] = {}
+    for index, item in enumerate(items):
+        try:
+            parsed[index] = schema.model_validate(item)
+        except ValidationError as exc:
+            errors[index] = "; ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in exc.errors()
+            )
+    return parsed, errors
+
+
+def duplicate_ids(ids: dict[int, int]) -> dict[int, str]:
+    errors: dict[int, str] = {}
+    seen: set[int] = set()
+    for index, id in ids.items():
+        if id in seen:
+            errors[index] = "Duplicate id in batch"
+        seen.add(id)
+    return errors
+
+
+def batch_errors(errors: dict[int, str], ids: dict[int, int] | None = None) -> list[BatchError]:
+    return [
+        BatchError(index=index, id=(ids or {}).get(index), detail=detail)
+        for index, detail in sorted(errors.items())
+    ]
+
+
+def check_batch(mode: BatchMode, errors: dict[int, str], ids: dict[int, int] | None = None):
+    if errors and mode == BatchMode.ATOMIC:
+        raise HTTPException(
+            status_code=422,
+            detail=[error.model_dump() for error in batch_errors(errors, ids)],
+        )
+
+
+async def batch_get(
+    repo: BaseRepository,
+    key: str,
+    values: Sequence[Any],
+    fields: RowSerializer | None = None,
+    include: Includes | None = None,
+) -> BatchGetResponse | JSONBytesResponse:
+    values = list(dict.fromkeys(values))
+    columns = None
+    if fields:
+        columns = (*fields.names, *(include.columns if include else ()))
+    found = await repo.get_many_by(key, values, columns)
+    items = [found[value] for value in values if value in found]
+    missing = [value for value in values if value not in found]
+    if include and fields:
+        items = await include.expand(repo.session, items)
+        fields = include.serializer(fields)
+    if fields:
+        return fields.found_response(items, missing)
+    return BatchGetResponse(items=items, missing=missing)
@@ -0,0 +1,88 @@
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Annotated, Any
+
+from fastapi import Depends, Request, Response, status
+
+
+class ConditionalRequest:
+    # Validators are computed from (id, updated_at) or a collection's (count,
+    # max(updated_at)). A request carrying a validator has it checked before anything is
+    # loaded, so a match costs one small query and an empty 304; otherwise a list's are
+    # read alongside its page.
+    def __init__(self, request: Request, response: Response):
+        self.request = request
+        self.response = response
+        self.headers: dict[str, str] = {}
+
+    def check(
+        self, *version: Any, last_modified: datetime | None, collection: bool = False
+    ) -> Response | None:
+        # The query string selects fields, filters and pages, so it is part of the tag.
+        key = repr((self.request.url.path, str(self.request.query_params), *version))
+        etag = f'W/"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+        self.headers = {"ETag": etag}
+        if last_modified is not None:
+            self.headers["Last-Modified"] = format_datetime(
+                last_modified.astimezone(UTC), usegmt=True
+            )
+
+        if_none_match = self.request.headers.get("if-none-match")
+        if if_none_match is not None:
+            if _etag_matches(if_none_match, etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=self.headers)
+            return None
+
+        # A delete leaves a collection's max(updated_at) unchanged, so only the ETag can
+        # tell whether a list is still current.
+        if_modified_since = self.request.headers.get("if-modified-since")
+        if if_modified_since and last_modified is not None and not collection:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except TypeError, ValueError:
+                return None
+            if since.tzinfo is not None and last_modified.replace(microsecond=0) <= since:
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=self.headers)
+        return None
+
+    @property
+    def requested(self) -> bool:
+        headers = self.request.headers
+        return "if-none-match" in headers or "if-modified-since" in headers
+
+    def check_collection(
+        self,
+        version: tuple[int, datetime | None],
+        related: tuple[tuple[int, datetime | None], ...] = (),
+    ) -> Response | None:
+        # A list's validators are its own (count, max(updated_at)) plus those of the
+        # tables embedded into its rows.
+        count, updated_at = version
+        return self.check(
+            count,
+            updated_at,
+            *related,
+            last_modified=latest(updated_at, *(modified for _, modified in related)),
+            collection=True,
+        )
+
+    def finish(self, result: Any) -> Any:
+        headers = result.headers if isinstance(result, Response) else self.response.headers
+        headers.update(self.headers)
+        return result
+
+
+def latest(*values: datetime | None) -> datetime | None:
+    return max((value for value in values if value is not None), default=None)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored on both sides.
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+Conditional = Annotated[ConditionalRequest, Depends()]
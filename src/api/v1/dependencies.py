@@ -1,22 +1,235 @@
-from typing import Annotated
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Annotated, Any
 
-from fastapi import Depends, Query
+from fastapi import Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.v1.conditional import ConditionalRequest
 from src.core.database import get_db
+from src.core.serialization import JSONBytesResponse, RowSerializer, row_serializer
+from src.models.asset import AssetStatus
+from src.models.category import CategoryClosure
+from src.models.department import DepartmentClosure
+from src.models.job import Job
+from src.models.location import LocationClosure
+from src.repositories.base import BaseRepository
+from src.repositories.cached import CachedRepository
+from src.repositories.hierarchy import subtree
+from src.repositories.pagination import TotalMode
+from src.repositories.relations import Relation, load_related
+from src.schemas.common import FacetCount, FacetedPage, PaginatedResponse
+from src.schemas.job import JobResponse
 
 DbSession = Annotated[AsyncSession, Depends(get_db)]
 
 
+def sparse_fields(schema: type[BaseModel], fast: bool = False) -> Any:
+    def dependency(
+        fields: Annotated[
+            str | None, Query(description="Comma-separated list of fields to return")
+        ] = None,
+    ) -> RowSerializer | None:
+        if not fields:
+            return row_serializer(schema) if fast else None
+        names = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+        unknown = [name for name in names if name not in schema.model_fields]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+        return row_serializer(schema, names)
+
+    return Annotated[RowSerializer | None, Depends(dependency)]
+
+
+class Includes:
+    def __init__(
+        self,
+        schema: type[BaseModel],
+        relations: dict[str, Relation],
+        adapters: dict[str, TypeAdapter],
+    ):
+        self.schema = schema
+        self.relations = relations
+        self.adapters = adapters
+        self.columns = tuple(dict.fromkeys(relation.local for relation in relations.values()))
+
+    def serializer(self, fields: RowSerializer) -> RowSerializer:
+        return row_serializer(self.schema, (*fields.names, *self.relations))
+
+    async def version(self, db: AsyncSession) -> tuple[tuple[int, datetime | None], ...]:
+        # Embedded rows can change without touching the parent, so their tables' versions
+        # are part of the parent's validators.
+        return tuple(
+            [
+                await CachedRepository(db, relation.model).version()
+                for relation in self.relations.values()
+                if hasattr(relation.model, "updated_at")
+            ]
+        )
+
+    async def expand(
+        self, db: AsyncSession, rows: Sequence[Row | Mapping[str, Any]]
+    ) -> list[dict[str, Any]]:
+        related = await load_related(db, rows, self.relations)
+        embedded = {
+            name: {
+                key: self.adapters[name].validate_python(instance, from_attributes=True)
+                for key, instance in related[name].items()
+            }
+            for name in self.relations
+        }
+        items = []
+        for row in rows:
+            item = dict(row._mapping if isinstance(row, Row) else row)
+            for name, relation in self.relations.items():
+                item[name] = embedded[name].get(item[relation.local])
+            items.append(item)
+        return items
+
+
+def relation_includes(schema: type[BaseModel], relations: dict[str, Relation]) -> Any:
+    adapters = {name: TypeAdapter(schema.model_fields[name].annotation) for name in relations}
+
+    def dependency(
+        include: Annotated[
+            str | None, Query(description="Comma-separated list of relations to embed")
+        ] = None,
+    ) -> Includes | None:
+        if not include:
+            return None
+        names = tuple(dict.fromkeys(name.strip() for name in include.split(",") if name.strip()))
+        unknown = [name for name in names if name not in relations]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown relations: {', '.join(unknown)}")
+        if not names:
+            return None
+        return Includes(schema, {name: relations[name] for name in names}, adapters)
+
+    return Annotated[Includes | None, Depends(dependency)]
+
+
 class PaginationParams:
     def __init__(
         self,
         page: Annotated[int, Query(ge=1)] = 1,
         page_size: Annotated[int, Query(ge=1, le=100)] = 20,
+        cursor: Annotated[
+            str | None, Query(description="Opaque next_cursor from a previous page")
+        ] = None,
+        sort: Annotated[
+            str | None, Query(description="Column to sort by, prefixed with '-' for descending")
+        ] = None,
+        total: Annotated[TotalMode, Query()] = TotalMode.EXACT,
     ):
         self.page = page
         self.page_size = page_size
         self.skip = (page - 1) * page_size
+        self.cursor = cursor
+        self.sort = sort
+        self.total = total
+
+    async def paginate(
+        self,
+        repo: BaseRepository,
+        filters: dict[str, Any] | None = None,
+        fields: RowSerializer | None = None,
+        facets: dict[str, list[FacetCount]] | None = None,
+        include: Includes | None = None,
+        conditional: ConditionalRequest | None = None,
+        related: tuple[tuple[int, datetime | None], ...] = (),
+    ) -> PaginatedResponse | JSONBytesResponse:
+        columns = fields.names if fields else None
+        if include and fields:
+            columns = tuple(dict.fromkeys((*columns, *include.columns)))
+        page = await repo.paginate(
+            self.page_size,
+            skip=self.skip,
+            cursor=self.cursor,
+            sort=self.sort,
+            filters=filters,
+            total=self.total,
+            columns=columns,
+            version=conditional is not None,
+        )
+        items = page.items
+        if include and fields:
+            items = await include.expand(repo.session, items)
+            fields = include.serializer(fields)
+        meta = {
+            "total": page.total,
+            "total_exact": page.total_exact,
+            "page": self.page,
+            "page_size": self.page_size,
+            "pages": (
+                (page.total + self.page_size - 1) // self.page_size
+                if page.total is not None
+                else None
+            ),
+            "next_cursor": page.next_cursor,
+        }
+        if facets is not None:
+            meta["facets"] = facets
+        if fields:
+            response = fields.page_response(items, **meta)
+        elif facets is not None:
+            response = FacetedPage(items=items, **meta)
+        else:
+            response = PaginatedResponse(items=items, **meta)
+        if conditional is None:
+            return response
+        # The validators sent are those of the page's own snapshot.
+        conditional.check_collection(page.version, related)
+        return conditional.finish(response)
+
+
+class OffsetPaginationParams:
+    def __init__(
+        self,
+        page: Annotated[int, Query(ge=1)] = 1,
+        page_size: Annotated[int, Query(ge=1, le=100)] = 20,
+    ):
+        self.page = page
+        self.page_size = page_size
+        self.skip = (page - 1) * page_size
+
+
+def asset_filters(
+    status: AssetStatus | None = Query(None),
+    category_id: int | None = Query(None),
+    location_id: int | None = Query(None),
+    department_id: int | None = Query(None),
+    include_descendants: bool = Query(
+        False, description="Also match child categories, locations and departments"
+    ),
+) -> dict[str, Any]:
+    filters = {
+        "status": status,
+        "category_id": category_id,
+        "location_id": location_id,
+        "department_id": department_id,
+    }
+    if include_descendants:
+        for key, closure in (
+            ("category_id", CategoryClosure),
+            ("location_id", LocationClosure),
+            ("department_id", DepartmentClosure),
+        ):
+            if filters[key] is not None:
+                filters[key] = subtree(closure, filters[key])
+    return filters
 
 
 Pagination = Annotated[PaginationParams, Depends()]
+OffsetPagination = Annotated[OffsetPaginationParams, Depends()]
+AssetFilters = Annotated[dict[str, Any], Depends(asset_filters)]
+
+
+def accepted_job(job: Job) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=JobResponse.model_validate(job).model_dump(mode="json"),
+        headers={"Location": f"/api/v1/jobs/{job.id}"},
+    )
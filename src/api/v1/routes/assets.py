@@ -1,50 +1,124 @@
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Request, status
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
-from src.api.v1.dependencies import DbSession, Pagination
+from src.api.v1.batch import batch_errors, batch_get, check_batch, duplicate_ids, parse_items
+from src.api.v1.conditional import Conditional, latest
+from src.api.v1.dependencies import (
+    AssetFilters,
+    DbSession,
+    OffsetPagination,
+    Pagination,
+    relation_includes,
+    sparse_fields,
+)
 from src.models.asset import Asset, AssetStatus
 from src.models.assignment import Assignment
+from src.models.category import Category
+from src.models.department import Department
+from src.models.location import Location
+from src.models.vendor import Vendor
 from src.repositories.base import BaseRepository
+from src.repositories.relations import Relation
 from src.schemas.asset import (
     AssetAssign,
+    AssetBatchCreate,
+    AssetBatchDelete,
+    AssetBatchGet,
+    AssetBatchUpdate,
+    AssetBatchUpdateItem,
     AssetCreate,
+    AssetExpanded,
     AssetResponse,
     AssetReturn,
+    AssetSearchResult,
     AssetUpdate,
 )
-from src.schemas.common import PaginatedResponse
+from src.schemas.asset_import import AssetImportResult, ImportFormat
+from src.schemas.common import BatchGetResponse, BatchResponse, FacetedPage, PaginatedResponse
+from src.services.asset_facets import asset_facets
+from src.services.asset_import import IMPORT_ERROR_LIMIT, import_assets
+from src.services.asset_search import search_assets
 
 router = APIRouter()
 
+AssetFields = sparse_fields(AssetResponse, fast=True)
+AssetSearchFields = sparse_fields(AssetSearchResult, fast=True)
+AssetIncludes = relation_includes(
+    AssetExpanded,
+    {
+        "category": Relation(Category, "category_id"),
+        "location": Relation(Location, "location_id"),
+        "department": Relation(Department, "department_id"),
+        "vendor": Relation(Vendor, "vendor_id"),
+        "current_assignment": Relation(
+            Assignment,
+            "id",
+            remote="asset_id",
+            where=(Assignment.returned_at.is_(None),),
+            order_by=(Assignment.assigned_at,),
+        ),
+    },
+)
+
 
-@router.get("", response_model=PaginatedResponse[AssetResponse])
+@router.get("", response_model=FacetedPage[AssetExpanded])
 async def list_assets(
     db: DbSession,
     pagination: Pagination,
-    status: AssetStatus | None = Query(None),
-    category_id: int | None = Query(None),
-    location_id: int | None = Query(None),
-    department_id: int | None = Query(None),
+    fields: AssetFields,
+    filters: AssetFilters,
+    include: AssetIncludes,
+    conditional: Conditional,
+    facets: bool = Query(
+        False, description="Also count matches per status, category, location and department"
+    ),
 ):
     repo = BaseRepository(db, Asset)
-    filters = {
-        "status": status,
-        "category_id": category_id,
-        "location_id": location_id,
-        "department_id": department_id,
-    }
-    items = await repo.get_all(
-        skip=pagination.skip, limit=pagination.page_size, filters=filters
+    versions = await include.version(db) if include else ()
+    # Without a validator to compare there is nothing to short-circuit; the ETag is then
+    # taken from the page query itself.
+    if conditional.requested and (
+        not_modified := conditional.check_collection(await repo.version(filters), versions)
+    ):
+        return not_modified
+    return await pagination.paginate(
+        repo,
+        filters=filters,
+        fields=fields,
+        facets=await asset_facets(db, filters) if facets else None,
+        include=include,
+        conditional=conditional,
+        related=versions,
+    )
+
+
+@router.get("/search", response_model=PaginatedResponse[AssetSearchResult])
+async def search_asset_index(
+    db: DbSession,
+    pagination: OffsetPagination,
+    fields: AssetSearchFields,
+    filters: AssetFilters,
+    q: str = Query(..., min_length=1, max_length=200),
+):
+    rows, total = await search_assets(
+        db,
+        q,
+        fields.names,
+        pagination.page_size,
+        skip=pagination.skip,
+        filters=filters,
     )
-    total = await repo.count(filters=filters)
-    return PaginatedResponse(
-        items=items,
+    return fields.page_response(
+        rows,
         total=total,
+        total_exact=True,
         page=pagination.page,
         page_size=pagination.page_size,
         pages=(total + pagination.page_size - 1) // pagination.page_size,
+        next_cursor=None,
     )
 
 
@@ -57,13 +131,149 @@ async def create_asset(db: DbSession, data: AssetCreate):
     return await repo.create(asset_data)
 
 
-@router.get("/{asset_id}", response_model=AssetResponse)
-async def get_asset(db: DbSession, asset_id: int):
+@router.post(
+    ":batch", response_model=BatchResponse[AssetResponse], status_code=status.HTTP_201_CREATED
+)
+async def create_assets(db: DbSession, data: AssetBatchCreate):
     repo = BaseRepository(db, Asset)
-    asset = await repo.get(asset_id)
+    parsed, errors = parse_items(AssetCreate, data.items)
+    rows = {}
+    for index, item in parsed.items():
+        rows[index] = item.model_dump()
+        if item.purchase_price is not None:
+            rows[index]["current_value"] = item.purchase_price
+    errors = {**await repo.validate_many(rows), **errors}
+    check_batch(data.mode, errors)
+
+    try:
+        assets = await repo.create_many(
+            [row for index, row in sorted(rows.items()) if index not in errors]
+        )
+    except IntegrityError as exc:
+        raise HTTPException(
+            status_code=409, detail="Batch conflicts with concurrent changes"
+        ) from exc
+    return BatchResponse(
+        mode=data.mode,
+        succeeded=len(assets),
+        failed=len(errors),
+        items=assets,
+        errors=batch_errors(errors),
+    )
+
+
+@router.patch(":batch", response_model=BatchResponse[AssetResponse])
+async def update_assets(db: DbSession, data: AssetBatchUpdate):
+    repo = BaseRepository(db, Asset)
+    parsed, errors = parse_items(AssetBatchUpdateItem, data.items)
+    rows = {index: item.model_dump(exclude_unset=True) for index, item in parsed.items()}
+    ids = {
+        index: item["id"]
+        for index, item in enumerate(data.items)
+        if isinstance(item.get("id"), int)
+    }
+    errors = {**await repo.validate_many(rows), **duplicate_ids(ids), **errors}
+    check_batch(data.mode, errors, ids)
+
+    try:
+        assets = await repo.update_many(
+            [row for index, row in sorted(rows.items()) if index not in errors]
+        )
+    except IntegrityError as exc:
+        raise HTTPException(
+            status_code=409, detail="Batch conflicts with concurrent changes"
+        ) from exc
+    return BatchResponse(
+        mode=data.mode,
+        succeeded=len(assets),
+        failed=len(errors),
+        items=assets,
+        errors=batch_errors(errors, ids),
+    )
+
+
+@router.post(":batchDelete", response_model=BatchResponse[int])
+async def delete_assets(db: DbSession, data: AssetBatchDelete):
+    repo = BaseRepository(db, Asset)
+    ids = dict(enumerate(data.ids))
+    referenced = await repo.referenced_ids(data.ids)
+    errors = {
+        **{index: "Asset has related records" for index, id in ids.items() if id in referenced},
+        **await repo.validate_many({index: {"id": id} for index, id in ids.items()}),
+        **duplicate_ids(ids),
+    }
+    check_batch(data.mode, errors, ids)
+
+    try:
+        deleted = await repo.delete_many(
+            [asset_id for index, asset_id in ids.items() if index not in errors]
+        )
+    except IntegrityError as exc:
+        raise HTTPException(
+            status_code=409, detail="Batch conflicts with concurrent changes"
+        ) from exc
+    return BatchResponse(
+        mode=data.mode,
+        succeeded=len(deleted),
+        failed=len(errors),
+        items=deleted,
+        errors=batch_errors(errors, ids),
+    )
+
+
+@router.post(":batchGet", response_model=BatchGetResponse[AssetExpanded])
+async def batch_get_assets(
+    db: DbSession, data: AssetBatchGet, fields: AssetFields, include: AssetIncludes
+):
+    if (data.ids is None) == (data.asset_tags is None):
+        raise HTTPException(status_code=400, detail="Provide either ids or asset_tags")
+    repo = BaseRepository(db, Asset)
+    if data.ids is not None:
+        return await batch_get(repo, "id", data.ids, fields, include)
+    return await batch_get(repo, "asset_tag", data.asset_tags, fields, include)
+
+
+@router.post(":import", response_model=AssetImportResult)
+async def import_asset_file(
+    db: DbSession,
+    request: Request,
+    format: ImportFormat = Query(ImportFormat.CSV),
+    dry_run: bool = Query(False),
+    error_limit: int = Query(default=IMPORT_ERROR_LIMIT, ge=0),
+):
+    return await import_assets(
+        db, request.stream(), format, dry_run=dry_run, error_limit=error_limit
+    )
+
+
+@router.get("/{asset_id}", response_model=AssetExpanded)
+async def get_asset(
+    db: DbSession,
+    asset_id: int,
+    fields: AssetFields,
+    include: AssetIncludes,
+    conditional: Conditional,
+):
+    repo = BaseRepository(db, Asset)
+    if fields:
+        columns = [*fields.names, "updated_at", *(include.columns if include else ())]
+        asset = await repo.get_columns(asset_id, columns)
+    else:
+        asset = await repo.get(asset_id)
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
-    return asset
+    versions = await include.version(db) if include else ()
+    if not_modified := conditional.check(
+        asset_id,
+        asset.updated_at,
+        *versions,
+        last_modified=latest(asset.updated_at, *(modified for _, modified in versions)),
+    ):
+        return not_modified
+    if include and fields:
+        [item] = await include.expand(db, [asset])
+        return conditional.finish(include.serializer(fields).response(item))
+    return conditional.finish(fields.response(asset) if fields else asset)
 
 
 @router.put("/{asset_id}", response_model=AssetResponse)
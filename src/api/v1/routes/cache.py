@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+
+from src.core.cache import caches
+from src.schemas.cache import CacheStats
+
+router = APIRouter()
+
+
+@router.get("/stats", response_model=list[CacheStats])
+async def get_cache_stats():
+    return [cache.stats() for cache in caches]
@@ -1,47 +1,87 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
 
-from src.api.v1.dependencies import DbSession, Pagination
-from src.models.category import Category
+from src.api.v1.batch import batch_get
+from src.api.v1.conditional import Conditional
+from src.api.v1.dependencies import DbSession, Pagination, sparse_fields
+from src.core.serialization import JSONBytesResponse
+from src.models.asset import Asset
+from src.models.category import Category, CategoryClosure
 from src.repositories.base import BaseRepository
-from src.schemas.category import CategoryCreate, CategoryResponse, CategoryUpdate
-from src.schemas.common import PaginatedResponse
+from src.repositories.cached import CachedRepository
+from src.repositories.hierarchy import HierarchyRepository
+from src.schemas.category import (
+    CategoryCreate,
+    CategoryResponse,
+    CategoryTreeNode,
+    CategoryUpdate,
+)
+from src.schemas.common import BatchGetRequest, BatchGetResponse, PaginatedResponse
+from src.services.hierarchy import hierarchy_tree
 
 router = APIRouter()
 
+CategoryFields = sparse_fields(CategoryResponse)
+
 
 @router.get("", response_model=PaginatedResponse[CategoryResponse])
-async def list_categories(db: DbSession, pagination: Pagination):
-    repo = BaseRepository(db, Category)
-    items = await repo.get_all(skip=pagination.skip, limit=pagination.page_size)
-    total = await repo.count()
-    return PaginatedResponse(
-        items=items,
-        total=total,
-        page=pagination.page,
-        page_size=pagination.page_size,
-        pages=(total + pagination.page_size - 1) // pagination.page_size,
-    )
+async def list_categories(
+    db: DbSession, pagination: Pagination, fields: CategoryFields, conditional: Conditional
+):
+    repo = CachedRepository(db, Category)
+    if conditional.requested and (
+        not_modified := conditional.check_collection(await repo.version())
+    ):
+        return not_modified
+    return await pagination.paginate(repo, fields=fields, conditional=conditional)
 
 
 @router.post("", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
 async def create_category(db: DbSession, data: CategoryCreate):
-    repo = BaseRepository(db, Category)
+    repo = HierarchyRepository(db, Category, CategoryClosure)
     return await repo.create(data.model_dump())
 
 
+@router.post(":batchGet", response_model=BatchGetResponse[CategoryResponse])
+async def batch_get_categories(db: DbSession, data: BatchGetRequest, fields: CategoryFields):
+    return await batch_get(BaseRepository(db, Category), "id", data.ids, fields)
+
+
+@router.get("/tree", response_model=list[CategoryTreeNode])
+async def get_category_tree(
+    db: DbSession,
+    counts: bool = Query(False, description="Include direct and subtree asset counts"),
+):
+    tree = await hierarchy_tree(
+        db, Category, CategoryClosure, Asset.category_id, CategoryTreeNode, counts
+    )
+    return JSONBytesResponse(tree)
+
+
 @router.get("/{category_id}", response_model=CategoryResponse)
-async def get_category(db: DbSession, category_id: int):
-    repo = BaseRepository(db, Category)
-    category = await repo.get(category_id)
+async def get_category(
+    db: DbSession, category_id: int, fields: CategoryFields, conditional: Conditional
+):
+    repo = CachedRepository(db, Category)
+    if fields:
+        category = await repo.get_columns(category_id, [*fields.names, "updated_at"])
+    else:
+        category = await repo.get(category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
-    return category
+    if not_modified := conditional.check(
+        category_id, category.updated_at, last_modified=category.updated_at
+    ):
+        return not_modified
+    return conditional.finish(fields.response(category) if fields else category)
 
 
 @router.put("/{category_id}", response_model=CategoryResponse)
 async def update_category(db: DbSession, category_id: int, data: CategoryUpdate):
-    repo = BaseRepository(db, Category)
-    category = await repo.update(category_id, data.model_dump(exclude_unset=True))
+    repo = HierarchyRepository(db, Category, CategoryClosure)
+    try:
+        category = await repo.update(category_id, data.model_dump(exclude_unset=True))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
     return category
@@ -49,7 +89,7 @@ async def update_category(db: DbSession, category_id: int, data: CategoryUpdate)
 
 @router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_category(db: DbSession, category_id: int):
-    repo = BaseRepository(db, Category)
+    repo = HierarchyRepository(db, Category, CategoryClosure)
     deleted = await repo.delete(category_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Category not found")
@@ -1,47 +1,87 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
 
-from src.api.v1.dependencies import DbSession, Pagination
-from src.models.department import Department
+from src.api.v1.batch import batch_get
+from src.api.v1.conditional import Conditional
+from src.api.v1.dependencies import DbSession, Pagination, sparse_fields
+from src.core.serialization import JSONBytesResponse
+from src.models.asset import Asset
+from src.models.department import Department, DepartmentClosure
 from src.repositories.base import BaseRepository
-from src.schemas.common import PaginatedResponse
-from src.schemas.department import DepartmentCreate, DepartmentResponse, DepartmentUpdate
+from src.repositories.cached import CachedRepository
+from src.repositories.hierarchy import HierarchyRepository
+from src.schemas.common import BatchGetRequest, BatchGetResponse, PaginatedResponse
+from src.schemas.department import (
+    DepartmentCreate,
+    DepartmentResponse,
+    DepartmentTreeNode,
+    DepartmentUpdate,
+)
+from src.services.hierarchy import hierarchy_tree
 
 router = APIRouter()
 
+DepartmentFields = sparse_fields(DepartmentResponse)
+
 
 @router.get("", response_model=PaginatedResponse[DepartmentResponse])
-async def list_departments(db: DbSession, pagination: Pagination):
-    repo = BaseRepository(db, Department)
-    items = await repo.get_all(skip=pagination.skip, limit=pagination.page_size)
-    total = await repo.count()
-    return PaginatedResponse(
-        items=items,
-        total=total,
-        page=pagination.page,
-        page_size=pagination.page_size,
-        pages=(total + pagination.page_size - 1) // pagination.page_size,
-    )
+async def list_departments(
+    db: DbSession, pagination: Pagination, fields: DepartmentFields, conditional: Conditional
+):
+    repo = CachedRepository(db, Department)
+    if conditional.requested and (
+        not_modified := conditional.check_collection(await repo.version())
+    ):
+        return not_modified
+    return await pagination.paginate(repo, fields=fields, conditional=conditional)
 
 
 @router.post("", response_model=DepartmentResponse, status_code=status.HTTP_201_CREATED)
 async def create_department(db: DbSession, data: DepartmentCreate):
-    repo = BaseRepository(db, Department)
+    repo = HierarchyRepository(db, Department, DepartmentClosure)
     return await repo.create(data.model_dump())
 
 
+@router.post(":batchGet", response_model=BatchGetResponse[DepartmentResponse])
+async def batch_get_departments(db: DbSession, data: BatchGetRequest, fields: DepartmentFields):
+    return await batch_get(BaseRepository(db, Department), "id", data.ids, fields)
+
+
+@router.get("/tree", response_model=list[DepartmentTreeNode])
+async def get_department_tree(
+    db: DbSession,
+    counts: bool = Query(False, description="Include direct and subtree asset counts"),
+):
+    tree = await hierarchy_tree(
+        db, Department, DepartmentClosure, Asset.department_id, DepartmentTreeNode, counts
+    )
+    return JSONBytesResponse(tree)
+
+
 @router.get("/{department_id}", response_model=DepartmentResponse)
-async def get_department(db: DbSession, department_id: int):
-    repo = BaseRepository(db, Department)
-    department = await repo.get(department_id)
+async def get_department(
+    db: DbSession, department_id: int, fields: DepartmentFields, conditional: Conditional
+):
+    repo = CachedRepository(db, Department)
+    if fields:
+        department = await repo.get_columns(department_id, [*fields.names, "updated_at"])
+    else:
+        department = await repo.get(department_id)
     if not department:
         raise HTTPException(status_code=404, detail="Department not found")
-    return department
+    if not_modified := conditional.check(
+        department_id, department.updated_at, last_modified=department.updated_at
+    ):
+        return not_modified
+    return conditional.finish(fields.response(department) if fields else department)
 
 
 @router.put("/{department_id}", response_model=DepartmentResponse)
 async def update_department(db: DbSession, department_id: int, data: DepartmentUpdate):
-    repo = BaseRepository(db, Department)
-    department = await repo.update(department_id, data.model_dump(exclude_unset=True))
+    repo = HierarchyRepository(db, Department, DepartmentClosure)
+    try:
+        department = await repo.update(department_id, data.model_dump(exclude_unset=True))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     if not department:
         raise HTTPException(status_code=404, detail="Department not found")
     return department
@@ -49,7 +89,7 @@ async def update_department(db: DbSession, department_id: int, data: DepartmentU
 
 @router.delete("/{department_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_department(db: DbSession, department_id: int):
-    repo = BaseRepository(db, Department)
+    repo = HierarchyRepository(db, Department, DepartmentClosure)
     deleted = await repo.delete(department_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Department not found")
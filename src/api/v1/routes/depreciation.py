@@ -1,19 +1,39 @@
-from decimal import Decimal
+from datetime import date
 
-from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import func, select
-from sqlalchemy.orm import selectinload
+from fastapi import APIRouter, HTTPException, Query, status
+from sqlalchemy import Integer, func, literal, select
+from sqlalchemy.orm.attributes import set_committed_value
 
-from src.api.v1.dependencies import DbSession
+from src.api.v1.dependencies import DbSession, OffsetPagination, accepted_job
+from src.core.jobs import job_runner
+from src.core.serialization import row_serializer
 from src.models.asset import Asset
-from src.models.category import DepreciationMethod
-from src.models.depreciation import DepreciationEntry
+from src.models.category import Category, DepreciationMethod
+from src.models.department import Department
+from src.models.depreciation import AssetBookState, DepreciationEntry
+from src.models.location import Location
+from src.repositories.cached import CachedRepository
+from src.schemas.common import PaginatedResponse
 from src.schemas.depreciation import (
     DepreciationCalculation,
     DepreciationEntryResponse,
+    DepreciationForecast,
+    DepreciationGroupSummary,
+    DepreciationReportGrouping,
+    DepreciationReportSummary,
+    DepreciationRun,
+    DepreciationRunResult,
     DepreciationSummary,
 )
-from src.services.depreciation import calculate_depreciation_for_asset
+from src.schemas.job import JobResponse
+from src.schemas.valuation import AssetValuation, ValuationReport
+from src.services.depreciation import (
+    calculate_depreciation_for_asset,
+    post_depreciation_entry,
+    run_depreciation,
+)
+from src.services.forecast import forecast_depreciation
+from src.services.valuation import get_asset_valuations, get_valuation_report
 
 router = APIRouter()
 
@@ -24,12 +44,13 @@ async def get_asset_depreciation_history(db: DbSession, asset_id: int):
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
 
+    serializer = row_serializer(DepreciationEntryResponse)
     result = await db.execute(
-        select(DepreciationEntry)
+        select(*serializer.columns(DepreciationEntry))
         .where(DepreciationEntry.asset_id == asset_id)
         .order_by(DepreciationEntry.period_end.desc())
     )
-    return result.scalars().all()
+    return serializer.list_response(result.all())
 
 
 @router.post(
@@ -42,12 +63,12 @@ async def calculate_depreciation(
     asset_id: int,
     data: DepreciationCalculation,
 ):
-    result = await db.execute(
-        select(Asset).where(Asset.id == asset_id).options(selectinload(Asset.category))
-    )
-    asset = result.scalar_one_or_none()
+    asset = await db.get(Asset, asset_id)
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
+    if asset.category_id is not None:
+        category = await CachedRepository(db, Category).get(asset.category_id)
+        set_committed_value(asset, "category", category)
 
     if not asset.purchase_price:
         raise HTTPException(status_code=400, detail="Asset has no purchase price")
@@ -61,51 +82,185 @@ async def calculate_depreciation(
             status_code=400, detail="Cannot calculate depreciation (fully depreciated or no method)"
         )
 
-    db.add(entry)
-    await db.flush()
-
-    asset.current_value = entry.book_value
-    await db.flush()
+    await post_depreciation_entry(db, asset, entry)
     await db.refresh(entry)
 
     return entry
 
 
+@router.post(
+    "/depreciation/runs",
+    response_model=DepreciationRunResult,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobResponse}},
+)
+async def create_depreciation_run(
+    db: DbSession,
+    data: DepreciationRun,
+    background: bool = Query(False),
+):
+    if data.period_end < data.period_start:
+        raise HTTPException(status_code=400, detail="period_end must not be before period_start")
+
+    if background:
+        job = await job_runner.submit("depreciation_run", data.model_dump(mode="json"))
+        return accepted_job(job)
+
+    return await run_depreciation(
+        db,
+        data.period_start,
+        data.period_end,
+        category_id=data.category_id,
+        department_id=data.department_id,
+        location_id=data.location_id,
+    )
+
+
+def _group_label(value) -> str | None:
+    if isinstance(value, DepreciationMethod):
+        return value.value
+    return value
+
+
 @router.get("/reports/depreciation", response_model=list[DepreciationSummary])
-async def get_depreciation_report(db: DbSession):
-    result = await db.execute(
-        select(Asset).options(selectinload(Asset.category)).where(Asset.purchase_price.isnot(None))
+async def get_depreciation_report(
+    db: DbSession,
+    page: int | None = Query(None, ge=1),
+    page_size: int = Query(default=500, ge=1, le=5000),
+):
+    query = (
+        select(
+            Asset.id,
+            Asset.name,
+            Asset.asset_tag,
+            Asset.purchase_price,
+            Asset.purchase_date,
+            Asset.current_value,
+            Category.depreciation_method,
+            Category.useful_life_years,
+            func.coalesce(AssetBookState.accumulated_depreciation, 0).label("total_depreciation"),
+        )
+        .outerjoin(Category, Asset.category_id == Category.id)
+        .outerjoin(AssetBookState, AssetBookState.asset_id == Asset.id)
+        .where(Asset.purchase_price.isnot(None))
+        .order_by(Asset.id)
     )
-    assets = result.scalars().all()
-
-    summaries = []
-    for asset in assets:
-        dep_result = await db.execute(
-            select(func.sum(DepreciationEntry.depreciation_amount)).where(
-                DepreciationEntry.asset_id == asset.id
-            )
+    if page is not None:
+        query = query.offset((page - 1) * page_size).limit(page_size)
+
+    result = await db.execute(query)
+    return [
+        DepreciationSummary(
+            asset_id=row.id,
+            asset_name=row.name,
+            asset_tag=row.asset_tag,
+            purchase_price=row.purchase_price,
+            purchase_date=row.purchase_date,
+            current_book_value=row.current_value,
+            total_depreciation=row.total_depreciation,
+            depreciation_method=(row.depreciation_method or DepreciationMethod.NONE).value,
+            useful_life_years=row.useful_life_years,
         )
-        total_depreciation = dep_result.scalar() or Decimal("0")
+        for row in result
+    ]
+
+
+@router.get("/reports/depreciation/summary", response_model=DepreciationReportSummary)
+async def get_depreciation_report_summary(
+    db: DbSession,
+    group_by: DepreciationReportGrouping = Query(DepreciationReportGrouping.CATEGORY),
+):
+    query = (
+        select()
+        .select_from(Asset)
+        .outerjoin(Category, Asset.category_id == Category.id)
+        .outerjoin(AssetBookState, AssetBookState.asset_id == Asset.id)
+        .where(Asset.purchase_price.isnot(None))
+    )
 
-        method = (
-            asset.category.depreciation_method.value
-            if asset.category
-            else DepreciationMethod.NONE.value
+    if group_by == DepreciationReportGrouping.DEPRECIATION_METHOD:
+        key = func.coalesce(
+            Category.depreciation_method,
+            literal(DepreciationMethod.NONE, type_=Category.depreciation_method.type),
         )
-        useful_life = asset.category.useful_life_years if asset.category else None
-
-        summaries.append(
-            DepreciationSummary(
-                asset_id=asset.id,
-                asset_name=asset.name,
-                asset_tag=asset.asset_tag,
-                purchase_price=asset.purchase_price,
-                purchase_date=asset.purchase_date,
-                current_book_value=asset.current_value,
-                total_depreciation=total_depreciation,
-                depreciation_method=method,
-                useful_life_years=useful_life,
-            )
+        group_id = literal(None, type_=Integer)
+        group_name = key
+    else:
+        group_model = {
+            DepreciationReportGrouping.CATEGORY: Category,
+            DepreciationReportGrouping.DEPARTMENT: Department,
+            DepreciationReportGrouping.LOCATION: Location,
+        }[group_by]
+        key = getattr(Asset, f"{group_by.value}_id")
+        if group_model is not Category:
+            query = query.outerjoin(group_model, key == group_model.id)
+        group_id = key
+        group_name = func.min(group_model.name)
+
+    query = (
+        query.add_columns(
+            func.grouping(key).label("is_total"),
+            group_id.label("group_id"),
+            group_name.label("group_name"),
+            func.count(Asset.id).label("asset_count"),
+            func.coalesce(func.sum(Asset.purchase_price), 0).label("total_purchase_price"),
+            func.coalesce(func.sum(Asset.current_value), 0).label("total_book_value"),
+            func.coalesce(func.sum(AssetBookState.accumulated_depreciation), 0).label(
+                "total_depreciation"
+            ),
         )
+        .group_by(func.rollup(key))
+        .order_by(func.grouping(key), key)
+    )
+    result = await db.execute(query)
+
+    groups = []
+    total = None
+    for row in result:
+        summary = DepreciationGroupSummary(
+            group_id=None if row.is_total else row.group_id,
+            group_name=None if row.is_total else _group_label(row.group_name),
+            asset_count=row.asset_count,
+            total_purchase_price=row.total_purchase_price,
+            total_book_value=row.total_book_value,
+            total_depreciation=row.total_depreciation,
+        )
+        if row.is_total:
+            total = summary
+        else:
+            groups.append(summary)
+
+    return DepreciationReportSummary(group_by=group_by, groups=groups, total=total)
 
-    return summaries
+
+@router.get("/reports/depreciation/forecast", response_model=DepreciationForecast)
+async def get_depreciation_forecast(
+    db: DbSession,
+    start: date | None = Query(None),
+    months: int = Query(default=12, ge=1, le=600),
+    group_by: DepreciationReportGrouping = Query(DepreciationReportGrouping.CATEGORY),
+):
+    if start is None:
+        today = date.today()
+        start = date(today.year + today.month // 12, today.month % 12 + 1, 1)
+
+    return await forecast_depreciation(db, start, months, group_by)
+
+
+@router.get("/reports/valuation", response_model=ValuationReport)
+async def get_valuation(db: DbSession, as_of: date = Query(...)):
+    return await get_valuation_report(db, as_of)
+
+
+@router.get("/reports/valuation/assets", response_model=PaginatedResponse[AssetValuation])
+async def list_asset_valuations(
+    db: DbSession, pagination: OffsetPagination, as_of: date = Query(...)
+):
+    items, total = await get_asset_valuations(db, as_of, pagination.skip, pagination.page_size)
+    return PaginatedResponse(
+        items=items,
+        total=total,
+        page=pagination.page,
+        page_size=pagination.page_size,
+        pages=(total + pagination.page_size - 1) // pagination.page_size,
+    )
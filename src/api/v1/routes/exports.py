@@ -0,0 +1,76 @@
+from typing import Any
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from src.api.v1.dependencies import AssetFilters
+from src.models.asset import Asset
+from src.models.assignment import Assignment
+from src.models.depreciation import DepreciationEntry
+from src.models.maintenance import MaintenanceRecord, MaintenanceType
+from src.schemas.asset import AssetResponse
+from src.schemas.assignment import AssignmentResponse
+from src.schemas.depreciation import DepreciationEntryResponse
+from src.schemas.export import ExportFormat
+from src.schemas.maintenance import MaintenanceRecordResponse
+from src.services.export import MEDIA_TYPES, export_rows, parquet_available
+
+router = APIRouter()
+
+
+def _export(
+    name: str,
+    model: type,
+    schema: type[BaseModel],
+    format: ExportFormat,
+    filters: dict[str, Any],
+) -> StreamingResponse:
+    if format == ExportFormat.PARQUET and not parquet_available():
+        raise HTTPException(
+            status_code=501,
+            detail="Parquet export requires pyarrow (install the 'export' extra)",
+        )
+    return StreamingResponse(
+        export_rows(model, schema, format, filters),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{format.value}"'},
+    )
+
+
+@router.get("/assets")
+async def export_assets(filters: AssetFilters, format: ExportFormat = Query(ExportFormat.CSV)):
+    return _export("assets", Asset, AssetResponse, format, filters)
+
+
+@router.get("/assignments")
+async def export_assignments(
+    format: ExportFormat = Query(ExportFormat.CSV),
+    asset_id: int | None = Query(None),
+    assignee_id: str | None = Query(None),
+):
+    filters = {"asset_id": asset_id, "assignee_id": assignee_id}
+    return _export("assignments", Assignment, AssignmentResponse, format, filters)
+
+
+@router.get("/maintenance-records")
+async def export_maintenance_records(
+    format: ExportFormat = Query(ExportFormat.CSV),
+    asset_id: int | None = Query(None),
+    maintenance_type: MaintenanceType | None = Query(None),
+):
+    filters = {"asset_id": asset_id, "maintenance_type": maintenance_type}
+    return _export(
+        "maintenance-records", MaintenanceRecord, MaintenanceRecordResponse, format, filters
+    )
+
+
+@router.get("/depreciation-entries")
+async def export_depreciation_entries(
+    format: ExportFormat = Query(ExportFormat.CSV),
+    asset_id: int | None = Query(None),
+):
+    filters = {"asset_id": asset_id}
+    return _export(
+        "depreciation-entries", DepreciationEntry, DepreciationEntryResponse, format, filters
+    )
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, HTTPException, Query
+
+from src.api.v1.dependencies import DbSession, Pagination, sparse_fields
+from src.core.jobs import job_runner
+from src.models.job import Job, JobStatus
+from src.repositories.base import BaseRepository
+from src.schemas.common import PaginatedResponse
+from src.schemas.job import JobResponse
+
+router = APIRouter()
+
+JobFields = sparse_fields(JobResponse)
+
+
+@router.get("", response_model=PaginatedResponse[JobResponse])
+async def list_jobs(
+    db: DbSession,
+    pagination: Pagination,
+    fields: JobFields,
+    status: JobStatus | None = Query(None),
+    kind: str | None = Query(None),
+):
+    repo = BaseRepository(db, Job)
+    filters = {"status": status, "kind": kind}
+    return await pagination.paginate(repo, filters=filters, fields=fields)
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(db: DbSession, job_id: int, fields: JobFields):
+    if fields:
+        job = await BaseRepository(db, Job).get_columns(job_id, fields.names)
+    else:
+        job = await db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return fields.response(job) if fields else job
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse)
+async def cancel_job(job_id: int):
+    job = await job_runner.cancel(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
@@ -1,47 +1,87 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
 
-from src.api.v1.dependencies import DbSession, Pagination
-from src.models.location import Location
+from src.api.v1.batch import batch_get
+from src.api.v1.conditional import Conditional
+from src.api.v1.dependencies import DbSession, Pagination, sparse_fields
+from src.core.serialization import JSONBytesResponse
+from src.models.asset import Asset
+from src.models.location import Location, LocationClosure
 from src.repositories.base import BaseRepository
-from src.schemas.common import PaginatedResponse
-from src.schemas.location import LocationCreate, LocationResponse, LocationUpdate
+from src.repositories.cached import CachedRepository
+from src.repositories.hierarchy import HierarchyRepository
+from src.schemas.common import BatchGetRequest, BatchGetResponse, PaginatedResponse
+from src.schemas.location import (
+    LocationCreate,
+    LocationResponse,
+    LocationTreeNode,
+    LocationUpdate,
+)
+from src.services.hierarchy import hierarchy_tree
 
 router = APIRouter()
 
+LocationFields = sparse_fields(LocationResponse)
+
 
 @router.get("", response_model=PaginatedResponse[LocationResponse])
-async def list_locations(db: DbSession, pagination: Pagination):
-    repo = BaseRepository(db, Location)
-    items = await repo.get_all(skip=pagination.skip, limit=pagination.page_size)
-    total = await repo.count()
-    return PaginatedResponse(
-        items=items,
-        total=total,
-        page=pagination.page,
-        page_size=pagination.page_size,
-        pages=(total + pagination.page_size - 1) // pagination.page_size,
-    )
+async def list_locations(
+    db: DbSession, pagination: Pagination, fields: LocationFields, conditional: Conditional
+):
+    repo = CachedRepository(db, Location)
+    if conditional.requested and (
+        not_modified := conditional.check_collection(await repo.version())
+    ):
+        return not_modified
+    return await pagination.paginate(repo, fields=fields, conditional=conditional)
 
 
 @router.post("", response_model=LocationResponse, status_code=status.HTTP_201_CREATED)
 async def create_location(db: DbSession, data: LocationCreate):
-    repo = BaseRepository(db, Location)
+    repo = HierarchyRepository(db, Location, LocationClosure)
     return await repo.create(data.model_dump())
 
 
+@router.post(":batchGet", response_model=BatchGetResponse[LocationResponse])
+async def batch_get_locations(db: DbSession, data: BatchGetRequest, fields: LocationFields):
+    return await batch_get(BaseRepository(db, Location), "id", data.ids, fields)
+
+
+@router.get("/tree", response_model=list[LocationTreeNode])
+async def get_location_tree(
+    db: DbSession,
+    counts: bool = Query(False, description="Include direct and subtree asset counts"),
+):
+    tree = await hierarchy_tree(
+        db, Location, LocationClosure, Asset.location_id, LocationTreeNode, counts
+    )
+    return JSONBytesResponse(tree)
+
+
 @router.get("/{location_id}", response_model=LocationResponse)
-async def get_location(db: DbSession, location_id: int):
-    repo = BaseRepository(db, Location)
-    location = await repo.get(location_id)
+async def get_location(
+    db: DbSession, location_id: int, fields: LocationFields, conditional: Conditional
+):
+    repo = CachedRepository(db, Location)
+    if fields:
+        location = await repo.get_columns(location_id, [*fields.names, "updated_at"])
+    else:
+        location = await repo.get(location_id)
     if not location:
         raise HTTPException(status_code=404, detail="Location not found")
-    return location
+    if not_modified := conditional.check(
+        location_id, location.updated_at, last_modified=location.updated_at
+    ):
+        return not_modified
+    return conditional.finish(fields.response(location) if fields else location)
 
 
 @router.put("/{location_id}", response_model=LocationResponse)
 async def update_location(db: DbSession, location_id: int, data: LocationUpdate):
-    repo = BaseRepository(db, Location)
-    location = await repo.update(location_id, data.model_dump(exclude_unset=True))
+    repo = HierarchyRepository(db, Location, LocationClosure)
+    try:
+        location = await repo.update(location_id, data.model_dump(exclude_unset=True))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     if not location:
         raise HTTPException(status_code=404, detail="Location not found")
     return location
@@ -49,7 +89,7 @@ async def update_location(db: DbSession, location_id: int, data: LocationUpdate)
 
 @router.delete("/{location_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_location(db: DbSession, location_id: int):
-    repo = BaseRepository(db, Location)
+    repo = HierarchyRepository(db, Location, LocationClosure)
     deleted = await repo.delete(location_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Location not found")
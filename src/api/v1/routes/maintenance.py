@@ -3,7 +3,8 @@ from datetime import date
 from fastapi import APIRouter, HTTPException, Query, status
 from sqlalchemy import select
 
-from src.api.v1.dependencies import DbSession, Pagination
+from src.api.v1.dependencies import DbSession, Pagination, sparse_fields
+from src.core.serialization import row_serializer
 from src.models.asset import Asset
 from src.models.maintenance import MaintenanceRecord, MaintenanceSchedule
 from src.repositories.base import BaseRepository
@@ -19,6 +20,8 @@ from src.schemas.maintenance import (
 
 router = APIRouter()
 
+MaintenanceRecordFields = sparse_fields(MaintenanceRecordResponse, fast=True)
+
 
 @router.get("/upcoming", response_model=list[MaintenanceScheduleResponse])
 async def get_upcoming_maintenance(
@@ -26,37 +29,30 @@ async def get_upcoming_maintenance(
     days: int = Query(default=30, ge=1, le=365),
 ):
     cutoff = date.today()
+    serializer = row_serializer(MaintenanceScheduleResponse)
     result = await db.execute(
-        select(MaintenanceSchedule)
+        select(*serializer.columns(MaintenanceSchedule))
         .where(
             MaintenanceSchedule.is_active == True,
             MaintenanceSchedule.next_due <= date.fromordinal(cutoff.toordinal() + days),
         )
         .order_by(MaintenanceSchedule.next_due)
     )
-    return result.scalars().all()
+    return serializer.list_response(result.all())
 
 
 @router.get(
     "/assets/{asset_id}/maintenance", response_model=PaginatedResponse[MaintenanceRecordResponse]
 )
-async def list_asset_maintenance(db: DbSession, asset_id: int, pagination: Pagination):
+async def list_asset_maintenance(
+    db: DbSession, asset_id: int, pagination: Pagination, fields: MaintenanceRecordFields
+):
     asset = await db.get(Asset, asset_id)
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
 
     repo = BaseRepository(db, MaintenanceRecord)
-    items = await repo.get_all(
-        skip=pagination.skip, limit=pagination.page_size, filters={"asset_id": asset_id}
-    )
-    total = await repo.count(filters={"asset_id": asset_id})
-    return PaginatedResponse(
-        items=items,
-        total=total,
-        page=pagination.page,
-        page_size=pagination.page_size,
-        pages=(total + pagination.page_size - 1) // pagination.page_size,
-    )
+    return await pagination.paginate(repo, filters={"asset_id": asset_id}, fields=fields)
 
 
 @router.post(
@@ -76,11 +72,14 @@ async def create_maintenance_record(db: DbSession, asset_id: int, data: Maintena
 
 
 @router.get("/records/{record_id}", response_model=MaintenanceRecordResponse)
-async def get_maintenance_record(db: DbSession, record_id: int):
-    record = await db.get(MaintenanceRecord, record_id)
+async def get_maintenance_record(db: DbSession, record_id: int, fields: MaintenanceRecordFields):
+    if fields:
+        record = await BaseRepository(db, MaintenanceRecord).get_columns(record_id, fields.names)
+    else:
+        record = await db.get(MaintenanceRecord, record_id)
     if not record:
         raise HTTPException(status_code=404, detail="Maintenance record not found")
-    return record
+    return fields.response(record) if fields else record
 
 
 @router.put("/records/{record_id}", response_model=MaintenanceRecordResponse)
@@ -110,10 +109,13 @@ async def list_asset_schedules(db: DbSession, asset_id: int):
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
 
+    serializer = row_serializer(MaintenanceScheduleResponse)
     result = await db.execute(
-        select(MaintenanceSchedule).where(MaintenanceSchedule.asset_id == asset_id)
+        select(*serializer.columns(MaintenanceSchedule)).where(
+            MaintenanceSchedule.asset_id == asset_id
+        )
     )
-    return result.scalars().all()
+    return serializer.list_response(result.all())
 
 
 @router.post(
@@ -0,0 +1,12 @@
+from fastapi import APIRouter
+
+from src.api.v1.dependencies import DbSession
+from src.schemas.stats import StatsOverview
+from src.services.asset_stats import stats_overview
+
+router = APIRouter()
+
+
+@router.get("/overview", response_model=StatsOverview)
+async def get_stats_overview(db: DbSession):
+    return await stats_overview(db)
@@ -1,26 +1,29 @@
 from fastapi import APIRouter, HTTPException, status
 
-from src.api.v1.dependencies import DbSession, Pagination
+from src.api.v1.batch import batch_get
+from src.api.v1.conditional import Conditional
+from src.api.v1.dependencies import DbSession, Pagination, sparse_fields
 from src.models.vendor import Vendor
 from src.repositories.base import BaseRepository
-from src.schemas.common import PaginatedResponse
+from src.repositories.cached import CachedRepository
+from src.schemas.common import BatchGetRequest, BatchGetResponse, PaginatedResponse
 from src.schemas.vendor import VendorCreate, VendorResponse, VendorUpdate
 
 router = APIRouter()
 
+VendorFields = sparse_fields(VendorResponse)
+
 
 @router.get("", response_model=PaginatedResponse[VendorResponse])
-async def list_vendors(db: DbSession, pagination: Pagination):
-    repo = BaseRepository(db, Vendor)
-    items = await repo.get_all(skip=pagination.skip, limit=pagination.page_size)
-    total = await repo.count()
-    return PaginatedResponse(
-        items=items,
-        total=total,
-        page=pagination.page,
-        page_size=pagination.page_size,
-        pages=(total + pagination.page_size - 1) // pagination.page_size,
-    )
+async def list_vendors(
+    db: DbSession, pagination: Pagination, fields: VendorFields, conditional: Conditional
+):
+    repo = CachedRepository(db, Vendor)
+    if conditional.requested and (
+        not_modified := conditional.check_collection(await repo.version())
+    ):
+        return not_modified
+    return await pagination.paginate(repo, fields=fields, conditional=conditional)
 
 
 @router.post("", response_model=VendorResponse, status_code=status.HTTP_201_CREATED)
@@ -29,13 +32,25 @@ async def create_vendor(db: DbSession, data: VendorCreate):
     return await repo.create(data.model_dump())
 
 
+@router.post(":batchGet", response_model=BatchGetResponse[VendorResponse])
+async def batch_get_vendors(db: DbSession, data: BatchGetRequest, fields: VendorFields):
+    return await batch_get(BaseRepository(db, Vendor), "id", data.ids, fields)
+
+
 @router.get("/{vendor_id}", response_model=VendorResponse)
-async def get_vendor(db: DbSession, vendor_id: int):
-    repo = BaseRepository(db, Vendor)
-    vendor = await repo.get(vendor_id)
+async def get_vendor(db: DbSession, vendor_id: int, fields: VendorFields, conditional: Conditional):
+    repo = CachedRepository(db, Vendor)
+    if fields:
+        vendor = await repo.get_columns(vendor_id, [*fields.names, "updated_at"])
+    else:
+        vendor = await repo.get(vendor_id)
     if not vendor:
         raise HTTPException(status_code=404, detail="Vendor not found")
-    return vendor
+    if not_modified := conditional.check(
+        vendor_id, vendor.updated_at, last_modified=vendor.updated_at
+    ):
+        return not_modified
+    return conditional.finish(fields.response(vendor) if fields else vendor)
 
 
 @router.put("/{vendor_id}", response_model=VendorResponse)
@@ -0,0 +1,106 @@
+import argparse
+import asyncio
+import csv
+import sys
+from collections.abc import AsyncIterator
+from contextlib import ExitStack
+from pathlib import Path
+
+import aiofiles
+
+from src.core.database import async_session
+from src.schemas.asset_import import ImportFormat, ImportRowError
+from src.services.asset_import import import_assets
+from src.services.asset_stats import reconcile_asset_stats
+from src.services.depreciation import rebuild_book_states
+
+
+async def rebuild_book_state(args: argparse.Namespace) -> None:
+    async with async_session() as session:
+        count = await rebuild_book_states(session)
+        await session.commit()
+    print(f"Rebuilt book state for {count} assets")
+
+
+async def reconcile_stats(args: argparse.Namespace) -> None:
+    async with async_session() as session:
+        drifted = await reconcile_asset_stats(session)
+        await session.commit()
+    print(f"Reconciled asset stats ({drifted} counters corrected)")
+
+
+async def _read_chunks(path: Path, size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+    async with aiofiles.open(path, "rb") as f:
+        while chunk := await f.read(size):
+            yield chunk
+
+
+async def import_asset_file(args: argparse.Namespace) -> None:
+    path = Path(args.path)
+    format = args.format or (
+        ImportFormat.NDJSON if path.suffix in (".ndjson", ".jsonl") else ImportFormat.CSV
+    )
+    with ExitStack() as stack:
+        on_error = None
+        if args.errors:
+            # The full report is written as rows are rejected rather than held in memory.
+            writer = csv.writer(stack.enter_context(open(args.errors, "w", newline="")))
+            writer.writerow(["line", "asset_tag", "detail"])
+
+            def on_error(error: ImportRowError) -> None:
+                writer.writerow([error.line, error.asset_tag or "", error.detail])
+
+        async with async_session() as session:
+            result = await import_assets(
+                session,
+                _read_chunks(path),
+                format,
+                dry_run=args.dry_run,
+                error_limit=0 if args.errors else 20,
+                on_error=on_error,
+            )
+            await session.commit()
+
+    for error in result.errors:
+        print(f"line {error.line}: {error.detail}", file=sys.stderr)
+
+    action = "Validated" if args.dry_run else "Imported"
+    print(
+        f"{action} {result.imported} of {result.processed} assets "
+        f"({result.failed} rejected) in {result.duration_ms / 1000:.1f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="hecate", description="Hecate Codex maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser(
+        "rebuild-book-state", help="Recompute asset_book_states from the depreciation ledger"
+    )
+    rebuild.set_defaults(handler=rebuild_book_state)
+
+    reconcile = commands.add_parser(
+        "reconcile-stats", help="Recount asset_stats from the assets table"
+    )
+    reconcile.set_defaults(handler=reconcile_stats)
+
+    importer = commands.add_parser("import-assets", help="Bulk import assets from CSV or NDJSON")
+    importer.add_argument("path", help="File to import")
+    importer.add_argument(
+        "--format",
+        type=ImportFormat,
+        choices=list(ImportFormat),
+        metavar="{csv,ndjson}",
+        help="Defaults to the file extension",
+    )
+    importer.add_argument("--dry-run", action="store_true", help="Validate without writing")
+    importer.add_argument("--errors", help="Write every rejected row to this CSV file")
+    importer.set_defaults(handler=import_asset_file)
+
+    args = parser.parse_args()
+    asyncio.run(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Mapping
+
+from src.core.config import settings
+from src.schemas.cache import CacheStats
+
+# Table name -> ids of the rows that changed, or None when any row may have.
+Changes = Mapping[str, set[int] | None]
+
+caches: list["TableCache"] = []
+
+
+class TableCache[V]:
+    # Entries are tagged with the tables they were read from, and optionally the one row
+    # they hold, and dropped as soon as a transaction that wrote to them commits. Beyond
+    # that they expire after ttl seconds and the least recently used ones are evicted
+    # past max_entries.
+    def __init__(self, name: str, max_entries: int = 1024, ttl: float | None = None):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[frozenset[str], int | None, float, V]] = (
+            OrderedDict()
+        )
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+        self._stats = CacheStats(name=name, size=0, max_entries=max_entries, ttl_seconds=ttl)
+        caches.append(self)
+
+    def generation(self, tables: Iterable[str]) -> tuple[int, ...]:
+        return (self._epoch, *(self._generations.get(table, 0) for table in sorted(tables)))
+
+    def get(self, key: Hashable) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+        _, _, expires, value = entry
+        if expires < time.monotonic():
+            del self._entries[key]
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: V,
+        tables: Iterable[str],
+        generation: tuple[int, ...],
+        id: int | None = None,
+    ) -> None:
+        tables = frozenset(tables)
+        # A write that committed while the value was being built makes it stale already.
+        if self.generation(tables) != generation:
+            return
+        expires = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        self._entries[key] = (tables, id, expires, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def invalidate(self, changes: Changes) -> None:
+        for table in changes:
+            self._generations[table] = self._generations.get(table, 0) + 1
+        for key, (tables, id, _, _) in list(self._entries.items()):
+            for table in tables & changes.keys():
+                ids = changes[table]
+                if ids is None or id is None or id in ids:
+                    del self._entries[key]
+                    self._stats.invalidations += 1
+                    break
+
+    def clear(self) -> None:
+        self._epoch += 1
+        self._stats.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        return self._stats.model_copy(update={"size": len(self._entries)})
+
+
+def invalidate_tables(changes: Changes) -> None:
+    for cache in caches:
+        cache.invalidate(changes)
+
+
+def clear_caches() -> None:
+    for cache in caches:
+        cache.clear()
+
+
+tree_cache: TableCache[bytes] = TableCache("trees", max_entries=64)
+facet_cache: TableCache[dict] = TableCache("facets", max_entries=256)
+reference_cache: TableCache[object] = TableCache(
+    "reference",
+    max_entries=settings.reference_cache_max_entries,
+    ttl=settings.reference_cache_ttl_seconds,
+)
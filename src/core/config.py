@@ -16,5 +16,13 @@ class Settings(BaseSettings):
     upload_dir: str = "uploads"
     max_upload_size: int = 10 * 1024 * 1024  # 10MB
 
+    job_workers: int = 2
+    job_heartbeat_seconds: int = 15
+    job_stale_after_seconds: int = 120
+
+    reference_cache_ttl_seconds: float = 300
+    reference_cache_max_entries: int = 10_000
+    cache_invalidation_channel: str = "cache_invalidation"
+
 
 settings = Settings()
@@ -1,8 +1,13 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
+from functools import cache
 
+from sqlalchemy import Table, event, func, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import ORMExecuteState, Session
 
+from src.core.cache import invalidate_tables
 from src.core.config import settings
+from src.core.invalidation import encode_changes
 
 engine = create_async_engine(
     settings.database_url,
@@ -24,3 +29,83 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+
+
+# Rows written in a transaction are remembered on the session, announced to the other
+# workers with NOTIFY (delivered by PostgreSQL only if the transaction commits) and
+# invalidated in this worker's caches once it has. Job bookkeeping is never cached, so
+# progress reports and heartbeats stay off the invalidation channel.
+_UNTRACKED = frozenset({"jobs"})
+
+
+def _written(session: Session) -> dict[str, set[int] | None]:
+    return session.info.setdefault("written_tables", {})
+
+
+def _mark(session: Session, table: str, ids: Iterable[int] | None) -> None:
+    if table in _UNTRACKED:
+        return
+    written = _written(session)
+    if ids is None:
+        written[table] = None
+    elif written.setdefault(table, set()) is not None:
+        written[table].update(ids)
+
+
+@cache
+def _referencing(table: Table) -> tuple[str, ...]:
+    # Deleting a row also writes the rows whose foreign keys cascade or set null on it.
+    return tuple(
+        {
+            other.name
+            for other in table.metadata.tables.values()
+            for key in other.foreign_keys
+            if key.ondelete and key.references(table)
+        }
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session: Session, flush_context) -> None:
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        identity = inspect(instance).identity
+        _mark(
+            session,
+            instance.__table__.name,
+            identity if identity and len(identity) == 1 else None,
+        )
+    for instance in session.deleted:
+        for table in _referencing(instance.__table__):
+            _mark(session, table, None)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_execute(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        # Bulk statements can touch any row, unless the caller names the ids it writes.
+        table = state.statement.table
+        _mark(state.session, table.name, state.execution_options.get("written_ids"))
+        if state.is_delete:
+            for name in _referencing(table):
+                _mark(state.session, name, None)
+
+
+@event.listens_for(Session, "before_commit")
+def _publish_written(session: Session) -> None:
+    session.flush()
+    written = session.info.get("written_tables")
+    if written:
+        for payload in encode_changes(written):
+            session.execute(select(func.pg_notify(settings.cache_invalidation_channel, payload)))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_written(session: Session) -> None:
+    written = session.info.pop("written_tables", None)
+    if written:
+        invalidate_tables(written)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_written(session: Session) -> None:
+    session.info.pop("written_tables", None)
@@ -0,0 +1,117 @@
+import asyncio
+import json
+import logging
+import os
+import socket
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from src.core.cache import Changes, clear_caches, invalidate_tables
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY payloads are capped at 8000 bytes. Past this many ids a change is sent as
+# "any row of the table", which keeps a single table's entry well under the cap.
+MAX_NOTIFY_IDS = 500
+MAX_PAYLOAD_BYTES = 7900
+
+
+def worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _payload(changes: dict[str, list[int] | None]) -> str:
+    return json.dumps({"origin": worker_id(), "changes": changes}, separators=(",", ":"))
+
+
+def encode_changes(changes: Changes) -> list[str]:
+    payloads = []
+    batch: dict[str, list[int] | None] = {}
+    for table, ids in changes.items():
+        entry = sorted(ids) if ids is not None and len(ids) <= MAX_NOTIFY_IDS else None
+        if batch and len(_payload({**batch, table: entry})) > MAX_PAYLOAD_BYTES:
+            payloads.append(_payload(batch))
+            batch = {}
+        batch[table] = entry
+    if batch:
+        payloads.append(_payload(batch))
+    return payloads
+
+
+def decode_changes(payload: str) -> tuple[str, dict[str, set[int] | None]]:
+    message = json.loads(payload)
+    changes = {
+        table: set(ids) if ids is not None else None for table, ids in message["changes"].items()
+    }
+    return message["origin"], changes
+
+
+class InvalidationListener:
+    # Holds one LISTEN connection per worker. Notifications sent while it was not
+    # connected are lost, so every (re)connect starts from empty caches.
+    def __init__(self, channel: str, retry_seconds: float = 1, ping_seconds: float = 30):
+        self.channel = channel
+        self.retry_seconds = retry_seconds
+        self.ping_seconds = ping_seconds
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def _dsn(self) -> str:
+        url = make_url(settings.database_url).set(drivername="postgresql")
+        return url.render_as_string(hide_password=False)
+
+    def _notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            origin, changes = decode_changes(payload)
+        except ValueError, KeyError, TypeError:
+            logger.warning("Ignoring malformed invalidation payload %r", payload)
+            return
+        # The sending worker already invalidated its own caches on commit.
+        if origin != worker_id():
+            invalidate_tables(changes)
+
+    async def _run(self) -> None:
+        delay = self.retry_seconds
+        while True:
+            try:
+                connection = await asyncpg.connect(
+                    self._dsn(), server_settings={"application_name": "cache-invalidation"}
+                )
+            except (OSError, asyncpg.PostgresError) as exc:
+                logger.warning("Cache invalidation listener cannot connect: %s", exc)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30)
+                continue
+
+            lost = asyncio.Event()
+            # Bound per connection: terminating this one later must not trip the next.
+            connection.add_termination_listener(lambda _, lost=lost: lost.set())
+            try:
+                await connection.add_listener(self.channel, self._notify)
+                clear_caches()
+                delay = self.retry_seconds
+                # A dropped TCP connection can go unnoticed while idle, so ping it.
+                while not lost.is_set():
+                    try:
+                        await asyncio.wait_for(lost.wait(), self.ping_seconds)
+                    except TimeoutError:
+                        await connection.fetchval("SELECT 1", timeout=self.ping_seconds)
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError, TimeoutError) as exc:
+                logger.warning("Cache invalidation listener lost its connection: %s", exc)
+            finally:
+                connection.terminate()
+            clear_caches()
+            await asyncio.sleep(delay)
+
+
+invalidation_listener = InvalidationListener(settings.cache_invalidation_channel)
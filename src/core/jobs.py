@@ -0,0 +1,241 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import func, select, update
+
+from src.core.config import settings
+from src.core.database import async_session
+from src.models.job import Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class JobContext:
+    def __init__(self, job_id: int, params: dict[str, Any]):
+        self.job_id = job_id
+        self.params = params
+        self._last_report = 0.0
+
+    async def progress(self, current: int, total: int | None = None, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._last_report < 1:
+            return
+        self._last_report = now
+
+        values: dict[str, Any] = {"progress_current": current, "heartbeat_at": func.now()}
+        if total is not None:
+            values["progress_total"] = total
+        async with async_session() as session:
+            cancel_requested = await session.scalar(
+                update(Job)
+                .where(Job.id == self.job_id)
+                .values(**values)
+                .returning(Job.cancel_requested)
+            )
+            await session.commit()
+        if cancel_requested:
+            raise JobCancelled()
+
+
+JobHandler = Callable[[JobContext], Awaitable[dict[str, Any] | None]]
+
+
+class JobRunner:
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._handlers: dict[str, JobHandler] = {}
+        self._queue: asyncio.Queue[int] = asyncio.Queue()
+        self._queued: set[int] = set()
+        self._tasks: list[asyncio.Task] = []
+        self._running: dict[int, asyncio.Task] = {}
+
+    def handler(self, kind: str) -> Callable[[JobHandler], JobHandler]:
+        def register(func: JobHandler) -> JobHandler:
+            self._handlers[kind] = func
+            return func
+
+        return register
+
+    async def start(self) -> None:
+        await self._recover()
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._heartbeat()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(self, kind: str, params: dict[str, Any]) -> Job:
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+
+        async with async_session() as session:
+            job = Job(kind=kind, params=params)
+            session.add(job)
+            await session.commit()
+        self._enqueue(job.id)
+        return job
+
+    async def cancel(self, job_id: int) -> Job | None:
+        async with async_session() as session:
+            job = await session.get(Job, job_id, with_for_update=True)
+            if not job:
+                return None
+            if job.status == JobStatus.PENDING:
+                job.status = JobStatus.CANCELLED
+                job.finished_at = func.now()
+            elif job.status == JobStatus.RUNNING:
+                job.cancel_requested = True
+            await session.commit()
+            await session.refresh(job)
+
+        task = self._running.get(job_id)
+        if task:
+            task.cancel()
+        return job
+
+    def _enqueue(self, job_id: int) -> None:
+        if job_id not in self._queued:
+            self._queued.add(job_id)
+            self._queue.put_nowait(job_id)
+
+    async def _recover(self, orphaned_only: bool = False) -> None:
+        stale_before = func.now() - timedelta(seconds=settings.job_stale_after_seconds)
+        async with async_session() as session:
+            await session.execute(
+                update(Job)
+                .where(
+                    Job.status == JobStatus.RUNNING,
+                    func.coalesce(Job.heartbeat_at, Job.updated_at) < stale_before,
+                )
+                .values(
+                    status=JobStatus.FAILED,
+                    error="Interrupted by a restart",
+                    finished_at=func.now(),
+                )
+            )
+            pending = select(Job.id).where(Job.status == JobStatus.PENDING).order_by(Job.id)
+            if orphaned_only:
+                pending = pending.where(Job.created_at < stale_before)
+            job_ids = (await session.scalars(pending)).all()
+            await session.commit()
+        for job_id in job_ids:
+            self._enqueue(job_id)
+
+    async def _claim(self, job_id: int) -> Job | None:
+        async with async_session() as session:
+            job = await session.scalar(
+                update(Job)
+                .where(Job.id == job_id, Job.status == JobStatus.PENDING)
+                .values(
+                    status=JobStatus.RUNNING,
+                    worker=self.worker_id,
+                    started_at=func.now(),
+                    heartbeat_at=func.now(),
+                )
+                .returning(Job)
+            )
+            await session.commit()
+        return job
+
+    async def _finish(self, job_id: int, **values: Any) -> None:
+        async with async_session() as session:
+            await session.execute(
+                update(Job).where(Job.id == job_id).values(finished_at=func.now(), **values)
+            )
+            await session.commit()
+
+    async def _release(self, job_id: int) -> None:
+        async with async_session() as session:
+            await session.execute(
+                update(Job)
+                .where(Job.id == job_id)
+                .values(
+                    status=JobStatus.PENDING,
+                    worker=None,
+                    started_at=None,
+                    heartbeat_at=None,
+                    progress_current=0,
+                )
+            )
+            await session.commit()
+
+    async def _work(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            self._queued.discard(job_id)
+            try:
+                job = await self._claim(job_id)
+                if job:
+                    await self._run(job)
+            except Exception:
+                logger.exception("Job %s could not be run", job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        handler = self._handlers.get(job.kind)
+        if handler is None:
+            await self._finish(
+                job.id, status=JobStatus.FAILED, error=f"Unknown job kind: {job.kind}"
+            )
+            return
+
+        context = JobContext(job.id, job.params)
+        task = asyncio.create_task(handler(context))
+        self._running[job.id] = task
+        try:
+            result = await task
+        except asyncio.CancelledError, JobCancelled:
+            current = asyncio.current_task()
+            if current is not None and current.cancelling():
+                # The runner is shutting down: hand the job back so it resumes on restart.
+                await self._release(job.id)
+                raise
+            await self._finish(job.id, status=JobStatus.CANCELLED)
+        except Exception as exc:
+            logger.exception("Job %s failed", job.id)
+            await self._finish(job.id, status=JobStatus.FAILED, error=str(exc) or repr(exc))
+        else:
+            await self._finish(job.id, status=JobStatus.SUCCEEDED, result=result)
+        finally:
+            self._running.pop(job.id, None)
+
+    async def _heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(settings.job_heartbeat_seconds)
+            try:
+                await self._recover(orphaned_only=True)
+                if not self._running:
+                    continue
+                async with async_session() as session:
+                    result = await session.execute(
+                        update(Job)
+                        .where(Job.id.in_(list(self._running)))
+                        .values(heartbeat_at=func.now())
+                        .returning(Job.id, Job.cancel_requested)
+                    )
+                    heartbeats = result.tuples().all()
+                    await session.commit()
+                for job_id, cancel_requested in heartbeats:
+                    task = self._running.get(job_id)
+                    if cancel_requested and task:
+                        task.cancel()
+            except Exception:
+                logger.exception("Job heartbeat failed")
+
+
+job_runner = JobRunner(workers=settings.job_workers)
@@ -0,0 +1,94 @@
+from collections.abc import Mapping, Sequence
+from functools import cache
+from typing import Any, TypedDict
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Row
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.schemas.common import BatchGetResponse, FacetedPage
+
+
+class JSONBytesResponse(Response):
+    media_type = "application/json"
+
+
+# Rows coming from the database already hold the schema's types, so they are dumped
+# through TypedDict serializers without validation or intermediate model instances.
+class RowSerializer:
+    def __init__(self, schema: type[BaseModel], names: tuple[str, ...]):
+        self.schema = schema
+        self.names = names
+        row = TypedDict(
+            f"{schema.__name__}Row",
+            {name: schema.model_fields[name].annotation for name in names},
+        )
+        page = TypedDict(
+            f"{schema.__name__}RowPage",
+            {
+                name: list[row] if name == "items" else field.annotation
+                for name, field in FacetedPage.model_fields.items()
+            },
+        )
+        found = TypedDict(
+            f"{schema.__name__}RowBatch",
+            {
+                name: list[row] if name == "items" else field.annotation
+                for name, field in BatchGetResponse.model_fields.items()
+            },
+        )
+        self._row = TypeAdapter(row)
+        self._rows = TypeAdapter(list[row])
+        self._page = TypeAdapter(page)
+        self._found = TypeAdapter(found)
+
+    def columns(self, model: type) -> list[InstrumentedAttribute]:
+        return [getattr(model, name).label(name) for name in self.names]
+
+    def dump(self, row: Row | Mapping[str, Any]) -> bytes:
+        return self._row.dump_json(_mappings([row])[0])
+
+    def dump_many(self, rows: Sequence[Row | Mapping[str, Any]]) -> bytes:
+        return self._rows.dump_json(_mappings(rows))
+
+    def dump_lines(self, rows: Sequence[Row | Mapping[str, Any]]) -> bytes:
+        return b"".join(self._row.dump_json(row) + b"\n" for row in _mappings(rows))
+
+    def to_python(self, rows: Sequence[Row | Mapping[str, Any]]) -> list[dict[str, Any]]:
+        return self._rows.dump_python(_mappings(rows), mode="json")
+
+    def dump_page(self, rows: Sequence[Row | Mapping[str, Any]], **meta: Any) -> bytes:
+        return self._page.dump_json({"items": _mappings(rows), **meta})
+
+    def dump_found(self, rows: Sequence[Row | Mapping[str, Any]], missing: list[Any]) -> bytes:
+        return self._found.dump_json({"items": _mappings(rows), "missing": missing})
+
+    def response(self, row: Row | Mapping[str, Any]) -> JSONBytesResponse:
+        return JSONBytesResponse(self.dump(row))
+
+    def list_response(self, rows: Sequence[Row | Mapping[str, Any]]) -> JSONBytesResponse:
+        return JSONBytesResponse(self.dump_many(rows))
+
+    def page_response(
+        self, rows: Sequence[Row | Mapping[str, Any]], **meta: Any
+    ) -> JSONBytesResponse:
+        return JSONBytesResponse(self.dump_page(rows, **meta))
+
+    def found_response(
+        self, rows: Sequence[Row | Mapping[str, Any]], missing: list[Any]
+    ) -> JSONBytesResponse:
+        return JSONBytesResponse(self.dump_found(rows, missing))
+
+
+def _mappings(rows: Sequence[Row | Mapping[str, Any]]) -> Sequence[Mapping[str, Any]]:
+    if not rows or not isinstance(rows[0], Row):
+        return rows
+    # Row._asdict() rebuilds the key lookup per row; zipping against shared keys is far cheaper.
+    keys = rows[0]._fields
+    return [dict(zip(keys, row, strict=True)) for row in rows]
+
+
+@cache
+def row_serializer(schema: type[BaseModel], names: tuple[str, ...] | None = None) -> RowSerializer:
+    return RowSerializer(schema, names or tuple(schema.model_fields))
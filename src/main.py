@@ -2,11 +2,15 @@ import subprocess
 import sys
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from src.api.v1 import router as v1_router
 from src.core.config import settings
+from src.core.invalidation import invalidation_listener
+from src.core.jobs import job_runner
+from src.repositories.pagination import PaginationError
 
 
 def run_migrations() -> None:
@@ -16,7 +20,11 @@ def run_migrations() -> None:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     run_migrations()
+    await invalidation_listener.start()
+    await job_runner.start()
     yield
+    await job_runner.stop()
+    await invalidation_listener.stop()
 
 
 app = FastAPI(
@@ -37,6 +45,11 @@ app.add_middleware(
 app.include_router(v1_router, prefix="/api/v1")
 
 
+@app.exception_handler(PaginationError)
+async def pagination_error_handler(request: Request, exc: PaginationError):
+    return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)})
+
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
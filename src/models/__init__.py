@@ -1,24 +1,31 @@
 from src.models.base import Base
-from src.models.asset import Asset
-from src.models.category import Category
-from src.models.location import Location
-from src.models.department import Department
+from src.models.asset import Asset, AssetStat
+from src.models.category import Category, CategoryClosure
+from src.models.location import Location, LocationClosure
+from src.models.department import Department, DepartmentClosure
 from src.models.vendor import Vendor
 from src.models.assignment import Assignment
 from src.models.maintenance import MaintenanceRecord, MaintenanceSchedule
 from src.models.attachment import Attachment
-from src.models.depreciation import DepreciationEntry
+from src.models.depreciation import AssetBookState, DepreciationEntry
+from src.models.job import Job
 
 __all__ = [
     "Base",
     "Asset",
+    "AssetStat",
     "Category",
+    "CategoryClosure",
     "Location",
+    "LocationClosure",
     "Department",
+    "DepartmentClosure",
     "Vendor",
     "Assignment",
     "MaintenanceRecord",
     "MaintenanceSchedule",
     "Attachment",
     "DepreciationEntry",
+    "AssetBookState",
+    "Job",
 ]
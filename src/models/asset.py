@@ -3,7 +3,8 @@ from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, ForeignKey, Numeric, String, Text
+from sqlalchemy import BigInteger, Computed, Date, ForeignKey, Index, Numeric, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base, TimestampMixin
@@ -29,12 +30,44 @@ class AssetStatus(str, Enum):
 
 class Asset(Base, TimestampMixin):
     __tablename__ = "assets"
+    __table_args__ = (
+        Index("ix_assets_status_id", "status", "id", postgresql_include=["updated_at"]),
+        Index("ix_assets_category_id_id", "category_id", "id", postgresql_include=["updated_at"]),
+        Index("ix_assets_location_id_id", "location_id", "id", postgresql_include=["updated_at"]),
+        Index(
+            "ix_assets_department_id_id", "department_id", "id", postgresql_include=["updated_at"]
+        ),
+        Index("ix_assets_vendor_id", "vendor_id", postgresql_include=["updated_at"]),
+        Index("ix_assets_updated_at", "updated_at"),
+        Index("ix_assets_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_assets_asset_tag_trgm",
+            "asset_tag",
+            postgresql_using="gin",
+            postgresql_ops={"asset_tag": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_assets_serial_number_trgm",
+            "serial_number",
+            postgresql_using="gin",
+            postgresql_ops={"serial_number": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     asset_tag: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
     serial_number: Mapped[str | None] = mapped_column(String(100))
     description: Mapped[str | None] = mapped_column(Text)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
     status: Mapped[AssetStatus] = mapped_column(default=AssetStatus.AVAILABLE)
 
     purchase_date: Mapped[date | None] = mapped_column(Date)
@@ -42,10 +75,14 @@ class Asset(Base, TimestampMixin):
     current_value: Mapped[Decimal | None] = mapped_column(Numeric(12, 2))
     warranty_expiry: Mapped[date | None] = mapped_column(Date)
 
-    category_id: Mapped[int | None] = mapped_column(ForeignKey("categories.id"))
-    location_id: Mapped[int | None] = mapped_column(ForeignKey("locations.id"))
-    department_id: Mapped[int | None] = mapped_column(ForeignKey("departments.id"))
-    vendor_id: Mapped[int | None] = mapped_column(ForeignKey("vendors.id"))
+    category_id: Mapped[int | None] = mapped_column(
+        ForeignKey("categories.id", ondelete="SET NULL")
+    )
+    location_id: Mapped[int | None] = mapped_column(ForeignKey("locations.id", ondelete="SET NULL"))
+    department_id: Mapped[int | None] = mapped_column(
+        ForeignKey("departments.id", ondelete="SET NULL")
+    )
+    vendor_id: Mapped[int | None] = mapped_column(ForeignKey("vendors.id", ondelete="SET NULL"))
 
     category: Mapped["Category | None"] = relationship("Category", back_populates="assets")
     location: Mapped["Location | None"] = relationship("Location", back_populates="assets")
@@ -65,3 +102,15 @@ class Asset(Base, TimestampMixin):
     depreciation_entries: Mapped[list["DepreciationEntry"]] = relationship(
         "DepreciationEntry", back_populates="asset"
     )
+
+
+class AssetStat(Base):
+    # Maintained by statement triggers on assets (see the asset_stats migration);
+    # member_id is 0 under the "all" dimension and for assets without that reference.
+    __tablename__ = "asset_stats"
+
+    dimension: Mapped[str] = mapped_column(String(20), primary_key=True)
+    member_id: Mapped[int] = mapped_column(primary_key=True)
+    status: Mapped[AssetStatus] = mapped_column(primary_key=True)
+    asset_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    total_value: Mapped[Decimal] = mapped_column(Numeric(16, 2), nullable=False)
@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, String, Text, Integer
+from sqlalchemy import ForeignKey, Index, String, Text, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base, TimestampMixin
@@ -27,10 +27,27 @@ class Category(Base, TimestampMixin):
     )
     useful_life_years: Mapped[int | None] = mapped_column(Integer)
     salvage_value_percent: Mapped[int] = mapped_column(Integer, default=0)
-    parent_id: Mapped[int | None] = mapped_column(ForeignKey("categories.id"))
+    parent_id: Mapped[int | None] = mapped_column(ForeignKey("categories.id", ondelete="SET NULL"))
 
     parent: Mapped["Category | None"] = relationship(
         "Category", remote_side=[id], back_populates="children"
     )
-    children: Mapped[list["Category"]] = relationship("Category", back_populates="parent")
-    assets: Mapped[list["Asset"]] = relationship("Asset", back_populates="category")
+    children: Mapped[list["Category"]] = relationship(
+        "Category", back_populates="parent", passive_deletes=True
+    )
+    assets: Mapped[list["Asset"]] = relationship(
+        "Asset", back_populates="category", passive_deletes=True
+    )
+
+
+class CategoryClosure(Base):
+    __tablename__ = "category_closure"
+    __table_args__ = (Index("ix_category_closure_descendant_id", "descendant_id"),)
+
+    ancestor_id: Mapped[int] = mapped_column(
+        ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True
+    )
+    descendant_id: Mapped[int] = mapped_column(
+        ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True
+    )
+    depth: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base, TimestampMixin
@@ -15,10 +15,27 @@ class Department(Base, TimestampMixin):
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     code: Mapped[str | None] = mapped_column(String(20), unique=True)
-    parent_id: Mapped[int | None] = mapped_column(ForeignKey("departments.id"))
+    parent_id: Mapped[int | None] = mapped_column(ForeignKey("departments.id", ondelete="SET NULL"))
 
     parent: Mapped["Department | None"] = relationship(
         "Department", remote_side=[id], back_populates="children"
     )
-    children: Mapped[list["Department"]] = relationship("Department", back_populates="parent")
-    assets: Mapped[list["Asset"]] = relationship("Asset", back_populates="department")
+    children: Mapped[list["Department"]] = relationship(
+        "Department", back_populates="parent", passive_deletes=True
+    )
+    assets: Mapped[list["Asset"]] = relationship(
+        "Asset", back_populates="department", passive_deletes=True
+    )
+
+
+class DepartmentClosure(Base):
+    __tablename__ = "department_closure"
+    __table_args__ = (Index("ix_department_closure_descendant_id", "descendant_id"),)
+
+    ancestor_id: Mapped[int] = mapped_column(
+        ForeignKey("departments.id", ondelete="CASCADE"), primary_key=True
+    )
+    descendant_id: Mapped[int] = mapped_column(
+        ForeignKey("departments.id", ondelete="CASCADE"), primary_key=True
+    )
+    depth: Mapped[int] = mapped_column(Integer, nullable=False)
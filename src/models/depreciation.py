@@ -1,8 +1,8 @@
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, ForeignKey, Numeric
+from sqlalchemy import Date, DateTime, ForeignKey, Index, Numeric, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base, TimestampMixin
@@ -13,6 +13,15 @@ if TYPE_CHECKING:
 
 class DepreciationEntry(Base, TimestampMixin):
     __tablename__ = "depreciation_entries"
+    __table_args__ = (
+        Index(
+            "ix_depreciation_entries_asset_id_period_end",
+            "asset_id",
+            "period_end",
+            "id",
+            postgresql_include=["book_value"],
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     asset_id: Mapped[int] = mapped_column(ForeignKey("assets.id"), nullable=False)
@@ -23,3 +32,20 @@ class DepreciationEntry(Base, TimestampMixin):
     book_value: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
 
     asset: Mapped["Asset"] = relationship("Asset", back_populates="depreciation_entries")
+
+
+class AssetBookState(Base):
+    __tablename__ = "asset_book_states"
+
+    asset_id: Mapped[int] = mapped_column(
+        ForeignKey("assets.id", ondelete="CASCADE"), primary_key=True
+    )
+    last_period_end: Mapped[date] = mapped_column(Date, nullable=False)
+    accumulated_depreciation: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    book_value: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
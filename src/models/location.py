@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base, TimestampMixin
@@ -15,10 +15,28 @@ class Location(Base, TimestampMixin):
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     address: Mapped[str | None] = mapped_column(Text)
-    parent_id: Mapped[int | None] = mapped_column(ForeignKey("locations.id"))
+    parent_id: Mapped[int | None] = mapped_column(ForeignKey("locations.id", ondelete="SET NULL"))
 
     parent: Mapped["Location | None"] = relationship(
         "Location", remote_side=[id], back_populates="children"
     )
-    children: Mapped[list["Location"]] = relationship("Location", back_populates="parent")
-    assets: Mapped[list["Asset"]] = relationship("Asset", back_populates="location")
+    children: Mapped[list["Location"]] = relationship(
+        "Location", back_populates="parent", passive_deletes=True
+    )
+    assets: Mapped[list["Asset"]] = relationship(
+        "Asset", back_populates="location", passive_deletes=True
+    )
+
+
+class LocationClosure(Base):
+    # One row per ancestor/descendant pair, including each node paired with itself.
+    __tablename__ = "location_closure"
+    __table_args__ = (Index("ix_location_closure_descendant_id", "descendant_id"),)
+
+    ancestor_id: Mapped[int] = mapped_column(
+        ForeignKey("locations.id", ondelete="CASCADE"), primary_key=True
+    )
+    descendant_id: Mapped[int] = mapped_column(
+        ForeignKey("locations.id", ondelete="CASCADE"), primary_key=True
+    )
+    depth: Mapped[int] = mapped_column(Integer, nullable=False)
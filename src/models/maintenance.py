@@ -3,7 +3,7 @@ from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, DateTime, ForeignKey, Integer, Numeric, String, Text, func
+from sqlalchemy import Date, DateTime, ForeignKey, Index, Integer, Numeric, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base, TimestampMixin
@@ -21,6 +21,7 @@ class MaintenanceType(str, Enum):
 
 class MaintenanceRecord(Base, TimestampMixin):
     __tablename__ = "maintenance_records"
+    __table_args__ = (Index("ix_maintenance_records_asset_id_id", "asset_id", "id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     asset_id: Mapped[int] = mapped_column(ForeignKey("assets.id"), nullable=False)
@@ -37,6 +38,14 @@ class MaintenanceRecord(Base, TimestampMixin):
 
 class MaintenanceSchedule(Base, TimestampMixin):
     __tablename__ = "maintenance_schedules"
+    __table_args__ = (
+        Index("ix_maintenance_schedules_asset_id", "asset_id"),
+        Index(
+            "ix_maintenance_schedules_active_next_due",
+            "next_due",
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     asset_id: Mapped[int] = mapped_column(ForeignKey("assets.id"), nullable=False)
@@ -20,4 +20,6 @@ class Vendor(Base, TimestampMixin):
     website: Mapped[str | None] = mapped_column(String(255))
     notes: Mapped[str | None] = mapped_column(Text)
 
-    assets: Mapped[list["Asset"]] = relationship("Asset", back_populates="vendor")
+    assets: Mapped[list["Asset"]] = relationship(
+        "Asset", back_populates="vendor", passive_deletes=True
+    )
@@ -1,63 +1,373 @@
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    BigInteger,
+    Row,
+    Select,
+    any_,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    table,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.repositories.pagination import (
+    Page,
+    TotalMode,
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    ordering,
+    sort_key,
+)
+
+ESTIMATE_MIN_ROWS = 100_000
+
 
 class BaseRepository[T]:
     def __init__(self, session: AsyncSession, model: type[T]):
         self.session = session
         self.model = model
 
+    def _filter(self, query: Select, filters: dict[str, Any] | None) -> Select:
+        if filters:
+            for key, value in filters.items():
+                if value is not None and hasattr(self.model, key):
+                    column = getattr(self.model, key)
+                    # A subquery filter matches any of the ids it selects.
+                    if isinstance(value, Select):
+                        query = query.where(column.in_(value))
+                    else:
+                        query = query.where(column == value)
+        return query
+
     async def get(self, id: int) -> T | None:
         return await self.session.get(self.model, id)
 
+    async def get_many(self, ids: Sequence[int]) -> list[T]:
+        query = (
+            select(self.model).where(self._any("id", ids)).execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(query)
+        by_id = {instance.id: instance for instance in result.scalars()}
+        return [by_id[id] for id in ids if id in by_id]
+
+    async def get_many_by(
+        self, key: str, values: Sequence[Any], columns: Sequence[str] | None = None
+    ) -> dict[Any, T | Row]:
+        # Keyed by a unique column; rows (or entities without columns) come back by value.
+        if columns:
+            names = dict.fromkeys((key, *columns))
+            query = select(*[self._column(name) for name in names]).where(self._any(key, values))
+            result = await self.session.execute(query)
+            return {row._mapping[key]: row for row in result}
+        result = await self.session.scalars(select(self.model).where(self._any(key, values)))
+        return {getattr(instance, key): instance for instance in result}
+
     async def get_all(
         self,
         skip: int = 0,
         limit: int = 100,
         filters: dict[str, Any] | None = None,
     ) -> list[T]:
-        query = select(self.model)
-        if filters:
-            for key, value in filters.items():
-                if value is not None and hasattr(self.model, key):
-                    query = query.where(getattr(self.model, key) == value)
-        query = query.offset(skip).limit(limit)
+        query = self._filter(select(self.model), filters)
+        query = query.order_by(self.model.id).offset(skip).limit(limit)
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def paginate(
+        self,
+        limit: int,
+        skip: int = 0,
+        cursor: str | None = None,
+        sort: str | None = None,
+        filters: dict[str, Any] | None = None,
+        total: TotalMode = TotalMode.EXACT,
+        columns: Sequence[str] | None = None,
+        version: bool = False,
+    ) -> Page[T] | Page[Row]:
+        key = sort_key(self.model, sort)
+        filtered = any(
+            value is not None and hasattr(self.model, name)
+            for name, value in (filters or {}).items()
+        )
+        if total == TotalMode.ESTIMATE and filtered:
+            total = TotalMode.EXACT
+
+        if columns:
+            # Projected rows keep id and the sort column so the cursor can be built.
+            names = [*columns, "id", *([key.column.key] if key else [])]
+            selected = [self._column(name) for name in dict.fromkeys(names)]
+        else:
+            selected = [self.model]
+
+        # The total (and the version, when asked for) ride along as uncorrelated scalar
+        # subqueries, which PostgreSQL evaluates once per statement, so the page and its
+        # total share a round-trip and a snapshot.
+        count_query = self._filter(select(func.count()).select_from(self.model), filters)
+        extras = []
+        if total == TotalMode.EXACT:
+            extras.append(count_query.scalar_subquery())
+        elif total == TotalMode.ESTIMATE:
+            extras.append(self._estimated_count())
+        if version:
+            if total != TotalMode.EXACT:
+                extras.append(count_query.scalar_subquery())
+            latest = self._filter(select(func.max(self.model.updated_at)), filters)
+            extras.append(latest.scalar_subquery())
+        query = select(*selected, *extras)
+
+        query = self._filter(query, filters)
+        if cursor:
+            query = query.where(
+                keyset_after(key, self.model.id, decode_cursor(cursor, key, self.model.id))
+            )
+        else:
+            query = query.offset(skip)
+        query = query.order_by(*ordering(key, self.model.id)).limit(limit + 1)
+
+        result = await self.session.execute(query)
+        rows = result.all()
+        items = list(rows) if columns else [row[0] for row in rows]
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            values = [getattr(last, key.column.key), last.id] if key else [last.id]
+            next_cursor = encode_cursor(key, values)
+
+        tail = tuple(rows[0][len(rows[0]) - len(extras) :]) if rows else None
+        page_version = None
+        if version:
+            page_version = (tail[-2], tail[-1]) if tail else await self.version(filters)
+
+        if total == TotalMode.NONE:
+            return Page(
+                items=items,
+                total=None,
+                total_exact=False,
+                next_cursor=next_cursor,
+                version=page_version,
+            )
+
+        count = tail[0] if tail else None
+        if total == TotalMode.ESTIMATE:
+            if count is None:
+                count = await self.session.scalar(self._estimated_count())
+            if count is not None and count >= ESTIMATE_MIN_ROWS:
+                return Page(
+                    items=items,
+                    total=count,
+                    total_exact=False,
+                    next_cursor=next_cursor,
+                    version=page_version,
+                )
+            count = None
+        if count is None and page_version:
+            count = page_version[0]
+        if count is None:
+            count = await self.count(filters=filters)
+        return Page(items=items, total=count, next_cursor=next_cursor, version=page_version)
+
+    async def get_columns(self, id: int, columns: Sequence[str]) -> Row | None:
+        names = dict.fromkeys(columns)
+        query = select(*[self._column(name) for name in names]).where(self.model.id == id)
+        result = await self.session.execute(query)
+        return result.first()
+
+    async def stream(
+        self,
+        columns: Sequence[str],
+        filters: dict[str, Any] | None = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Row]]:
+        query = self._filter(select(*[self._column(name) for name in columns]), filters)
+        query = query.order_by(self.model.id).execution_options(yield_per=chunk_size)
+        result = await self.session.stream(query)
+        async for rows in result.partitions():
+            yield rows
+
+    def _column(self, name: str):
+        if name not in self.model.__mapper__.columns:
+            raise ValueError(f"{self.model.__name__} has no column {name!r}")
+        return getattr(self.model, name).label(name)
+
+    def _any(self, name: str, values: Sequence[Any]):
+        # "= ANY(array)" binds one parameter however many values there are, where IN would
+        # render one per value and make every batch size a distinct statement to prepare.
+        attribute = getattr(self.model, name)
+        return attribute == any_(literal(list(values), ARRAY(attribute.type)))
+
+    def _estimated_count(self):
+        pg_class = table("pg_class", column("oid"), column("reltuples"))
+        return (
+            select(cast(pg_class.c.reltuples, BigInteger))
+            .where(pg_class.c.oid == func.to_regclass(self.model.__tablename__))
+            .scalar_subquery()
+        )
+
+    async def version(self, filters: dict[str, Any] | None = None) -> tuple[int, datetime | None]:
+        # Two scalar subqueries, so max(updated_at) can be read off its index on its own.
+        count = self._filter(select(func.count()).select_from(self.model), filters)
+        latest = self._filter(select(func.max(self.model.updated_at)), filters)
+        result = await self.session.execute(
+            select(count.scalar_subquery(), latest.scalar_subquery())
+        )
+        return tuple(result.one())
+
+    async def facets(
+        self, names: Sequence[str], filters: dict[str, Any] | None = None
+    ) -> dict[str, list[tuple[Any, int]]]:
+        for name in names:
+            self._column(name)
+        columns = [getattr(self.model, name) for name in names]
+        query = select(
+            *columns, *[func.grouping(attribute) for attribute in columns], func.count()
+        ).group_by(func.grouping_sets(*columns))
+        result = await self.session.execute(self._filter(query, filters))
+
+        facets: dict[str, list[tuple[Any, int]]] = {name: [] for name in names}
+        for row in result:
+            # Each grouping set groups by one column; grouping() is 0 for that one.
+            index = row[len(names) : 2 * len(names)].index(0)
+            facets[names[index]].append((row[index], row[-1]))
+        for counts in facets.values():
+            counts.sort(key=lambda count: -count[1])
+        return facets
+
     async def count(self, filters: dict[str, Any] | None = None) -> int:
-        query = select(func.count()).select_from(self.model)
-        if filters:
-            for key, value in filters.items():
-                if value is not None and hasattr(self.model, key):
-                    query = query.where(getattr(self.model, key) == value)
+        query = self._filter(select(func.count()).select_from(self.model), filters)
         result = await self.session.execute(query)
         return result.scalar() or 0
 
+    # Single-row writes are one statement each, with RETURNING handing back the row as the
+    # database left it (defaults, updated_at), instead of a flush followed by a refresh.
     async def create(self, data: dict[str, Any]) -> T:
-        instance = self.model(**data)
-        self.session.add(instance)
-        await self.session.flush()
-        await self.session.refresh(instance)
-        return instance
+        query = insert(self.model).values(**data).returning(self.model)
+        return await self.session.scalar(query.execution_options(written_ids=()))
 
     async def update(self, id: int, data: dict[str, Any]) -> T | None:
-        instance = await self.get(id)
-        if not instance:
-            return None
-        for key, value in data.items():
-            if value is not None:
-                setattr(instance, key, value)
-        await self.session.flush()
-        await self.session.refresh(instance)
-        return instance
+        values = {key: value for key, value in data.items() if value is not None}
+        if not values:
+            return await self.get(id)
+        query = (
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(written_ids=(id,), populate_existing=True)
+        )
+        return await self.session.scalar(query)
 
     async def delete(self, id: int) -> bool:
-        instance = await self.get(id)
-        if not instance:
-            return False
-        await self.session.delete(instance)
-        await self.session.flush()
-        return True
+        query = (
+            delete(self.model)
+            .where(self.model.id == id)
+            .returning(self.model.id)
+            .execution_options(written_ids=(id,))
+        )
+        return await self.session.scalar(query) is not None
+
+    async def create_many(self, rows: Sequence[dict[str, Any]]) -> list[T]:
+        if not rows:
+            return []
+        # Multi-row INSERT ... RETURNING, batched by SQLAlchemy's insertmanyvalues.
+        query = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = await self.session.scalars(query.execution_options(written_ids=()), list(rows))
+        return list(result.all())
+
+    async def update_many(self, rows: Sequence[dict[str, Any]]) -> list[T]:
+        # Like update(), None means "leave unchanged"; rows are matched on their id.
+        values = [{key: value for key, value in row.items() if value is not None} for row in rows]
+        changed = [row for row in values if len(row) > 1]
+        if changed:
+            written = [row["id"] for row in changed]
+            await self.session.execute(
+                update(self.model).execution_options(written_ids=written), changed
+            )
+        return await self.get_many([row["id"] for row in rows])
+
+    async def delete_many(self, ids: Sequence[int]) -> list[int]:
+        if not ids:
+            return []
+        query = (
+            delete(self.model)
+            .where(self._any("id", ids))
+            .returning(self.model.id)
+            .execution_options(written_ids=ids)
+        )
+        result = await self.session.scalars(query)
+        return list(result.all())
+
+    async def validate_many(self, rows: dict[int, dict[str, Any]]) -> dict[int, str]:
+        # Rows are keyed by their position in the batch and carry an id when they update
+        # an existing row; the result maps failing positions to an error message.
+        errors: dict[int, str] = {}
+        table = self.model.__table__
+        name = self.model.__name__
+
+        ids = {row["id"] for row in rows.values() if row.get("id") is not None}
+        if ids:
+            result = await self.session.scalars(select(table.c.id).where(table.c.id.in_(ids)))
+            found = set(result.all())
+            for index, row in rows.items():
+                if row.get("id") is not None and row["id"] not in found:
+                    errors.setdefault(index, f"{name} not found")
+
+        for table_column in table.columns:
+            if table_column.unique:
+                first: dict[Any, int] = {}
+                for index, row in rows.items():
+                    value = row.get(table_column.key)
+                    if value is None:
+                        continue
+                    if value in first:
+                        errors.setdefault(index, f"Duplicate {table_column.key} {value!r} in batch")
+                    else:
+                        first[value] = index
+                if first:
+                    query = select(table_column, table.c.id).where(table_column.in_(list(first)))
+                    for value, existing_id in (await self.session.execute(query)).all():
+                        index = first[value]
+                        if rows[index].get("id") != existing_id:
+                            errors.setdefault(index, f"{table_column.key} {value!r} already exists")
+
+            for foreign_key in table_column.foreign_keys:
+                wanted = {
+                    row[table_column.key]
+                    for row in rows.values()
+                    if row.get(table_column.key) is not None
+                }
+                if not wanted:
+                    continue
+                target = foreign_key.column
+                result = await self.session.scalars(select(target).where(target.in_(wanted)))
+                found = set(result.all())
+                for index, row in rows.items():
+                    value = row.get(table_column.key)
+                    if value is not None and value not in found:
+                        errors.setdefault(index, f"{table_column.key} {value} does not exist")
+        return errors
+
+    async def referenced_ids(self, ids: Sequence[int]) -> set[int]:
+        # Rows that other tables still point at without ON DELETE CASCADE cannot be deleted.
+        referenced: set[int] = set()
+        for other in self.model.metadata.tables.values():
+            for foreign_key in other.foreign_keys:
+                if (
+                    foreign_key.column is self.model.__table__.c.id
+                    and (foreign_key.ondelete or "").upper() != "CASCADE"
+                ):
+                    parent = foreign_key.parent
+                    query = select(parent).where(parent.in_(ids)).distinct()
+                    referenced.update((await self.session.scalars(query)).all())
+        return referenced
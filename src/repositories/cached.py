@@ -0,0 +1,123 @@
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.core.cache import TableCache, reference_cache
+from src.repositories.base import BaseRepository
+from src.repositories.pagination import Page, TotalMode
+
+
+# Reads of small, rarely written tables are served from an in-process cache. Entities
+# are cached as column values, never as instances, and merged back into the caller's
+# session without a query; the cache drops them when a write to the table commits.
+class CachedRepository[T](BaseRepository[T]):
+    def __init__(self, session: AsyncSession, model: type[T], cache: TableCache = reference_cache):
+        super().__init__(session, model)
+        self.cache = cache
+        self.table = model.__tablename__
+
+    def _cacheable(self) -> bool:
+        # Until this transaction commits, its own writes are not reflected in the cache.
+        return self.table not in self.session.sync_session.info.get("written_tables", ())
+
+    def _snapshot(self, instance: T) -> dict[str, Any]:
+        state = instance.__dict__
+        return {
+            attr.key: state[attr.key]
+            for attr in self.model.__mapper__.column_attrs
+            if attr.key in state
+        }
+
+    async def _restore(self, values: dict[str, Any]) -> T:
+        instance = self.model(**values)
+        make_transient_to_detached(instance)
+        return await self.session.merge(instance, load=False)
+
+    async def _cached(
+        self, key: Hashable, load: Callable[[], Awaitable[Any]], id: int | None = None
+    ) -> Any:
+        if not self._cacheable():
+            return await load()
+        value = self.cache.get((self.table, *key))
+        if value is not None:
+            return value
+        generation = self.cache.generation([self.table])
+        value = await load()
+        if value is not None:
+            self.cache.set((self.table, *key), value, [self.table], generation, id)
+        return value
+
+    async def get(self, id: int) -> T | None:
+        async def load():
+            instance = await super(CachedRepository, self).get(id)
+            return self._snapshot(instance) if instance else None
+
+        values = await self._cached(("get", id), load, id)
+        return await self._restore(values) if values else None
+
+    async def get_columns(self, id: int, columns: Sequence[str]) -> Row | None:
+        row = await self._cached(
+            ("columns", id, tuple(columns)),
+            lambda: super(CachedRepository, self).get_columns(id, columns),
+            id,
+        )
+        return row
+
+    async def all(self) -> list[T]:
+        async def load():
+            result = await self.session.scalars(select(self.model).order_by(self.model.id))
+            return [self._snapshot(instance) for instance in result]
+
+        rows = await self._cached(("all",), load)
+        return [await self._restore(values) for values in rows]
+
+    async def version(self, filters: dict[str, Any] | None = None) -> tuple[int, datetime | None]:
+        return await self._cached(
+            ("version", tuple(sorted((filters or {}).items()))),
+            lambda: super(CachedRepository, self).version(filters),
+        )
+
+    async def paginate(
+        self,
+        limit: int,
+        skip: int = 0,
+        cursor: str | None = None,
+        sort: str | None = None,
+        filters: dict[str, Any] | None = None,
+        total: TotalMode = TotalMode.EXACT,
+        columns: Sequence[str] | None = None,
+        version: bool = False,
+    ) -> Page[T] | Page[Row]:
+        async def load():
+            page = await super(CachedRepository, self).paginate(
+                limit, skip, cursor, sort, filters, total, columns, version
+            )
+            if not columns:
+                page.items = [self._snapshot(instance) for instance in page.items]
+            return page
+
+        key = (
+            "paginate",
+            limit,
+            skip,
+            cursor,
+            sort,
+            tuple(sorted((filters or {}).items())),
+            total,
+            tuple(columns) if columns else None,
+            version,
+        )
+        page = await self._cached(key, load)
+        if columns:
+            return page
+        return Page(
+            items=[await self._restore(values) for values in page.items],
+            total=page.total,
+            total_exact=page.total_exact,
+            next_cursor=page.next_cursor,
+            version=page.version,
+        )
@@ -0,0 +1,94 @@
+from typing import Any
+
+from sqlalchemy import Select, delete, exists, insert, literal, select, text, true, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repositories.base import BaseRepository
+
+
+def subtree(closure: type, id: int) -> Select:
+    return select(closure.descendant_id).where(closure.ancestor_id == id)
+
+
+# Keeps a closure table in step with the model's parent_id so subtrees can be read with
+# one indexed lookup instead of a recursive walk.
+class HierarchyRepository[T](BaseRepository[T]):
+    def __init__(self, session: AsyncSession, model: type[T], closure: type):
+        super().__init__(session, model)
+        self.closure = closure
+
+    async def create(self, data: dict[str, Any]) -> T:
+        await self._lock()
+        instance = await super().create(data)
+        closure = self.closure
+        paths = select(literal(instance.id), literal(instance.id), literal(0))
+        if instance.parent_id is not None:
+            paths = union_all(
+                paths,
+                select(closure.ancestor_id, literal(instance.id), closure.depth + 1).where(
+                    closure.descendant_id == instance.parent_id
+                ),
+            )
+        await self.session.execute(
+            insert(closure).from_select(["ancestor_id", "descendant_id", "depth"], paths)
+        )
+        return instance
+
+    async def update(self, id: int, data: dict[str, Any]) -> T | None:
+        parent_id = data.get("parent_id")
+        if parent_id is None:
+            return await super().update(id, data)
+        instance = await self.get(id)
+        if not instance or parent_id == instance.parent_id:
+            return await super().update(id, data)
+
+        await self._lock()
+        closure = self.closure
+        inside = await self.session.scalar(
+            select(exists().where(closure.ancestor_id == id, closure.descendant_id == parent_id))
+        )
+        if inside:
+            raise ValueError(f"{self.model.__name__} cannot be moved under its own subtree")
+        instance = await super().update(id, data)
+
+        # Detach the subtree from its old ancestors, then hang it under the new parent's.
+        nodes = subtree(closure, id)
+        await self.session.execute(
+            delete(closure).where(
+                closure.descendant_id.in_(nodes), closure.ancestor_id.not_in(nodes)
+            )
+        )
+        above = closure.__table__.alias("above")
+        below = closure.__table__.alias("below")
+        await self.session.execute(
+            insert(closure).from_select(
+                ["ancestor_id", "descendant_id", "depth"],
+                select(
+                    above.c.ancestor_id,
+                    below.c.descendant_id,
+                    above.c.depth + below.c.depth + 1,
+                )
+                .select_from(above.join(below, true()))
+                .where(above.c.descendant_id == parent_id, below.c.ancestor_id == id),
+            )
+        )
+        return instance
+
+    async def delete(self, id: int) -> bool:
+        await self._lock()
+        # The node's own rows go with it through the foreign keys; its children become
+        # roots, so their subtrees are cut loose from the node's ancestors too.
+        nodes = subtree(self.closure, id)
+        await self.session.execute(
+            delete(self.closure).where(
+                self.closure.descendant_id.in_(nodes), self.closure.ancestor_id.not_in(nodes)
+            )
+        )
+        return await super().delete(id)
+
+    async def _lock(self) -> None:
+        # Moves read and rewrite whole subtrees; serialize them against each other and
+        # against inserts so two concurrent reparents cannot form a cycle.
+        await self.session.execute(
+            text(f"LOCK TABLE {self.closure.__tablename__} IN SHARE ROW EXCLUSIVE MODE")
+        )
@@ -0,0 +1,120 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import ColumnElement, and_, literal, or_, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+class PaginationError(ValueError):
+    pass
+
+
+class TotalMode(str, Enum):
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+
+@dataclass
+class Page[T]:
+    items: list[T]
+    total: int | None
+    total_exact: bool = True
+    next_cursor: str | None = None
+    # (count, max(updated_at)) under the page's filters, read in the same statement.
+    version: tuple[int, datetime | None] | None = None
+
+
+@dataclass
+class SortKey:
+    column: InstrumentedAttribute
+    descending: bool = False
+
+    @property
+    def name(self) -> str:
+        return ("-" if self.descending else "") + self.column.key
+
+
+def sort_key(model: type, sort: str | None) -> SortKey | None:
+    if not sort:
+        return None
+    descending = sort.startswith("-")
+    name = sort.removeprefix("-")
+    if name not in model.__table__.columns:
+        raise PaginationError(f"Cannot sort by {name!r}")
+    return SortKey(getattr(model, name), descending)
+
+
+def encode_cursor(key: SortKey | None, values: list[Any]) -> str:
+    payload = json.dumps(
+        {"s": key.name if key else None, "v": values}, default=str, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key: SortKey | None, id_column: InstrumentedAttribute) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        sort, values = payload["s"], payload["v"]
+    except (binascii.Error, ValueError, KeyError, TypeError) as exc:
+        raise PaginationError("Invalid cursor") from exc
+
+    if sort != (key.name if key else None):
+        raise PaginationError("Cursor does not match the requested sort order")
+
+    columns = [key.column, id_column] if key else [id_column]
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise PaginationError("Invalid cursor")
+    try:
+        return [_coerce(column, value) for column, value in zip(columns, values, strict=True)]
+    except (TypeError, ValueError) as exc:
+        raise PaginationError("Invalid cursor") from exc
+
+
+def _coerce(column: InstrumentedAttribute, value: Any) -> Any:
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if isinstance(value, python_type):
+        return value
+    if python_type in (date, datetime):
+        return python_type.fromisoformat(value)
+    return python_type(value)
+
+
+def keyset_after(
+    key: SortKey | None, id_column: InstrumentedAttribute, values: list
+) -> ColumnElement[bool]:
+    if key is None:
+        return id_column > values[0]
+
+    value, last_id = values
+    column = key.column
+    if not column.nullable:
+        bound = tuple_(literal(value, column.type), literal(last_id, id_column.type))
+        if key.descending:
+            return tuple_(column, id_column) < bound
+        return tuple_(column, id_column) > bound
+
+    # PostgreSQL sorts NULLs last ascending and first descending.
+    if key.descending:
+        if value is None:
+            return or_(and_(column.is_(None), id_column < last_id), column.isnot(None))
+        return or_(column < value, and_(column == value, id_column < last_id))
+    if value is None:
+        return and_(column.is_(None), id_column > last_id)
+    return or_(column > value, and_(column == value, id_column > last_id), column.is_(None))
+
+
+def ordering(key: SortKey | None, id_column: InstrumentedAttribute) -> list:
+    if key is None:
+        return [id_column]
+    if key.descending:
+        return [key.column.desc(), id_column.desc()]
+    return [key.column, id_column]
@@ -0,0 +1,45 @@
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import ColumnElement, Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@dataclass(frozen=True)
+class Relation:
+    model: type
+    # Column on the parent row, matched against `remote` on the related model.
+    local: str
+    remote: str = "id"
+    where: tuple[ColumnElement[bool], ...] = field(default=())
+    # When several rows match one key, the last in this order wins.
+    order_by: tuple[ColumnElement, ...] = field(default=())
+
+
+async def load_related(
+    session: AsyncSession,
+    rows: Sequence[Row | Mapping[str, Any]],
+    relations: Mapping[str, Relation],
+) -> dict[str, dict[Any, Any]]:
+    # One IN query per relation, however many rows there are; the selectinload strategy
+    # applied to column rows.
+    related = {}
+    for name, relation in relations.items():
+        keys = {row[relation.local] for row in map(_mapping, rows)} - {None}
+        loaded: dict[Any, Any] = {}
+        if keys:
+            remote = getattr(relation.model, relation.remote)
+            query = (
+                select(relation.model)
+                .where(remote.in_(keys), *relation.where)
+                .order_by(*relation.order_by)
+            )
+            for instance in await session.scalars(query):
+                loaded[getattr(instance, relation.remote)] = instance
+        related[name] = loaded
+    return related
+
+
+def _mapping(row: Row | Mapping[str, Any]) -> Mapping[str, Any]:
+    return row._mapping if isinstance(row, Row) else row
@@ -1,9 +1,18 @@
 from datetime import date, datetime
 from decimal import Decimal
+from typing import Annotated, Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from src.models.asset import AssetStatus
+from src.schemas.assignment import AssignmentResponse
+from src.schemas.category import CategoryResponse
+from src.schemas.common import MAX_BATCH_GET_SIZE, BatchMode
+from src.schemas.department import DepartmentResponse
+from src.schemas.location import LocationResponse
+from src.schemas.vendor import VendorResponse
+
+MAX_BATCH_SIZE = 5000
 
 
 class AssetBase(BaseModel):
@@ -41,6 +50,33 @@ class AssetUpdate(BaseModel):
     vendor_id: int | None = None
 
 
+class AssetBatchUpdateItem(AssetUpdate):
+    id: int
+
+
+class AssetBatchCreate(BaseModel):
+    # Items are validated one by one so a bad row can be reported instead of failing the body.
+    items: Annotated[list[dict[str, Any]], Field(min_length=1, max_length=MAX_BATCH_SIZE)]
+    mode: BatchMode = BatchMode.ATOMIC
+
+
+class AssetBatchUpdate(AssetBatchCreate):
+    pass
+
+
+class AssetBatchDelete(BaseModel):
+    ids: Annotated[list[int], Field(min_length=1, max_length=MAX_BATCH_SIZE)]
+    mode: BatchMode = BatchMode.ATOMIC
+
+
+class AssetBatchGet(BaseModel):
+    # Exactly one of the two is given.
+    ids: Annotated[list[int] | None, Field(min_length=1, max_length=MAX_BATCH_GET_SIZE)] = None
+    asset_tags: Annotated[list[str] | None, Field(min_length=1, max_length=MAX_BATCH_GET_SIZE)] = (
+        None
+    )
+
+
 class AssetResponse(AssetBase):
     id: int
     current_value: Decimal | None
@@ -50,6 +86,18 @@ class AssetResponse(AssetBase):
     model_config = {"from_attributes": True}
 
 
+class AssetExpanded(AssetResponse):
+    category: CategoryResponse | None = None
+    location: LocationResponse | None = None
+    department: DepartmentResponse | None = None
+    vendor: VendorResponse | None = None
+    current_assignment: AssignmentResponse | None = None
+
+
+class AssetSearchResult(AssetResponse):
+    rank: float
+
+
 class AssetAssign(BaseModel):
     assignee_id: str
     assignee_name: str | None = None
@@ -0,0 +1,25 @@
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class ImportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class ImportRowError(BaseModel):
+    line: int
+    asset_tag: str | None = None
+    detail: str
+
+
+class AssetImportResult(BaseModel):
+    format: ImportFormat
+    dry_run: bool = False
+    processed: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: list[ImportRowError] = []
+    errors_truncated: bool = False
+    duration_ms: float = 0
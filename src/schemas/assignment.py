@@ -0,0 +1,15 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class AssignmentResponse(BaseModel):
+    id: int
+    asset_id: int
+    assignee_id: str
+    assignee_name: str | None
+    assigned_at: datetime
+    returned_at: datetime | None
+    notes: str | None
+
+    model_config = {"from_attributes": True}
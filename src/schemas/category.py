@@ -33,3 +33,9 @@ class CategoryResponse(CategoryBase):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class CategoryTreeNode(CategoryResponse):
+    asset_count: int | None = None
+    subtree_asset_count: int | None = None
+    children: list["CategoryTreeNode"] = []
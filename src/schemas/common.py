@@ -1,9 +1,53 @@
-from pydantic import BaseModel
+from enum import Enum
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+MAX_BATCH_GET_SIZE = 5000
 
 
 class PaginatedResponse[T](BaseModel):
     items: list[T]
-    total: int
+    total: int | None
+    total_exact: bool = True
     page: int
     page_size: int
-    pages: int
+    pages: int | None
+    next_cursor: str | None = None
+
+
+class FacetCount(BaseModel):
+    value: str | int | None
+    count: int
+
+
+class FacetedPage[T](PaginatedResponse[T]):
+    facets: dict[str, list[FacetCount]] | None = None
+
+
+class BatchMode(str, Enum):
+    ATOMIC = "atomic"
+    PARTIAL = "partial"
+
+
+class BatchError(BaseModel):
+    index: int
+    id: int | None = None
+    detail: str
+
+
+class BatchResponse[T](BaseModel):
+    mode: BatchMode
+    succeeded: int
+    failed: int
+    items: list[T]
+    errors: list[BatchError]
+
+
+class BatchGetRequest(BaseModel):
+    ids: Annotated[list[int], Field(min_length=1, max_length=MAX_BATCH_GET_SIZE)]
+
+
+class BatchGetResponse[T](BaseModel):
+    items: list[T]
+    missing: list[int | str]
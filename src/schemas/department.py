@@ -25,3 +25,9 @@ class DepartmentResponse(DepartmentBase):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class DepartmentTreeNode(DepartmentResponse):
+    asset_count: int | None = None
+    subtree_asset_count: int | None = None
+    children: list["DepartmentTreeNode"] = []
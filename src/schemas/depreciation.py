@@ -1,5 +1,6 @@
 from datetime import date
 from decimal import Decimal
+from enum import Enum
 
 from pydantic import BaseModel
 
@@ -28,6 +29,70 @@ class DepreciationSummary(BaseModel):
     useful_life_years: int | None
 
 
+class DepreciationReportGrouping(str, Enum):
+    CATEGORY = "category"
+    DEPARTMENT = "department"
+    LOCATION = "location"
+    DEPRECIATION_METHOD = "depreciation_method"
+
+
+class DepreciationGroupSummary(BaseModel):
+    group_id: int | None = None
+    group_name: str | None = None
+    asset_count: int
+    total_purchase_price: Decimal
+    total_book_value: Decimal
+    total_depreciation: Decimal
+
+
+class DepreciationReportSummary(BaseModel):
+    group_by: DepreciationReportGrouping
+    groups: list[DepreciationGroupSummary]
+    total: DepreciationGroupSummary
+
+
+class ForecastPeriod(BaseModel):
+    period_start: date
+    period_end: date
+    depreciation: Decimal
+    book_value: Decimal
+
+
+class ForecastGroup(BaseModel):
+    group_id: int | None = None
+    group_name: str | None = None
+    asset_count: int
+    opening_book_value: Decimal
+    periods: list[ForecastPeriod]
+
+
+class DepreciationForecast(BaseModel):
+    start: date
+    months: int
+    group_by: DepreciationReportGrouping
+    groups: list[ForecastGroup]
+    total: ForecastGroup
+    duration_ms: float
+
+
 class DepreciationCalculation(BaseModel):
     period_start: date
     period_end: date
+
+
+class DepreciationRun(BaseModel):
+    period_start: date
+    period_end: date
+    category_id: int | None = None
+    department_id: int | None = None
+    location_id: int | None = None
+
+
+class DepreciationRunResult(BaseModel):
+    period_start: date
+    period_end: date
+    posted: int = 0
+    skipped: int = 0
+    fully_depreciated: int = 0
+    total_depreciation: Decimal = Decimal("0")
+    duration_ms: float = 0
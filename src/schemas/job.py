@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+from src.models.job import JobStatus
+
+
+class JobResponse(BaseModel):
+    id: int
+    kind: str
+    status: JobStatus
+    params: dict[str, Any]
+    result: dict[str, Any] | None
+    error: str | None
+    progress_current: int
+    progress_total: int | None
+    cancel_requested: bool
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+
+    model_config = {"from_attributes": True}
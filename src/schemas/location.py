@@ -25,3 +25,9 @@ class LocationResponse(LocationBase):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class LocationTreeNode(LocationResponse):
+    asset_count: int | None = None
+    subtree_asset_count: int | None = None
+    children: list["LocationTreeNode"] = []
@@ -0,0 +1,27 @@
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+from src.models.asset import AssetStatus
+
+
+class StatusStats(BaseModel):
+    status: AssetStatus
+    asset_count: int
+    total_value: Decimal
+
+
+class GroupStats(BaseModel):
+    group_id: int | None
+    group_name: str | None
+    asset_count: int
+    total_value: Decimal
+
+
+class StatsOverview(BaseModel):
+    asset_count: int
+    total_value: Decimal
+    by_status: list[StatusStats]
+    by_category: list[GroupStats]
+    by_location: list[GroupStats]
+    by_department: list[GroupStats]
@@ -0,0 +1,35 @@
+from datetime import date
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+
+class AssetValuation(BaseModel):
+    asset_id: int
+    asset_name: str
+    asset_tag: str
+    category_id: int | None
+    department_id: int | None
+    location_id: int | None
+    purchase_date: date | None
+    purchase_price: Decimal
+    book_value: Decimal
+    valued_through: date | None
+
+
+class ValuationGroup(BaseModel):
+    group_id: int | None
+    group_name: str | None
+    asset_count: int
+    total_purchase_price: Decimal
+    total_book_value: Decimal
+
+
+class ValuationReport(BaseModel):
+    as_of: date
+    asset_count: int
+    total_purchase_price: Decimal
+    total_book_value: Decimal
+    by_category: list[ValuationGroup]
+    by_department: list[ValuationGroup]
+    by_location: list[ValuationGroup]
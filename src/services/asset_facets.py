@@ -0,0 +1,53 @@
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import facet_cache
+from src.models.asset import Asset
+from src.repositories.base import BaseRepository
+from src.schemas.common import FacetCount
+
+ASSET_FACETS = ("status", "category_id", "location_id", "department_id")
+
+
+def _signature(filters: dict[str, Any]) -> tuple[tuple[str, Any], ...]:
+    # Subtree filters are subqueries; their SQL with the root id inlined identifies them.
+    return tuple(
+        (
+            name,
+            str(value.compile(compile_kwargs={"literal_binds": True}))
+            if isinstance(value, Select)
+            else value,
+        )
+        for name, value in sorted(filters.items())
+        if value is not None
+    )
+
+
+async def asset_facets(
+    db: AsyncSession, filters: dict[str, Any] | None = None
+) -> dict[str, list[FacetCount]]:
+    filters = filters or {}
+    key = _signature(filters)
+    facets = facet_cache.get(key)
+    if facets is not None:
+        return facets
+
+    tables = {Asset.__tablename__}
+    for value in filters.values():
+        if isinstance(value, Select):
+            tables.update(table.name for table in value.get_final_froms())
+    generation = facet_cache.generation(tables)
+
+    counts = await BaseRepository(db, Asset).facets(ASSET_FACETS, filters)
+    facets = {
+        name: [
+            FacetCount(value=value.value if isinstance(value, Enum) else value, count=count)
+            for value, count in values
+        ]
+        for name, values in counts.items()
+    }
+    facet_cache.set(key, facets, tables, generation)
+    return facets
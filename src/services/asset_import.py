@@ -0,0 +1,347 @@
+import codecs
+import csv
+import json
+import time
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import (
+    Column,
+    Date,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    Text,
+    cast,
+    delete,
+    exists,
+    func,
+    insert,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.asset import Asset
+from src.models.category import Category
+from src.models.department import Department
+from src.models.location import Location
+from src.models.vendor import Vendor
+from src.repositories.cached import CachedRepository
+from src.schemas.asset import AssetCreate
+from src.schemas.asset_import import AssetImportResult, ImportFormat, ImportRowError
+
+IMPORT_BATCH_SIZE = 5000
+IMPORT_ERROR_LIMIT = 1000
+
+_LOOKUPS = {
+    "category": Category,
+    "location": Location,
+    "department": Department,
+    "vendor": Vendor,
+}
+
+_staging = Table(
+    "asset_import_staging",
+    MetaData(),
+    Column("line", Integer, primary_key=True),
+    Column("name", String(200), nullable=False),
+    Column("asset_tag", String(50), nullable=False),
+    Column("serial_number", String(100)),
+    Column("description", Text),
+    Column("status", String(20), nullable=False),
+    Column("purchase_date", Date),
+    Column("purchase_price", Numeric(12, 2)),
+    Column("current_value", Numeric(12, 2)),
+    Column("warranty_expiry", Date),
+    Column("category_id", Integer),
+    Column("location_id", Integer),
+    Column("department_id", Integer),
+    Column("vendor_id", Integer),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+_COPY_COLUMNS = [column.name for column in _staging.columns]
+_ASSET_COLUMNS = _COPY_COLUMNS[1:]
+
+_assets_adapter = TypeAdapter(list[AssetCreate])
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        lines = pending.splitlines(keepends=True)
+        # A trailing "\r" may be the first half of a "\r\n" split across chunks.
+        pending = lines.pop() if lines and not lines[-1].endswith("\n") else ""
+        for line in lines:
+            yield line
+    pending += decoder.decode(b"", final=True)
+    for line in pending.splitlines(keepends=True):
+        yield line
+
+
+async def _csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, Any]]:
+    header = None
+    record, start = "", 0
+    line_number = 0
+    async for line in _lines(chunks):
+        line_number += 1
+        if not record:
+            start = line_number
+        record += line
+        # A quoted field may span lines; a record is complete once its quotes balance.
+        if record.count('"') % 2:
+            continue
+        text, record = record, ""
+        if not text.strip():
+            continue
+        fields = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in fields]
+            continue
+        if len(fields) > len(header):
+            yield start, f"Expected {len(header)} columns, found {len(fields)}"
+            continue
+        yield start, dict(zip(header, fields, strict=False))
+    if record:
+        yield start, "Unterminated quoted field"
+
+
+async def _ndjson_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, Any]]:
+    line_number = 0
+    async for line in _lines(chunks):
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            value = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield line_number, f"Invalid JSON: {exc.msg}"
+            continue
+        if not isinstance(value, dict):
+            yield line_number, "Expected a JSON object"
+            continue
+        yield line_number, value
+
+
+async def _load_lookups(db: AsyncSession) -> dict[str, dict[str, int]]:
+    lookups = {}
+    for field, model in _LOOKUPS.items():
+        rows = await CachedRepository(db, model).all()
+        # Newest first so the oldest row wins when names repeat.
+        lookups[field] = {row.name.casefold(): row.id for row in reversed(rows)}
+    return lookups
+
+
+def _normalize(record: dict[str, Any], lookups: dict[str, dict[str, int]]) -> dict[str, Any] | str:
+    values = {}
+    for key, value in record.items():
+        if not key:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                continue
+        if value is not None:
+            values[key.strip()] = value
+    if isinstance(values.get("status"), str):
+        values["status"] = values["status"].lower()
+
+    for field, names in lookups.items():
+        name = values.pop(field, None)
+        if name is None or f"{field}_id" in values:
+            continue
+        id = names.get(str(name).casefold())
+        if id is None:
+            return f"Unknown {field} {name!r}"
+        values[f"{field}_id"] = id
+    return values
+
+
+def _validation_message(errors: list[dict[str, Any]]) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in errors
+    )
+
+
+def _validate(
+    batch: list[tuple[int, dict[str, Any]]],
+) -> tuple[list[tuple], list[ImportRowError]]:
+    errors = []
+    try:
+        assets = _assets_adapter.validate_python([values for _, values in batch])
+    except ValidationError as exc:
+        # Errors are located by list index; revalidate only the rows that passed.
+        by_index: dict[int, list[dict[str, Any]]] = {}
+        for error in exc.errors():
+            index, *loc = error["loc"]
+            by_index.setdefault(index, []).append({**error, "loc": loc})
+        for index, row_errors in sorted(by_index.items()):
+            line, values = batch[index]
+            errors.append(
+                ImportRowError(
+                    line=line,
+                    asset_tag=str(values.get("asset_tag") or "") or None,
+                    detail=_validation_message(row_errors),
+                )
+            )
+        batch = [row for index, row in enumerate(batch) if index not in by_index]
+        assets = _assets_adapter.validate_python([values for _, values in batch])
+
+    records = [
+        (
+            line,
+            asset.name,
+            asset.asset_tag,
+            asset.serial_number,
+            asset.description,
+            asset.status.name,
+            asset.purchase_date,
+            asset.purchase_price,
+            asset.purchase_price,
+            asset.warranty_expiry,
+            asset.category_id,
+            asset.location_id,
+            asset.department_id,
+            asset.vendor_id,
+        )
+        for (line, _), asset in zip(batch, assets, strict=True)
+    ]
+    return records, errors
+
+
+class _ErrorReport:
+    # Counts every rejected row but keeps only the first `limit` by line for the result;
+    # on_error sees all of them, e.g. to write a full report.
+    def __init__(self, limit: int | None, on_error: Callable[[ImportRowError], None] | None = None):
+        self.limit = limit
+        self.on_error = on_error
+        self.failed = 0
+        self._kept: list[ImportRowError] = []
+
+    def add(self, error: ImportRowError) -> None:
+        self.failed += 1
+        if self.on_error is not None:
+            self.on_error(error)
+        self._kept.append(error)
+        if self.limit is not None and len(self._kept) > 2 * self.limit:
+            self._trim()
+
+    def errors(self) -> list[ImportRowError]:
+        self._trim()
+        return self._kept
+
+    def _trim(self) -> None:
+        self._kept.sort(key=lambda error: error.line)
+        if self.limit is not None:
+            del self._kept[self.limit :]
+
+
+async def _reject(
+    db: AsyncSession, condition: Any, column: Column, detail: str, report: _ErrorReport
+) -> None:
+    # Rejected rows leave the staging table, so each row fails on its first problem only.
+    rejected = await db.execute(
+        delete(_staging).where(condition).returning(_staging.c.line, _staging.c.asset_tag, column)
+    )
+    for line, asset_tag, value in rejected.tuples():
+        report.add(ImportRowError(line=line, asset_tag=asset_tag, detail=detail.format(value)))
+
+
+async def _reject_duplicates(db: AsyncSession, report: _ErrorReport) -> None:
+    # serial_number is not unique in the schema, but a repeated or already registered one
+    # almost always means the same physical asset is being imported twice, so it is
+    # rejected like a duplicate asset_tag.
+    for column in ("asset_tag", "serial_number"):
+        staged = _staging.c[column]
+        numbered = (
+            select(
+                _staging.c.line,
+                func.row_number().over(partition_by=staged, order_by=_staging.c.line).label("n"),
+            )
+            .where(staged.isnot(None))
+            .subquery()
+        )
+        repeated = _staging.c.line.in_(select(numbered.c.line).where(numbered.c.n > 1))
+        await _reject(db, repeated, staged, f"Duplicate {column} {{!r}} in file", report)
+        registered = exists().where(getattr(Asset, column) == staged)
+        await _reject(db, registered, staged, f"{column} {{!r}} already exists", report)
+
+
+async def _reject_unknown_references(db: AsyncSession, report: _ErrorReport) -> None:
+    # Names were resolved against the lookups; ids given directly are checked here so a
+    # bad one fails its row instead of the final INSERT.
+    for field, model in _LOOKUPS.items():
+        column = f"{field}_id"
+        staged = _staging.c[column]
+        unknown = staged.isnot(None) & ~exists().where(model.id == staged)
+        await _reject(db, unknown, staged, f"{column} {{}} does not exist", report)
+
+
+async def import_assets(
+    db: AsyncSession,
+    chunks: AsyncIterator[bytes],
+    format: ImportFormat,
+    dry_run: bool = False,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    error_limit: int | None = IMPORT_ERROR_LIMIT,
+    on_error: Callable[[ImportRowError], None] | None = None,
+) -> AssetImportResult:
+    started = time.perf_counter()
+    result = AssetImportResult(format=format, dry_run=dry_run)
+    report = _ErrorReport(error_limit, on_error)
+    lookups = await _load_lookups(db)
+
+    connection = await db.connection()
+    await connection.run_sync(_staging.create)
+    raw = await connection.get_raw_connection()
+    driver = raw.driver_connection
+
+    async def flush(batch: list[tuple[int, dict[str, Any]]]) -> None:
+        records, batch_errors = _validate(batch)
+        for error in batch_errors:
+            report.add(error)
+        if records:
+            await driver.copy_records_to_table(
+                _staging.name, records=records, columns=_COPY_COLUMNS
+            )
+
+    records = _csv_records(chunks) if format == ImportFormat.CSV else _ndjson_records(chunks)
+    batch: list[tuple[int, dict[str, Any]]] = []
+    async for line, record in records:
+        result.processed += 1
+        values = record if isinstance(record, str) else _normalize(record, lookups)
+        if isinstance(values, str):
+            asset_tag = record.get("asset_tag") if isinstance(record, dict) else None
+            report.add(ImportRowError(line=line, asset_tag=asset_tag or None, detail=values))
+            continue
+        batch.append((line, values))
+        if len(batch) >= batch_size:
+            await flush(batch)
+            batch = []
+    if batch:
+        await flush(batch)
+
+    await _reject_duplicates(db, report)
+    await _reject_unknown_references(db, report)
+    if not dry_run:
+        staged = [_staging.c[name] for name in _ASSET_COLUMNS]
+        staged[_ASSET_COLUMNS.index("status")] = cast(
+            _staging.c.status, Asset.__table__.c.status.type
+        ).label("status")
+        merged = await db.execute(
+            insert(Asset).from_select(_ASSET_COLUMNS, select(*staged).order_by(_staging.c.line))
+        )
+        result.imported = merged.rowcount
+    else:
+        result.imported = await db.scalar(select(func.count()).select_from(_staging))
+
+    result.errors = report.errors()
+    result.failed = report.failed
+    result.errors_truncated = result.failed > len(result.errors)
+    result.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+    return result
@@ -0,0 +1,84 @@
+import re
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Row, Select, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.asset import Asset
+
+# Trigram indexes can only serve patterns of at least three characters, and shorter
+# prefixes match too much of the table to rank quickly.
+MIN_FUZZY_LENGTH = 3
+MIN_PREFIX_LENGTH = 3
+
+_TOKEN = re.compile(r"\w+")
+
+
+def _prefix_query(q: str) -> str | None:
+    # Every word must match; words long enough also match as prefixes.
+    tokens = _TOKEN.findall(q.lower())
+    return (
+        " & ".join(f"{token}:*" if len(token) >= MIN_PREFIX_LENGTH else token for token in tokens)
+        or None
+    )
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+async def search_assets(
+    db: AsyncSession,
+    q: str,
+    columns: Sequence[str],
+    limit: int,
+    skip: int = 0,
+    filters: dict[str, Any] | None = None,
+) -> tuple[list[Row], int]:
+    q = q.strip()
+    matches = []
+    ranks = []
+
+    text_query = _prefix_query(q)
+    if text_query:
+        tsquery = func.to_tsquery("english", text_query)
+        matches.append(Asset.search_vector.op("@@")(tsquery))
+        # Normalization 32 scales the rank into [0, 1) so it compares with similarity().
+        ranks.append(func.ts_rank_cd(Asset.search_vector, tsquery, 32))
+
+    if len(q) >= MIN_FUZZY_LENGTH:
+        pattern = f"%{_escape_like(q)}%"
+        for column in (Asset.asset_tag, Asset.serial_number):
+            matches.append(column.ilike(pattern, escape="\\"))
+            matches.append(column.op("%")(q))
+            ranks.append(func.coalesce(func.similarity(column, q), 0))
+
+    if not matches:
+        return [], 0
+
+    conditions = [or_(*matches)]
+    for name, value in (filters or {}).items():
+        if isinstance(value, Select):
+            conditions.append(getattr(Asset, name).in_(value))
+        elif value is not None:
+            conditions.append(getattr(Asset, name) == value)
+
+    rank = (func.greatest(*ranks) if len(ranks) > 1 else ranks[0]).label("rank")
+    selected = [rank if name == "rank" else getattr(Asset, name).label(name) for name in columns]
+    query = (
+        select(*selected, func.count().over().label("total"))
+        .where(*conditions)
+        .order_by(rank.desc(), Asset.id)
+        .offset(skip)
+        .limit(limit)
+    )
+
+    rows = (await db.execute(query)).all()
+    if rows:
+        return rows, rows[0].total
+    if skip:
+        # Past the last page the window never runs, so the total needs its own count.
+        count = select(func.count()).select_from(Asset).where(*conditions)
+        return rows, await db.scalar(count) or 0
+    return rows, 0
@@ -0,0 +1,134 @@
+from decimal import Decimal
+from itertools import chain
+
+from sqlalchemy import and_, delete, func, insert, literal, select, text, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.asset import Asset, AssetStat, AssetStatus
+from src.models.category import Category
+from src.models.department import Department
+from src.models.location import Location
+from src.schemas.stats import GroupStats, StatsOverview, StatusStats
+
+DIMENSIONS = {"category": Category, "location": Location, "department": Department}
+
+# asset_stats.total_value is Numeric(16, 2); every total is reported at that scale.
+CENTS = Decimal("0.01")
+
+
+def _recount():
+    # The same grouping the asset_stats triggers apply incrementally, computed from scratch.
+    value = func.coalesce(func.sum(func.coalesce(Asset.current_value, 0)), 0)
+    parts = [
+        select(
+            literal("all").label("dimension"),
+            literal(0).label("member_id"),
+            Asset.status,
+            func.count().label("asset_count"),
+            value.label("total_value"),
+        ).group_by(Asset.status)
+    ]
+    for dimension in DIMENSIONS:
+        member = func.coalesce(getattr(Asset, f"{dimension}_id"), 0)
+        parts.append(
+            select(literal(dimension), member, Asset.status, func.count(), value).group_by(
+                member, Asset.status
+            )
+        )
+    return union_all(*parts)
+
+
+async def stats_overview(db: AsyncSession) -> StatsOverview:
+    query = select(
+        AssetStat.dimension,
+        AssetStat.member_id,
+        AssetStat.status,
+        AssetStat.asset_count,
+        AssetStat.total_value,
+        func.coalesce(Category.name, Location.name, Department.name).label("name"),
+    ).where(AssetStat.asset_count != 0)
+    for dimension, model in DIMENSIONS.items():
+        query = query.outerjoin(
+            model, and_(AssetStat.dimension == dimension, model.id == AssetStat.member_id)
+        )
+    result = await db.execute(query)
+
+    by_status = {
+        status: StatusStats(status=status, asset_count=0, total_value=Decimal("0"))
+        for status in AssetStatus
+    }
+    groups: dict[str, dict[int, GroupStats]] = {dimension: {} for dimension in DIMENSIONS}
+    for row in result:
+        if row.dimension == "all":
+            stats = by_status[row.status]
+        else:
+            stats = groups[row.dimension].setdefault(
+                row.member_id,
+                GroupStats(
+                    group_id=row.member_id or None,
+                    group_name=row.name,
+                    asset_count=0,
+                    total_value=Decimal("0"),
+                ),
+            )
+        stats.asset_count += row.asset_count
+        stats.total_value += row.total_value
+
+    for stats in chain(by_status.values(), *(group.values() for group in groups.values())):
+        stats.total_value = stats.total_value.quantize(CENTS)
+
+    def ordered(dimension: str) -> list[GroupStats]:
+        return sorted(
+            groups[dimension].values(),
+            key=lambda group: (-group.asset_count, group.group_name or ""),
+        )
+
+    return StatsOverview(
+        asset_count=sum(stats.asset_count for stats in by_status.values()),
+        total_value=sum((stats.total_value for stats in by_status.values()), Decimal("0.00")),
+        by_status=list(by_status.values()),
+        by_category=ordered("category"),
+        by_location=ordered("location"),
+        by_department=ordered("department"),
+    )
+
+
+async def reconcile_asset_stats(db: AsyncSession) -> int:
+    # Blocks asset writes (and so the triggers) while the counters are recounted.
+    await db.execute(text("LOCK TABLE assets IN SHARE MODE"))
+    expected = {
+        (row.dimension, row.member_id, row.status): (row.asset_count, row.total_value)
+        for row in await db.execute(_recount())
+    }
+    current = {
+        (row.dimension, row.member_id, row.status): (row.asset_count, row.total_value)
+        for row in await db.execute(
+            select(
+                AssetStat.dimension,
+                AssetStat.member_id,
+                AssetStat.status,
+                AssetStat.asset_count,
+                AssetStat.total_value,
+            )
+        )
+    }
+    drifted = sum(
+        expected.get(key, (0, 0)) != current.get(key, (0, 0)) for key in expected | current
+    )
+
+    await db.execute(delete(AssetStat))
+    if expected:
+        await db.execute(
+            insert(AssetStat),
+            [
+                {
+                    "dimension": dimension,
+                    "member_id": member_id,
+                    "status": status,
+                    "asset_count": asset_count,
+                    "total_value": total_value,
+                }
+                for (dimension, member_id, status), (asset_count, total_value) in expected.items()
+            ],
+        )
+    return drifted
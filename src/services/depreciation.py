@@ -1,15 +1,24 @@
+import time
+from collections.abc import Awaitable, Callable
 from datetime import date
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.database import async_session
+from src.core.jobs import JobContext, job_runner
 from src.models.asset import Asset
-from src.models.category import DepreciationMethod
-from src.models.depreciation import DepreciationEntry
+from src.models.category import Category, DepreciationMethod
+from src.models.depreciation import AssetBookState, DepreciationEntry
+from src.repositories.cached import CachedRepository
+from src.schemas.depreciation import DepreciationRun, DepreciationRunResult
 
+RUN_CHUNK_SIZE = 1000
 
-async def calculate_straight_line_depreciation(
+
+def _straight_line_amount(
     purchase_price: Decimal,
     salvage_value: Decimal,
     useful_life_years: int,
@@ -25,7 +34,7 @@ async def calculate_straight_line_depreciation(
     return (daily_depreciation * days_in_period).quantize(Decimal("0.01"))
 
 
-async def calculate_declining_balance_depreciation(
+def _declining_balance_amount(
     book_value: Decimal,
     useful_life_years: int,
     period_start: date,
@@ -42,6 +51,63 @@ async def calculate_declining_balance_depreciation(
     return (daily_depreciation * days_in_period).quantize(Decimal("0.01"))
 
 
+async def calculate_straight_line_depreciation(
+    purchase_price: Decimal,
+    salvage_value: Decimal,
+    useful_life_years: int,
+    period_start: date,
+    period_end: date,
+) -> Decimal:
+    return _straight_line_amount(
+        purchase_price, salvage_value, useful_life_years, period_start, period_end
+    )
+
+
+async def calculate_declining_balance_depreciation(
+    book_value: Decimal,
+    useful_life_years: int,
+    period_start: date,
+    period_end: date,
+    rate_multiplier: Decimal = Decimal("2"),
+) -> Decimal:
+    return _declining_balance_amount(
+        book_value, useful_life_years, period_start, period_end, rate_multiplier
+    )
+
+
+def _salvage_value(purchase_price: Decimal, category: Category) -> Decimal:
+    salvage_percent = category.salvage_value_percent or 0
+    return purchase_price * Decimal(salvage_percent) / 100
+
+
+def _compute_period(
+    purchase_price: Decimal,
+    category: Category,
+    current_book_value: Decimal,
+    accumulated: Decimal,
+    period_start: date,
+    period_end: date,
+) -> tuple[Decimal, Decimal, Decimal] | None:
+    useful_life = category.useful_life_years or 5
+    salvage_value = _salvage_value(purchase_price, category)
+
+    if current_book_value <= salvage_value:
+        return None
+
+    if category.depreciation_method == DepreciationMethod.STRAIGHT_LINE:
+        depreciation_amount = _straight_line_amount(
+            purchase_price, salvage_value, useful_life, period_start, period_end
+        )
+    else:
+        depreciation_amount = _declining_balance_amount(
+            current_book_value, useful_life, period_start, period_end
+        )
+
+    new_book_value = max(current_book_value - depreciation_amount, salvage_value)
+    actual_depreciation = current_book_value - new_book_value
+    return actual_depreciation, accumulated + actual_depreciation, new_book_value
+
+
 async def calculate_depreciation_for_asset(
     db: AsyncSession,
     asset: Asset,
@@ -56,46 +122,236 @@ async def calculate_depreciation_for_asset(
         return None
 
     result = await db.execute(
-        select(DepreciationEntry)
-        .where(DepreciationEntry.asset_id == asset.id)
-        .order_by(DepreciationEntry.period_end.desc())
-        .limit(1)
+        select(AssetBookState).where(AssetBookState.asset_id == asset.id).with_for_update()
     )
-    last_entry = result.scalar_one_or_none()
+    book_state = result.scalar_one_or_none()
 
-    if last_entry:
-        current_book_value = last_entry.book_value
-        accumulated = last_entry.accumulated_depreciation
+    if book_state:
+        current_book_value = book_state.book_value
+        accumulated = book_state.accumulated_depreciation
     else:
         current_book_value = asset.purchase_price
         accumulated = Decimal("0")
 
-    useful_life = category.useful_life_years or 5
-    salvage_percent = category.salvage_value_percent or 0
-    salvage_value = asset.purchase_price * Decimal(salvage_percent) / 100
-
-    if current_book_value <= salvage_value:
+    computed = _compute_period(
+        asset.purchase_price, category, current_book_value, accumulated, period_start, period_end
+    )
+    if computed is None:
         return None
 
-    if category.depreciation_method == DepreciationMethod.STRAIGHT_LINE:
-        depreciation_amount = await calculate_straight_line_depreciation(
-            asset.purchase_price, salvage_value, useful_life, period_start, period_end
-        )
-    else:
-        depreciation_amount = await calculate_declining_balance_depreciation(
-            current_book_value, useful_life, period_start, period_end
-        )
-
-    new_book_value = max(current_book_value - depreciation_amount, salvage_value)
-    actual_depreciation = current_book_value - new_book_value
-
+    depreciation_amount, accumulated_depreciation, book_value = computed
     entry = DepreciationEntry(
         asset_id=asset.id,
         period_start=period_start,
         period_end=period_end,
-        depreciation_amount=actual_depreciation,
-        accumulated_depreciation=accumulated + actual_depreciation,
-        book_value=new_book_value,
+        depreciation_amount=depreciation_amount,
+        accumulated_depreciation=accumulated_depreciation,
+        book_value=book_value,
     )
 
     return entry
+
+
+async def run_depreciation(
+    db: AsyncSession,
+    period_start: date,
+    period_end: date,
+    category_id: int | None = None,
+    department_id: int | None = None,
+    location_id: int | None = None,
+    chunk_size: int = RUN_CHUNK_SIZE,
+    on_progress: Callable[[int, int | None], Awaitable[None]] | None = None,
+) -> DepreciationRunResult:
+    started = time.perf_counter()
+    result = DepreciationRunResult(period_start=period_start, period_end=period_end)
+
+    categories = {category.id: category for category in await CachedRepository(db, Category).all()}
+
+    scope = []
+    if category_id is not None:
+        scope.append(Asset.category_id == category_id)
+    if department_id is not None:
+        scope.append(Asset.department_id == department_id)
+    if location_id is not None:
+        scope.append(Asset.location_id == location_id)
+
+    total = None
+    if on_progress is not None:
+        total = await db.scalar(select(func.count()).select_from(Asset).where(*scope))
+
+    processed = 0
+    last_id = 0
+    while True:
+        assets_result = await db.execute(
+            select(Asset.id, Asset.purchase_price, Asset.category_id)
+            .where(Asset.id > last_id, *scope)
+            .order_by(Asset.id)
+            .limit(chunk_size)
+        )
+        assets = assets_result.all()
+        if not assets:
+            break
+        last_id = assets[-1].id
+        processed += len(assets)
+
+        candidates = []
+        for asset in assets:
+            category = categories.get(asset.category_id)
+            if (
+                not asset.purchase_price
+                or category is None
+                or category.depreciation_method == DepreciationMethod.NONE
+            ):
+                result.skipped += 1
+            else:
+                candidates.append((asset, category))
+        if not candidates:
+            continue
+
+        states_result = await db.execute(
+            select(AssetBookState)
+            .where(AssetBookState.asset_id.in_([asset.id for asset, _ in candidates]))
+            .with_for_update()
+        )
+        states = {state.asset_id: state for state in states_result.scalars()}
+
+        entries = []
+        values = []
+        for asset, category in candidates:
+            book_state = states.get(asset.id)
+            if book_state is not None and book_state.last_period_end >= period_start:
+                result.skipped += 1
+                continue
+
+            if book_state is not None:
+                current_book_value = book_state.book_value
+                accumulated = book_state.accumulated_depreciation
+            else:
+                current_book_value = asset.purchase_price
+                accumulated = Decimal("0")
+
+            computed = _compute_period(
+                asset.purchase_price,
+                category,
+                current_book_value,
+                accumulated,
+                period_start,
+                period_end,
+            )
+            if computed is None:
+                result.fully_depreciated += 1
+                continue
+
+            depreciation_amount, accumulated_depreciation, book_value = computed
+            entries.append(
+                {
+                    "asset_id": asset.id,
+                    "period_start": period_start,
+                    "period_end": period_end,
+                    "depreciation_amount": depreciation_amount,
+                    "accumulated_depreciation": accumulated_depreciation,
+                    "book_value": book_value,
+                }
+            )
+            values.append({"id": asset.id, "current_value": book_value})
+            result.total_depreciation += depreciation_amount
+
+        if entries:
+            await db.execute(insert(DepreciationEntry), entries)
+            await record_book_states(db, entries)
+            await db.execute(update(Asset), values)
+            result.posted += len(entries)
+
+        if on_progress is not None:
+            await on_progress(processed, total)
+
+    await db.flush()
+    result.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+    return result
+
+
+async def post_depreciation_entry(db: AsyncSession, asset: Asset, entry: DepreciationEntry) -> None:
+    db.add(entry)
+    await db.flush()
+    await record_book_states(
+        db,
+        [
+            {
+                "asset_id": entry.asset_id,
+                "period_end": entry.period_end,
+                "accumulated_depreciation": entry.accumulated_depreciation,
+                "book_value": entry.book_value,
+            }
+        ],
+    )
+    asset.current_value = entry.book_value
+    await db.flush()
+
+
+@job_runner.handler("depreciation_run")
+async def depreciation_run_job(job: JobContext) -> dict:
+    params = DepreciationRun.model_validate(job.params)
+    async with async_session() as session:
+        result = await run_depreciation(
+            session,
+            params.period_start,
+            params.period_end,
+            category_id=params.category_id,
+            department_id=params.department_id,
+            location_id=params.location_id,
+            on_progress=job.progress,
+        )
+        await session.commit()
+    await job.progress(result.posted + result.skipped + result.fully_depreciated, force=True)
+    return result.model_dump(mode="json")
+
+
+async def record_book_states(db: AsyncSession, entries: list[dict]) -> None:
+    statement = pg_insert(AssetBookState)
+    statement = statement.on_conflict_do_update(
+        index_elements=[AssetBookState.asset_id],
+        set_={
+            "last_period_end": statement.excluded.last_period_end,
+            "accumulated_depreciation": statement.excluded.accumulated_depreciation,
+            "book_value": statement.excluded.book_value,
+            "updated_at": func.now(),
+        },
+        where=AssetBookState.last_period_end <= statement.excluded.last_period_end,
+    )
+    await db.execute(
+        statement,
+        [
+            {
+                "asset_id": entry["asset_id"],
+                "last_period_end": entry["period_end"],
+                "accumulated_depreciation": entry["accumulated_depreciation"],
+                "book_value": entry["book_value"],
+            }
+            for entry in entries
+        ],
+    )
+
+
+async def rebuild_book_states(db: AsyncSession) -> int:
+    await db.execute(delete(AssetBookState))
+    latest = (
+        select(
+            DepreciationEntry.asset_id,
+            DepreciationEntry.period_end,
+            DepreciationEntry.accumulated_depreciation,
+            DepreciationEntry.book_value,
+        )
+        .order_by(
+            DepreciationEntry.asset_id,
+            DepreciationEntry.period_end.desc(),
+            DepreciationEntry.id.desc(),
+        )
+        .distinct(DepreciationEntry.asset_id)
+    )
+    result = await db.execute(
+        insert(AssetBookState).from_select(
+            ["asset_id", "last_period_end", "accumulated_depreciation", "book_value"], latest
+        )
+    )
+    await db.flush()
+    return result.rowcount
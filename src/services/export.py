@@ -0,0 +1,160 @@
+import csv
+import io
+from collections.abc import AsyncIterator, Sequence
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy import Boolean, Date, DateTime, Integer, Numeric, Row
+
+from src.core.database import async_session
+from src.core.serialization import RowSerializer, row_serializer
+from src.repositories.base import BaseRepository
+from src.schemas.export import ExportFormat
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+EXPORT_CHUNK_SIZE = 2000
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+
+def parquet_available() -> bool:
+    return pa is not None
+
+
+class _CsvEncoder:
+    def __init__(self, serializer: RowSerializer):
+        self.serializer = serializer
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer)
+        self.writer.writerow(serializer.names)
+
+    def encode(self, rows: Sequence[Row]) -> bytes:
+        for row in self.serializer.to_python(rows):
+            self.writer.writerow(row.values())
+        return self._drain()
+
+    def finish(self) -> bytes:
+        return self._drain()
+
+    def _drain(self) -> bytes:
+        data = self.buffer.getvalue().encode()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        return data
+
+
+class _NdjsonEncoder:
+    def __init__(self, serializer: RowSerializer):
+        self.serializer = serializer
+
+    def encode(self, rows: Sequence[Row]) -> bytes:
+        return self.serializer.dump_lines(rows)
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class _ChunkSink:
+    # Parquet records byte offsets through tell(), so the sink counts what it has handed
+    # out instead of rewinding a buffer.
+    closed = False
+
+    def __init__(self):
+        self.chunks: list[bytes] = []
+        self.position = 0
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _arrow_type(column) -> Any:
+    if isinstance(column.type, Boolean):
+        return pa.bool_()
+    if isinstance(column.type, Integer):
+        return pa.int64()
+    if isinstance(column.type, Numeric):
+        return pa.decimal128(column.type.precision, column.type.scale)
+    if isinstance(column.type, DateTime):
+        return pa.timestamp("us", tz="UTC" if column.type.timezone else None)
+    if isinstance(column.type, Date):
+        return pa.date32()
+    return pa.string()
+
+
+class _ParquetEncoder:
+    def __init__(self, serializer: RowSerializer, model: type):
+        self.names = serializer.names
+        columns = model.__table__.columns
+        self.schema = pa.schema(
+            [
+                pa.field(name, _arrow_type(columns[name]), nullable=columns[name].nullable)
+                for name in self.names
+            ]
+        )
+        self.sink = _ChunkSink()
+        self.writer = pq.ParquetWriter(pa.PythonFile(self.sink, mode="w"), self.schema)
+
+    def encode(self, rows: Sequence[Row]) -> bytes:
+        arrays = []
+        for index, field in enumerate(self.schema):
+            values = [row[index] for row in rows]
+            if pa.types.is_string(field.type):
+                values = [value.value if isinstance(value, Enum) else value for value in values]
+            arrays.append(pa.array(values, type=field.type))
+        self.writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+        return self.sink.drain()
+
+    def finish(self) -> bytes:
+        self.writer.close()
+        return self.sink.drain()
+
+
+async def export_rows(
+    model: type,
+    schema: type[BaseModel],
+    format: ExportFormat,
+    filters: dict[str, Any] | None = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    serializer = row_serializer(schema)
+    if format == ExportFormat.PARQUET:
+        encoder = _ParquetEncoder(serializer, model)
+    elif format == ExportFormat.NDJSON:
+        encoder = _NdjsonEncoder(serializer)
+    else:
+        encoder = _CsvEncoder(serializer)
+
+    # The export outlives the request's session, so it reads through its own server-side
+    # cursor and only ever holds one chunk of rows.
+    async with async_session() as session:
+        repo = BaseRepository(session, model)
+        async for rows in repo.stream(serializer.names, filters, chunk_size):
+            yield encoder.encode(rows)
+    yield encoder.finish()
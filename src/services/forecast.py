@@ -0,0 +1,282 @@
+import calendar
+import time
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.asset import Asset
+from src.models.category import Category, DepreciationMethod
+from src.models.department import Department
+from src.models.depreciation import AssetBookState
+from src.models.location import Location
+from src.repositories.cached import CachedRepository
+from src.schemas.depreciation import (
+    DepreciationForecast,
+    DepreciationReportGrouping,
+    ForecastGroup,
+    ForecastPeriod,
+)
+from src.services.depreciation import _declining_balance_amount, _straight_line_amount
+
+STRAIGHT_LINE = 0
+DECLINING_BALANCE = 1
+NO_DEPRECIATION = 2
+
+_METHOD_CODES = {
+    DepreciationMethod.STRAIGHT_LINE: STRAIGHT_LINE,
+    DepreciationMethod.DECLINING_BALANCE: DECLINING_BALANCE,
+    DepreciationMethod.NONE: NO_DEPRECIATION,
+}
+
+
+def monthly_periods(start: date, months: int) -> list[tuple[date, date]]:
+    periods = []
+    year, month = start.year, start.month
+    for _ in range(months):
+        last_day = calendar.monthrange(year, month)[1]
+        periods.append((date(year, month, 1), date(year, month, last_day)))
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+    return periods
+
+
+def _divide_half_even(numerator: np.ndarray, denominator: np.ndarray):
+    quotient, remainder = np.divmod(numerator, denominator)
+    twice = 2 * remainder
+    ties = twice == denominator
+    round_up = (twice > denominator) | (ties & (quotient % 2 == 1))
+    return quotient + round_up, ties
+
+
+def _cents(value: Decimal) -> int:
+    return int(value.scaleb(2))
+
+
+def _round_half_up(numerator: np.ndarray, denominator: int) -> np.ndarray:
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+def project_book_values(
+    purchase_cents: np.ndarray,
+    book_cents: np.ndarray,
+    salvage_percent: np.ndarray,
+    useful_life: np.ndarray,
+    method: np.ndarray,
+    periods: list[tuple[date, date]],
+) -> np.ndarray:
+    purchase_cents = purchase_cents.astype(np.int64)
+    book = book_cents.astype(np.int64).copy()
+    salvage_percent = salvage_percent.astype(np.int64)
+    life = useful_life.astype(np.int64)
+
+    # Salvage value is purchase_price * pct / 100, kept in hundredths of a cent.
+    salvage_x100 = purchase_cents * salvage_percent
+    salvage_stored = _round_half_up(salvage_x100, 100)
+    straight_line = method == STRAIGHT_LINE
+    declining = method == DECLINING_BALANCE
+    positive_life = life > 0
+    safe_life = np.where(positive_life, life, 1)
+
+    schedule = np.empty((len(periods), len(book)), dtype=np.int64)
+    for index, (period_start, period_end) in enumerate(periods):
+        days = (period_end - period_start).days + 1
+        active = (straight_line | declining) & (book * 100 > salvage_x100)
+
+        numerator = np.where(
+            straight_line,
+            (purchase_cents * 100 - salvage_x100) * days,
+            book * 2 * days,
+        )
+        denominator = np.where(straight_line, 100, 1) * safe_life * 365
+        amount, ties = _divide_half_even(numerator, denominator)
+        amount = np.where(positive_life, amount, 0)
+
+        # Exact half-cent ties depend on the Decimal kernels' intermediate rounding.
+        for position in np.flatnonzero(ties & active & positive_life):
+            amount[position] = _decimal_amount(
+                int(purchase_cents[position]),
+                int(book[position]),
+                int(salvage_percent[position]),
+                int(life[position]),
+                bool(straight_line[position]),
+                period_start,
+                period_end,
+            )
+
+        remaining = book - amount
+        clamped = remaining * 100 < salvage_x100
+        book = np.where(active, np.where(clamped, salvage_stored, remaining), book)
+        schedule[index] = book
+
+    return schedule
+
+
+def _decimal_amount(
+    purchase_cents: int,
+    book_cents: int,
+    salvage_percent: int,
+    useful_life: int,
+    straight_line: bool,
+    period_start: date,
+    period_end: date,
+) -> int:
+    purchase_price = Decimal(purchase_cents).scaleb(-2)
+    if straight_line:
+        salvage_value = purchase_price * Decimal(salvage_percent) / 100
+        amount = _straight_line_amount(
+            purchase_price, salvage_value, useful_life, period_start, period_end
+        )
+    else:
+        amount = _declining_balance_amount(
+            Decimal(book_cents).scaleb(-2), useful_life, period_start, period_end
+        )
+    return _cents(amount)
+
+
+async def forecast_depreciation(
+    db: AsyncSession,
+    start: date,
+    months: int,
+    group_by: DepreciationReportGrouping,
+) -> DepreciationForecast:
+    started = time.perf_counter()
+    periods = monthly_periods(start, months)
+
+    categories = {category.id: category for category in await CachedRepository(db, Category).all()}
+
+    result = await db.execute(
+        select(
+            Asset.purchase_price,
+            Asset.category_id,
+            Asset.department_id,
+            Asset.location_id,
+            AssetBookState.book_value,
+        )
+        .outerjoin(AssetBookState, AssetBookState.asset_id == Asset.id)
+        .where(Asset.purchase_price.isnot(None))
+        .order_by(Asset.id)
+    )
+    rows = result.all()
+
+    count = len(rows)
+    purchase_cents = np.empty(count, dtype=np.int64)
+    book_cents = np.empty(count, dtype=np.int64)
+    salvage_percent = np.zeros(count, dtype=np.int64)
+    useful_life = np.full(count, 5, dtype=np.int64)
+    method = np.full(count, NO_DEPRECIATION, dtype=np.int8)
+    keys = []
+    for position, row in enumerate(rows):
+        purchase_cents[position] = _cents(row.purchase_price)
+        book_value = row.book_value if row.book_value is not None else row.purchase_price
+        book_cents[position] = _cents(book_value)
+        category = categories.get(row.category_id)
+        if category is not None:
+            salvage_percent[position] = category.salvage_value_percent or 0
+            useful_life[position] = category.useful_life_years or 5
+            method[position] = _METHOD_CODES[category.depreciation_method]
+
+        if group_by == DepreciationReportGrouping.DEPRECIATION_METHOD:
+            keys.append(
+                category.depreciation_method.value
+                if category is not None
+                else DepreciationMethod.NONE.value
+            )
+        else:
+            keys.append(getattr(row, f"{group_by.value}_id"))
+
+    schedule = project_book_values(
+        purchase_cents, book_cents, salvage_percent, useful_life, method, periods
+    )
+    opening = book_cents
+
+    group_keys = sorted(set(keys), key=lambda key: (key is None, key))
+    key_index = {key: index for index, key in enumerate(group_keys)}
+    group_of = np.fromiter((key_index[key] for key in keys), dtype=np.int64, count=count)
+    order = np.argsort(group_of, kind="stable")
+    boundaries = np.searchsorted(group_of[order], np.arange(len(group_keys)))
+
+    names = await _group_names(db, group_by, group_keys)
+    groups = []
+    if count:
+        sorted_schedule = schedule[:, order]
+        group_book = np.add.reduceat(sorted_schedule, boundaries, axis=1)
+        group_opening = np.add.reduceat(opening[order], boundaries)
+        sizes = np.diff(np.append(boundaries, count))
+        for index, key in enumerate(group_keys):
+            groups.append(
+                _forecast_group(
+                    None if group_by == DepreciationReportGrouping.DEPRECIATION_METHOD else key,
+                    names.get(key),
+                    int(sizes[index]),
+                    int(group_opening[index]),
+                    group_book[:, index],
+                    periods,
+                )
+            )
+
+    total = _forecast_group(
+        None,
+        None,
+        count,
+        int(opening.sum()),
+        schedule.sum(axis=1) if count else np.zeros(len(periods), dtype=np.int64),
+        periods,
+    )
+
+    return DepreciationForecast(
+        start=periods[0][0],
+        months=months,
+        group_by=group_by,
+        groups=groups,
+        total=total,
+        duration_ms=round((time.perf_counter() - started) * 1000, 3),
+    )
+
+
+def _forecast_group(
+    group_id: int | None,
+    group_name: str | None,
+    asset_count: int,
+    opening_cents: int,
+    book_cents: np.ndarray,
+    periods: list[tuple[date, date]],
+) -> ForecastGroup:
+    previous = opening_cents
+    forecast_periods = []
+    for (period_start, period_end), value in zip(periods, book_cents.tolist(), strict=True):
+        forecast_periods.append(
+            ForecastPeriod(
+                period_start=period_start,
+                period_end=period_end,
+                depreciation=Decimal(previous - value).scaleb(-2),
+                book_value=Decimal(value).scaleb(-2),
+            )
+        )
+        previous = value
+    return ForecastGroup(
+        group_id=group_id,
+        group_name=group_name,
+        asset_count=asset_count,
+        opening_book_value=Decimal(opening_cents).scaleb(-2),
+        periods=forecast_periods,
+    )
+
+
+async def _group_names(db: AsyncSession, group_by: DepreciationReportGrouping, keys: list) -> dict:
+    if group_by == DepreciationReportGrouping.DEPRECIATION_METHOD:
+        return {key: key for key in keys}
+
+    model = {
+        DepreciationReportGrouping.CATEGORY: Category,
+        DepreciationReportGrouping.DEPARTMENT: Department,
+        DepreciationReportGrouping.LOCATION: Location,
+    }[group_by]
+    ids = [key for key in keys if key is not None]
+    if not ids:
+        return {}
+    result = await db.execute(select(model.id, model.name).where(model.id.in_(ids)))
+    return dict(result.tuples().all())
@@ -0,0 +1,80 @@
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.core.cache import tree_cache
+from src.models.asset import Asset
+
+
+@cache
+def _adapter(schema: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[schema])
+
+
+async def _nodes(
+    db: AsyncSession,
+    model: type,
+    closure: type,
+    asset_column: InstrumentedAttribute,
+    schema: type[BaseModel],
+    counts: bool,
+) -> list[dict[str, Any]]:
+    names = [name for name in schema.model_fields if name in model.__mapper__.columns]
+    query = select(*[getattr(model, name).label(name) for name in names])
+    if counts:
+        direct = (
+            select(asset_column.label("id"), func.count().label("assets"))
+            .group_by(asset_column)
+            .subquery()
+        )
+        rollup = (
+            select(closure.ancestor_id.label("id"), func.count().label("assets"))
+            .join(Asset, asset_column == closure.descendant_id)
+            .group_by(closure.ancestor_id)
+            .subquery()
+        )
+        query = (
+            query.add_columns(
+                func.coalesce(direct.c.assets, 0).label("asset_count"),
+                func.coalesce(rollup.c.assets, 0).label("subtree_asset_count"),
+            )
+            .outerjoin(direct, direct.c.id == model.id)
+            .outerjoin(rollup, rollup.c.id == model.id)
+        )
+    result = await db.execute(query.order_by(model.name, model.id))
+    return [{**row, "children": []} for row in result.mappings()]
+
+
+async def hierarchy_tree(
+    db: AsyncSession,
+    model: type,
+    closure: type,
+    asset_column: InstrumentedAttribute,
+    schema: type[BaseModel],
+    counts: bool = False,
+) -> bytes:
+    key = (model.__tablename__, counts)
+    tree = tree_cache.get(key)
+    if tree is not None:
+        return tree
+
+    tables = {model.__tablename__, closure.__tablename__}
+    if counts:
+        tables.add(Asset.__tablename__)
+    generation = tree_cache.generation(tables)
+
+    nodes = await _nodes(db, model, closure, asset_column, schema, counts)
+    by_id = {node["id"]: node for node in nodes}
+    roots = []
+    for node in nodes:
+        parent = by_id.get(node["parent_id"])
+        (parent["children"] if parent else roots).append(node)
+
+    adapter = _adapter(schema)
+    tree = adapter.dump_json(adapter.validate_python(roots))
+    tree_cache.set(key, tree, tables, generation)
+    return tree
@@ -0,0 +1,112 @@
+from datetime import date
+
+from sqlalchemy import Date, Select, cast, func, select, true, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.asset import Asset
+from src.models.category import Category
+from src.models.department import Department
+from src.models.depreciation import DepreciationEntry
+from src.models.location import Location
+from src.schemas.valuation import AssetValuation, ValuationGroup, ValuationReport
+
+
+def asset_valuations(as_of: date) -> Select:
+    latest_entry = (
+        select(DepreciationEntry.book_value, DepreciationEntry.period_end)
+        .where(DepreciationEntry.asset_id == Asset.id, DepreciationEntry.period_end <= as_of)
+        .order_by(DepreciationEntry.period_end.desc(), DepreciationEntry.id.desc())
+        .limit(1)
+        .lateral()
+    )
+    in_service = func.coalesce(Asset.purchase_date, cast(Asset.created_at, Date))
+    return (
+        select(
+            Asset.id.label("asset_id"),
+            Asset.name.label("asset_name"),
+            Asset.asset_tag,
+            Asset.category_id,
+            Asset.department_id,
+            Asset.location_id,
+            Asset.purchase_date,
+            Asset.purchase_price,
+            func.coalesce(latest_entry.c.book_value, Asset.purchase_price).label("book_value"),
+            latest_entry.c.period_end.label("valued_through"),
+        )
+        .outerjoin(latest_entry, true())
+        .where(Asset.purchase_price.isnot(None), in_service <= as_of)
+    )
+
+
+async def get_asset_valuations(
+    db: AsyncSession, as_of: date, skip: int, limit: int
+) -> tuple[list[AssetValuation], int]:
+    valuations = asset_valuations(as_of)
+    # As in BaseRepository.paginate, the total rides along as an uncorrelated scalar subquery.
+    count_query = select(func.count()).select_from(valuations.subquery())
+    result = await db.execute(
+        valuations.add_columns(count_query.scalar_subquery().label("total"))
+        .order_by(Asset.id)
+        .offset(skip)
+        .limit(limit)
+    )
+    rows = result.all()
+    items = [AssetValuation.model_validate(row._mapping) for row in rows]
+    total = rows[0].total if rows else await db.scalar(count_query)
+    return items, total or 0
+
+
+async def get_valuation_report(db: AsyncSession, as_of: date) -> ValuationReport:
+    valuations = asset_valuations(as_of).subquery()
+    dimensions = {
+        "by_category": (valuations.c.category_id, Category),
+        "by_department": (valuations.c.department_id, Department),
+        "by_location": (valuations.c.location_id, Location),
+    }
+
+    query = select(
+        *(func.grouping(key).label(f"{name}_grouping") for name, (key, _) in dimensions.items()),
+        func.count().label("asset_count"),
+        func.coalesce(func.sum(valuations.c.purchase_price), 0).label("total_purchase_price"),
+        func.coalesce(func.sum(valuations.c.book_value), 0).label("total_book_value"),
+    ).select_from(valuations)
+    grouping_sets = [tuple_()]
+    for name, (key, model) in dimensions.items():
+        query = query.outerjoin(model, key == model.id).add_columns(
+            key.label(f"{name}_id"), model.name.label(f"{name}_name")
+        )
+        grouping_sets.append(tuple_(key, model.name))
+    query = query.group_by(func.grouping_sets(*grouping_sets))
+
+    result = await db.execute(query)
+    report = ValuationReport(
+        as_of=as_of,
+        asset_count=0,
+        total_purchase_price=0,
+        total_book_value=0,
+        by_category=[],
+        by_department=[],
+        by_location=[],
+    )
+    for row in result:
+        grouped = [name for name in dimensions if getattr(row, f"{name}_grouping") == 0]
+        if not grouped:
+            report.asset_count = row.asset_count
+            report.total_purchase_price = row.total_purchase_price
+            report.total_book_value = row.total_book_value
+            continue
+
+        name = grouped[0]
+        getattr(report, name).append(
+            ValuationGroup(
+                group_id=getattr(row, f"{name}_id"),
+                group_name=getattr(row, f"{name}_name"),
+                asset_count=row.asset_count,
+                total_purchase_price=row.total_purchase_price,
+                total_book_value=row.total_book_value,
+            )
+        )
+
+    for name in dimensions:
+        getattr(report, name).sort(key=lambda group: (group.group_id is None, group.group_id))
+    return report
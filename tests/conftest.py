@@ -0,0 +1,77 @@
+import asyncio
+import os
+import subprocess
+import sys
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+if TEST_DATABASE_URL:
+    # Each run migrates its own database next to TEST_DATABASE_URL and drops it afterwards.
+    # Settings are read at import time, so the app is pointed at it before anything imports it.
+    _url = make_url(TEST_DATABASE_URL)
+    DATABASE_URL = _url.set(database=f"{_url.database}_{uuid4().hex[:12]}").render_as_string(
+        hide_password=False
+    )
+    os.environ["DATABASE_URL"] = DATABASE_URL
+
+from src.core.cache import clear_caches  # noqa: E402
+from src.core.database import engine, get_db  # noqa: E402
+from src.main import app  # noqa: E402
+
+
+async def _admin(statement: str) -> None:
+    admin = create_async_engine(TEST_DATABASE_URL, isolation_level="AUTOCOMMIT")
+    try:
+        async with admin.connect() as conn:
+            await conn.execute(text(statement))
+    finally:
+        await admin.dispose()
+
+
+@pytest.fixture(scope="session")
+def database():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    name = make_url(DATABASE_URL).database
+    asyncio.run(_admin(f'CREATE DATABASE "{name}"'))
+    try:
+        subprocess.run([sys.executable, "-m", "alembic", "upgrade", "head"], check=True)
+        yield DATABASE_URL
+    finally:
+        asyncio.run(_admin(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)'))
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def rollback(database):
+    # Requests join one outer transaction through savepoints, so nothing a test writes outlives
+    # it. Caches may have picked up the discarded rows and are dropped with them, and pooled
+    # connections with the test's event loop.
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+
+        async def get_test_db():
+            async with AsyncSession(
+                bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint"
+            ) as session:
+                try:
+                    yield session
+                    await session.commit()
+                except Exception:
+                    await session.rollback()
+                    raise
+
+        app.dependency_overrides[get_db] = get_test_db
+        try:
+            yield conn
+        finally:
+            del app.dependency_overrides[get_db]
+            await transaction.rollback()
+            clear_caches()
+    await engine.dispose()
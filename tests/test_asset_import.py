@@ -0,0 +1,89 @@
+import pytest
+
+from src.schemas.asset_import import ImportRowError
+from src.services.asset_import import _csv_records, _ErrorReport, _ndjson_records
+
+CSV = (
+    "\ufeffname,asset_tag,description\r\n"
+    "Laptop,TAG-1,Plain\r\n"
+    '"Desk, standing",TAG-2,"Two\r\nlines with ""quotes"""\r\n'
+    "\r\n"
+    "Café chair,TAG-3\r\n"
+    "Lamp,TAG-4,Bright,extra\r\n"
+    "Monitor,TAG-5,Last"
+).encode()
+
+NDJSON = (
+    '{"name": "Laptop", "asset_tag": "TAG-1"}\n'
+    "\n"
+    '{"name": "Café chair",\n'
+    "[1, 2]\n"
+    '{"name": "Lamp", "description": "日本"}'
+).encode()
+
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def _records(parse, data: bytes, size: int) -> list:
+    return [record async for record in parse(_chunks(data, size))]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, len(CSV)])
+async def test_csv_records_do_not_depend_on_chunking(size):
+    assert await _records(_csv_records, CSV, size) == [
+        (2, {"name": "Laptop", "asset_tag": "TAG-1", "description": "Plain"}),
+        (
+            3,
+            {
+                "name": "Desk, standing",
+                "asset_tag": "TAG-2",
+                "description": 'Two\r\nlines with "quotes"',
+            },
+        ),
+        (6, {"name": "Café chair", "asset_tag": "TAG-3"}),
+        (7, "Expected 3 columns, found 4"),
+        (8, {"name": "Monitor", "asset_tag": "TAG-5", "description": "Last"}),
+    ]
+
+
+async def test_csv_unterminated_quote():
+    data = b'name,asset_tag\nLaptop,TAG-1\n"Desk,TAG-2\nLamp,TAG-3\n'
+    assert await _records(_csv_records, data, 5) == [
+        (2, {"name": "Laptop", "asset_tag": "TAG-1"}),
+        (3, "Unterminated quoted field"),
+    ]
+
+
+@pytest.mark.parametrize("size", [1, 4, 64])
+async def test_csv_bare_carriage_returns(size):
+    data = b"name,asset_tag\rLaptop,TAG-1\rLamp,TAG-2\r"
+    assert await _records(_csv_records, data, size) == [
+        (2, {"name": "Laptop", "asset_tag": "TAG-1"}),
+        (3, {"name": "Lamp", "asset_tag": "TAG-2"}),
+    ]
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, len(NDJSON)])
+async def test_ndjson_records_do_not_depend_on_chunking(size):
+    assert await _records(_ndjson_records, NDJSON, size) == [
+        (1, {"name": "Laptop", "asset_tag": "TAG-1"}),
+        (3, "Invalid JSON: Expecting property name enclosed in double quotes"),
+        (4, "Expected a JSON object"),
+        (5, {"name": "Lamp", "description": "日本"}),
+    ]
+
+
+@pytest.mark.parametrize("limit", [0, 3, None])
+def test_error_report_keeps_the_first_lines_and_counts_all(limit):
+    seen = []
+    report = _ErrorReport(limit, seen.append)
+    lines = [9, 4, 17, 1, 12, 8, 3, 20, 5, 2]
+    for line in lines:
+        report.add(ImportRowError(line=line, detail="Rejected"))
+
+    assert report.failed == len(lines)
+    assert [error.line for error in seen] == lines
+    assert [error.line for error in report.errors()] == sorted(lines)[:limit]
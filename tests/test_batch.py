@@ -0,0 +1,73 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.v1.batch import check_batch, duplicate_ids, parse_items
+from src.models.asset import Asset
+from src.models.category import Category
+from src.repositories.base import BaseRepository
+from src.schemas.common import BatchMode
+from src.schemas.vendor import VendorCreate
+
+
+def test_parse_items_keeps_positions():
+    parsed, errors = parse_items(VendorCreate, [{"name": "Acme"}, {}, {"name": "Globex"}])
+    assert [item.name for item in parsed.values()] == ["Acme", "Globex"]
+    assert list(parsed) == [0, 2]
+    assert list(errors) == [1]
+    assert errors[1].startswith("name: ")
+
+
+def test_duplicate_ids_flag_repeats_after_the_first():
+    assert duplicate_ids({0: 5, 1: 6, 2: 5, 3: 5}) == {
+        2: "Duplicate id in batch",
+        3: "Duplicate id in batch",
+    }
+
+
+def test_atomic_batches_fail_on_any_error():
+    with pytest.raises(HTTPException) as raised:
+        check_batch(BatchMode.ATOMIC, {2: "Vendor not found", 0: "name: Field required"}, {2: 9})
+    assert raised.value.status_code == 422
+    assert raised.value.detail == [
+        {"index": 0, "id": None, "detail": "name: Field required"},
+        {"index": 2, "id": 9, "detail": "Vendor not found"},
+    ]
+
+
+@pytest.mark.parametrize(
+    ("mode", "errors"),
+    [(BatchMode.PARTIAL, {0: "Vendor not found"}), (BatchMode.ATOMIC, {})],
+)
+def test_batches_that_proceed(mode, errors):
+    check_batch(mode, errors)
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_validate_many(rollback):
+    async with AsyncSession(bind=rollback, join_transaction_mode="create_savepoint") as session:
+        category_id = await session.scalar(
+            insert(Category).values(name="Laptops").returning(Category.id)
+        )
+        await session.execute(insert(Asset).values(name="Desktop", asset_tag="BATCH-0"))
+        asset_id = await session.scalar(
+            insert(Asset).values(name="Laptop", asset_tag="BATCH-1").returning(Asset.id)
+        )
+        errors = await BaseRepository(session, Asset).validate_many(
+            {
+                0: {"name": "New", "asset_tag": "BATCH-2", "category_id": category_id},
+                1: {"name": "Copy", "asset_tag": "BATCH-2"},
+                2: {"name": "Clash", "asset_tag": "BATCH-0"},
+                3: {"id": asset_id, "asset_tag": "BATCH-1"},
+                4: {"id": asset_id + 1000, "name": "Gone"},
+                5: {"name": "Orphan", "asset_tag": "BATCH-3", "category_id": category_id + 1000},
+            }
+        )
+
+    assert errors == {
+        1: "Duplicate asset_tag 'BATCH-2' in batch",
+        2: "asset_tag 'BATCH-0' already exists",
+        4: "Asset not found",
+        5: f"category_id {category_id + 1000} does not exist",
+    }
@@ -0,0 +1,86 @@
+import pytest
+
+from src.core import cache as cache_module
+from src.core.cache import TableCache
+
+
+@pytest.fixture
+def cache():
+    cache = TableCache("test", max_entries=3, ttl=60)
+    yield cache
+    cache_module.caches.remove(cache)
+
+
+def _put(cache: TableCache, key: str, tables: list[str], id: int | None = None) -> None:
+    cache.set(key, key.upper(), tables, cache.generation(tables), id)
+
+
+def test_row_writes_drop_only_that_row(cache):
+    _put(cache, "one", ["vendors"], id=1)
+    _put(cache, "two", ["vendors"], id=2)
+    _put(cache, "all", ["vendors"])
+
+    cache.invalidate({"vendors": {1}})
+
+    assert cache.get("one") is None
+    assert cache.get("two") == "TWO"
+    assert cache.get("all") is None
+
+
+def test_table_writes_drop_every_entry_reading_the_table(cache):
+    _put(cache, "vendor", ["vendors"], id=1)
+    _put(cache, "joined", ["assets", "vendors"])
+    _put(cache, "other", ["categories"])
+
+    cache.invalidate({"vendors": None})
+
+    assert cache.get("vendor") is None
+    assert cache.get("joined") is None
+    assert cache.get("other") == "OTHER"
+    assert cache.stats().invalidations == 2
+
+
+def test_value_built_across_a_commit_is_not_stored(cache):
+    generation = cache.generation(["vendors"])
+    cache.invalidate({"vendors": {7}})
+    cache.set("stale", "STALE", ["vendors"], generation)
+    assert cache.get("stale") is None
+
+    generation = cache.generation(["vendors"])
+    cache.invalidate({"categories": None})
+    cache.set("fresh", "FRESH", ["vendors"], generation)
+    assert cache.get("fresh") == "FRESH"
+
+
+def test_value_built_across_a_clear_is_not_stored(cache):
+    generation = cache.generation(["vendors"])
+    cache.clear()
+    cache.set("stale", "STALE", ["vendors"], generation)
+    assert cache.get("stale") is None
+
+
+def test_generation_ignores_table_order(cache):
+    generation = cache.generation(["vendors", "assets"])
+    cache.set("joined", "JOINED", ["assets", "vendors"], generation)
+    assert cache.get("joined") == "JOINED"
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    for key in ("a", "b", "c"):
+        _put(cache, key, ["vendors"])
+    cache.get("a")
+    _put(cache, "d", ["vendors"])
+
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in ("a", "c", "d")] == ["A", "C", "D"]
+    assert cache.stats().evictions == 1
+
+
+def test_entries_expire(cache, monkeypatch):
+    _put(cache, "vendor", ["vendors"])
+    now = cache_module.time.monotonic()
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now + 61)
+
+    assert cache.get("vendor") is None
+    stats = cache.stats()
+    assert (stats.expirations, stats.misses, stats.size) == (1, 1, 0)
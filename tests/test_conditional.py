@@ -0,0 +1,112 @@
+from datetime import UTC, datetime
+
+import pytest
+from fastapi import Request, Response
+
+from src.api.v1.conditional import ConditionalRequest
+
+UPDATED_AT = datetime(2026, 3, 4, 5, 6, 7, 890000, tzinfo=UTC)
+HTTP_DATE = "Wed, 04 Mar 2026 05:06:07 GMT"
+
+
+def _conditional(
+    path: str = "/api/v1/assets/1", query: str = "", **headers: str
+) -> ConditionalRequest:
+    request = Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": query.encode(),
+            "headers": [
+                (name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()
+            ],
+        }
+    )
+    return ConditionalRequest(request, Response())
+
+
+def _etag(*version, **request) -> str:
+    conditional = _conditional(**request)
+    assert conditional.check(*version, last_modified=UPDATED_AT) is None
+    return conditional.headers["ETag"]
+
+
+def test_unconditional_request_gets_validators():
+    conditional = _conditional()
+    assert not conditional.requested
+    assert conditional.check(1, UPDATED_AT, last_modified=UPDATED_AT) is None
+
+    response = conditional.finish(Response())
+    assert response.headers["ETag"].startswith('W/"')
+    assert response.headers["Last-Modified"] == HTTP_DATE
+
+
+def test_etag_depends_on_version_path_and_query():
+    etag = _etag(1, UPDATED_AT)
+    assert _etag(1, UPDATED_AT) == etag
+    assert _etag(2, UPDATED_AT) != etag
+    assert _etag(1, UPDATED_AT, path="/api/v1/assets/2") != etag
+    assert _etag(1, UPDATED_AT, query="fields=name") != etag
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        "{etag}",
+        "{opaque}",
+        'W/"other", {etag}',
+        ' "other" ,{opaque} ',
+        "*",
+    ],
+)
+def test_if_none_match_uses_weak_comparison(header):
+    etag = _etag(1, UPDATED_AT)
+    header = header.format(etag=etag, opaque=etag.removeprefix("W/"))
+    conditional = _conditional(if_none_match=header)
+    assert conditional.requested
+
+    response = conditional.check(1, UPDATED_AT, last_modified=UPDATED_AT)
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since():
+    conditional = _conditional(if_none_match='W/"other"', if_modified_since=HTTP_DATE)
+    assert conditional.check(1, UPDATED_AT, last_modified=UPDATED_AT) is None
+
+
+@pytest.mark.parametrize(
+    ("header", "modified"),
+    [
+        (HTTP_DATE, False),
+        ("Wed, 04 Mar 2026 06:00:00 GMT", False),
+        ("Wed, 04 Mar 2026 05:06:06 GMT", True),
+        ("Wed, 04 Mar 2026 05:06:07", True),
+        ("yesterday", True),
+    ],
+)
+def test_if_modified_since(header, modified):
+    conditional = _conditional(if_modified_since=header)
+    response = conditional.check(1, UPDATED_AT, last_modified=UPDATED_AT)
+    assert (response is None) == modified
+
+
+def test_collections_ignore_if_modified_since():
+    conditional = _conditional(path="/api/v1/assets", if_modified_since=HTTP_DATE)
+    assert conditional.check_collection((10, UPDATED_AT)) is None
+
+
+def test_collection_validators_cover_related_tables():
+    later = datetime(2026, 5, 1, tzinfo=UTC)
+    plain = _conditional(path="/api/v1/assets")
+    plain.check_collection((10, UPDATED_AT))
+    embedded = _conditional(path="/api/v1/assets")
+    embedded.check_collection((10, UPDATED_AT), related=((3, later),))
+
+    assert embedded.headers["ETag"] != plain.headers["ETag"]
+    assert embedded.headers["Last-Modified"] == "Fri, 01 May 2026 00:00:00 GMT"
+
+    conditional = _conditional(path="/api/v1/assets", if_none_match=embedded.headers["ETag"])
+    assert conditional.check_collection((10, UPDATED_AT), related=((3, later),)).status_code == 304
+    assert conditional.check_collection((10, UPDATED_AT), related=((2, later),)) is None
@@ -0,0 +1,126 @@
+import random
+from datetime import date, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.models.category import DepreciationMethod
+from src.services.depreciation import _compute_period
+from src.services.forecast import (
+    DECLINING_BALANCE,
+    NO_DEPRECIATION,
+    STRAIGHT_LINE,
+    monthly_periods,
+    project_book_values,
+)
+
+METHODS = {
+    STRAIGHT_LINE: DepreciationMethod.STRAIGHT_LINE,
+    DECLINING_BALANCE: DepreciationMethod.DECLINING_BALANCE,
+    NO_DEPRECIATION: DepreciationMethod.NONE,
+}
+
+
+def _stored(value: Decimal) -> Decimal:
+    # Book values are kept in numeric(12, 2) columns between periods.
+    return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def _posted(assets: list[tuple[int, int, int, int]], periods) -> np.ndarray:
+    # What posting each period with the Decimal implementation would leave on the books.
+    schedule = np.empty((len(periods), len(assets)), dtype=np.int64)
+    for position, (purchase_cents, salvage_percent, useful_life, method) in enumerate(assets):
+        category = SimpleNamespace(
+            salvage_value_percent=salvage_percent,
+            useful_life_years=useful_life,
+            depreciation_method=METHODS[method],
+        )
+        purchase_price = Decimal(purchase_cents).scaleb(-2)
+        book_value, accumulated = purchase_price, Decimal(0)
+        for index, (period_start, period_end) in enumerate(periods):
+            if method != NO_DEPRECIATION:
+                result = _compute_period(
+                    purchase_price, category, book_value, accumulated, period_start, period_end
+                )
+                if result:
+                    accumulated, book_value = _stored(result[1]), _stored(result[2])
+            schedule[index, position] = int(book_value.scaleb(2))
+    return schedule
+
+
+def _projected(assets: list[tuple[int, int, int, int]], periods) -> np.ndarray:
+    purchase_cents, salvage_percent, useful_life, method = (
+        np.array(column) for column in zip(*assets, strict=True)
+    )
+    return project_book_values(
+        purchase_cents,
+        purchase_cents.copy(),
+        salvage_percent,
+        useful_life,
+        method.astype(np.int8),
+        periods,
+    )
+
+
+def _irregular_periods(rng: random.Random, count: int) -> list[tuple[date, date]]:
+    # Odd period lengths make exact half-cent amounts far more common than calendar months.
+    periods, start = [], date(2025, 1, 1)
+    for _ in range(count):
+        days = rng.choice([1, 2, 5, 10, 28, 29, 30, 31, 73, 146, 365])
+        periods.append((start, start + timedelta(days=days - 1)))
+        start += timedelta(days=days)
+    return periods
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_projection_matches_posting(seed):
+    rng = random.Random(seed)
+    assets = [
+        (
+            rng.randint(1, 10**9),
+            rng.choice([0, 0, 5, 7, 10, 13, 33]),
+            rng.choice([1, 2, 3, 4, 5, 7, 10, -1]),
+            rng.choice(list(METHODS)),
+        )
+        for _ in range(500)
+    ]
+    periods = _irregular_periods(rng, 60)
+    np.testing.assert_array_equal(_projected(assets, periods), _posted(assets, periods))
+
+
+def test_projection_matches_posting_over_months():
+    rng = random.Random(0)
+    assets = [
+        (rng.randint(1, 10**7), rng.choice([0, 10]), rng.choice([3, 5]), rng.choice(list(METHODS)))
+        for _ in range(200)
+    ]
+    periods = monthly_periods(date(2026, 11, 1), 72)
+    np.testing.assert_array_equal(_projected(assets, periods), _posted(assets, periods))
+
+
+@pytest.mark.parametrize(
+    "asset",
+    [
+        # 365 cents over two years for one day: exactly half a cent.
+        (365, 0, 2, STRAIGHT_LINE),
+        (1095, 0, 2, STRAIGHT_LINE),
+        # Twice 365 cents over four years for one day: exactly half a cent.
+        (365, 0, 4, DECLINING_BALANCE),
+        (1095, 0, 4, DECLINING_BALANCE),
+    ],
+)
+def test_half_cent_ties_follow_posting(asset):
+    periods = [(date(2025, 1, 1), date(2025, 1, 1))]
+    np.testing.assert_array_equal(_projected([asset], periods), _posted([asset], periods))
+
+
+@pytest.mark.parametrize("method", [STRAIGHT_LINE, DECLINING_BALANCE])
+def test_book_value_stops_at_salvage(method):
+    asset = (100_001, 33, 1, method)
+    periods = [(date(2025, 1, 1), date(2025, 12, 31))] * 3
+    projected = _projected([asset], periods)
+    np.testing.assert_array_equal(projected, _posted([asset], periods))
+    # 33% of 1000.01 is 330.0033, which is stored as 330.00.
+    assert projected[-1, 0] == 33_000
@@ -0,0 +1,93 @@
+import os
+
+import pytest
+
+if not os.environ.get("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL is not set", allow_module_level=True)
+
+import httpx  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+from src.core.database import engine  # noqa: E402
+from src.main import app  # noqa: E402
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+@pytest.fixture(scope="module")
+async def client(database):
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test/api/v1"
+    ) as client:
+        yield client
+    await engine.dispose()
+
+
+async def _chain(client, *names: str) -> list[int]:
+    ids = []
+    for name in names:
+        response = await client.post(
+            "/locations", json={"name": name, "parent_id": ids[-1] if ids else None}
+        )
+        assert response.status_code == 201, response.text
+        ids.append(response.json()["id"])
+    return ids
+
+
+async def _ancestors(conn, id: int) -> dict[int, int]:
+    paths = await conn.execute(
+        text("SELECT ancestor_id, depth FROM location_closure WHERE descendant_id = :id"),
+        {"id": id},
+    )
+    return dict(paths.all())
+
+
+async def _asset_ids(client, location_id: int) -> list[int]:
+    response = await client.get(
+        "/assets", params={"location_id": location_id, "include_descendants": True}
+    )
+    assert response.status_code == 200, response.text
+    return [item["id"] for item in response.json()["items"]]
+
+
+async def test_location_move_rewrites_subtree_paths(client, rollback):
+    old_site, wing, room = await _chain(client, "Site", "Wing", "Room")
+    (new_site,) = await _chain(client, "Annex")
+    response = await client.post(
+        "/assets", json={"name": "Projector", "asset_tag": f"ROOM-{room}", "location_id": room}
+    )
+    assert response.status_code == 201, response.text
+    asset_id = response.json()["id"]
+
+    response = await client.put(f"/locations/{wing}", json={"parent_id": new_site})
+    assert response.status_code == 200, response.text
+    assert response.json()["parent_id"] == new_site
+
+    assert await _ancestors(rollback, wing) == {wing: 0, new_site: 1}
+    assert await _ancestors(rollback, room) == {room: 0, wing: 1, new_site: 2}
+    assert await _asset_ids(client, old_site) == []
+    assert await _asset_ids(client, new_site) == [asset_id]
+
+
+async def test_location_move_under_own_subtree_is_rejected(client, rollback):
+    site, wing, room = await _chain(client, "Site", "Wing", "Room")
+
+    response = await client.put(f"/locations/{site}", json={"parent_id": room})
+    assert response.status_code == 400, response.text
+
+    assert await _ancestors(rollback, site) == {site: 0}
+    assert await _ancestors(rollback, room) == {room: 0, wing: 1, site: 2}
+
+
+async def test_location_delete_detaches_subtree(client, rollback):
+    site, wing, room = await _chain(client, "Site", "Wing", "Room")
+    response = await client.post(
+        "/assets", json={"name": "Projector", "asset_tag": f"ROOM-{room}", "location_id": room}
+    )
+    assert response.status_code == 201, response.text
+
+    response = await client.delete(f"/locations/{wing}")
+    assert response.status_code == 204, response.text
+
+    assert await _asset_ids(client, site) == []
+    assert await _ancestors(rollback, room) == {room: 0}
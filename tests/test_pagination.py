@@ -0,0 +1,100 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from src.repositories.pagination import (
+    PaginationError,
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    sort_key,
+)
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Row(Base):
+    __tablename__ = "rows"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    rank: Mapped[int]
+    score: Mapped[int | None]
+    due: Mapped[date]
+
+
+ROWS = [
+    {"id": id, "rank": id % 3, "score": None if id % 4 == 0 else id % 5, "due": date(2025, 1, id)}
+    for id in range(1, 25)
+]
+
+
+@pytest.fixture(scope="module")
+def connection():
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        Base.metadata.create_all(connection)
+        connection.execute(insert(Row), ROWS)
+        yield connection
+
+
+def _postgres_order(sort: str | None) -> list[dict]:
+    # PostgreSQL puts NULLs last ascending and first descending; ties go by id.
+    if sort is None:
+        return sorted(ROWS, key=lambda row: row["id"])
+    name = sort.removeprefix("-")
+    descending = sort.startswith("-")
+    present = [row for row in ROWS if row[name] is not None]
+    missing = [row for row in ROWS if row[name] is None]
+    ordered = sorted(present, key=lambda row: (row[name], row["id"]), reverse=descending)
+    missing.sort(key=lambda row: row["id"], reverse=descending)
+    return missing + ordered if descending else ordered + missing
+
+
+@pytest.mark.parametrize("sort", [None, "rank", "-rank", "score", "-score"])
+def test_keyset_after_resumes_after_every_row(connection, sort):
+    key = sort_key(Row, sort)
+    ordered = _postgres_order(sort)
+    for position, row in enumerate(ordered):
+        values = [row[key.column.key], row["id"]] if key else [row["id"]]
+        cursor = encode_cursor(key, values)
+        after = keyset_after(key, Row.id, decode_cursor(cursor, key, Row.id))
+        found = connection.scalars(select(Row.id).where(after)).all()
+        assert sorted(found) == sorted(row["id"] for row in ordered[position + 1 :])
+
+
+def test_cursor_round_trips_typed_values():
+    key = sort_key(Row, "-due")
+    cursor = encode_cursor(key, [date(2025, 1, 9), 9])
+    assert "=" not in cursor
+    assert decode_cursor(cursor, key, Row.id) == [date(2025, 1, 9), 9]
+
+
+def test_cursor_must_match_sort():
+    cursor = encode_cursor(sort_key(Row, "rank"), [1, 4])
+    with pytest.raises(PaginationError, match="sort order"):
+        decode_cursor(cursor, sort_key(Row, "-rank"), Row.id)
+    with pytest.raises(PaginationError, match="sort order"):
+        decode_cursor(cursor, None, Row.id)
+
+
+@pytest.mark.parametrize(
+    ("sort", "cursor"),
+    [
+        (None, "not a cursor"),
+        (None, encode_cursor(None, [1, 2])),
+        (None, encode_cursor(None, "1")),
+        ("due", encode_cursor(sort_key(Row, "due"), ["yesterday", 1])),
+    ],
+)
+def test_invalid_cursor(sort, cursor):
+    with pytest.raises(PaginationError, match="Invalid cursor"):
+        decode_cursor(cursor, sort_key(Row, sort), Row.id)
+
+
+def test_unknown_sort_column():
+    with pytest.raises(PaginationError, match="Cannot sort by 'missing'"):
+        sort_key(Row, "-missing")
@@ -0,0 +1,303 @@
+import json
+import os
+
+import pytest
+
+if not os.environ.get("TEST_DATABASE_URL"):
+    pytest.skip("TEST_DATABASE_URL is not set", allow_module_level=True)
+
+import httpx  # noqa: E402
+from sqlalchemy import event, text  # noqa: E402
+
+from src.core.database import engine  # noqa: E402
+from src.main import app  # noqa: E402
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+ASSETS = 200_000
+LARGE_TABLES = {
+    "assets",
+    "assignments",
+    "attachments",
+    "depreciation_entries",
+    "maintenance_records",
+    "maintenance_schedules",
+}
+
+SEED = [
+    # The seed refers to rows by id; tests that ran before it rolled their rows back but
+    # still advanced the sequences.
+    "SELECT setval(oid::regclass, 1, false) FROM pg_class WHERE relkind = 'S'",
+    """
+    INSERT INTO categories (name, depreciation_method, useful_life_years, salvage_value_percent)
+    SELECT 'Category ' || n, 'STRAIGHT_LINE', 5, 10 FROM generate_series(1, 50) n
+    """,
+    "INSERT INTO locations (name) SELECT 'Location ' || n FROM generate_series(1, 200) n",
+    "INSERT INTO departments (name) SELECT 'Department ' || n FROM generate_series(1, 100) n",
+    "INSERT INTO vendors (name) SELECT 'Vendor ' || n FROM generate_series(1, 100) n",
+    # Ten buildings with nineteen floors each.
+    "UPDATE locations SET parent_id = 1 + (id - 1) / 20 * 20 WHERE (id - 1) % 20 <> 0",
+    """
+    INSERT INTO location_closure (ancestor_id, descendant_id, depth)
+    SELECT id, id, 0 FROM locations
+    UNION ALL
+    SELECT parent_id, id, 1 FROM locations WHERE parent_id IS NOT NULL
+    """,
+    # Most assets sit in a handful of statuses; the rest are the ones people filter for.
+    f"""
+    INSERT INTO assets (
+        name, asset_tag, status, purchase_date, purchase_price, current_value,
+        category_id, location_id, department_id, vendor_id
+    )
+    SELECT
+        'Asset ' || n,
+        'TAG-' || lpad(n::text, 8, '0'),
+        (CASE
+            WHEN n % 100 = 0 THEN 'IN_MAINTENANCE'
+            WHEN n % 100 = 1 THEN 'RETIRED'
+            WHEN n % 200 = 2 THEN 'DISPOSED'
+            WHEN n % 3 = 0 THEN 'ASSIGNED'
+            ELSE 'AVAILABLE'
+        END)::assetstatus,
+        DATE '2023-01-01' + (n % 700),
+        1000 + n % 5000,
+        1000 + n % 5000,
+        1 + n % 50,
+        1 + n % 200,
+        1 + n % 100,
+        1 + n % 100
+    FROM generate_series(1, {ASSETS}) n
+    """,
+    """
+    INSERT INTO assignments (asset_id, assignee_id, assigned_at, returned_at)
+    SELECT
+        a.id,
+        'user-' || (a.id * k % 5000),
+        now() - (k || ' months')::interval,
+        CASE WHEN k > 1 OR a.status <> 'ASSIGNED' THEN now() - ((k - 1) || ' months')::interval END
+    FROM assets a, generate_series(1, 3) k
+    """,
+    """
+    INSERT INTO maintenance_records (asset_id, maintenance_type, description, completed_date)
+    SELECT a.id, 'INSPECTION', 'Inspection ' || k, DATE '2024-01-01' + k * 30
+    FROM assets a, generate_series(1, 2) k
+    """,
+    """
+    INSERT INTO maintenance_schedules (asset_id, description, frequency_days, next_due, is_active)
+    SELECT id, 'Service', 365, CURRENT_DATE + (id % 730), id % 20 <> 0 FROM assets
+    """,
+    """
+    INSERT INTO attachments (asset_id, filename, original_filename, file_path, mime_type, file_size)
+    SELECT id, id || '.pdf', 'invoice.pdf', 'uploads/' || id || '.pdf', 'application/pdf', 1024
+    FROM assets WHERE id % 2 = 0
+    """,
+    """
+    INSERT INTO depreciation_entries (
+        asset_id, period_start, period_end, depreciation_amount, accumulated_depreciation,
+        book_value
+    )
+    SELECT
+        a.id,
+        (DATE '2024-01-01' + (k || ' months')::interval)::date,
+        (DATE '2024-02-01' + (k || ' months')::interval - INTERVAL '1 day')::date,
+        10, 10 * (k + 1), a.purchase_price - 10 * (k + 1)
+    FROM assets a, generate_series(0, 5) k
+    """,
+]
+
+
+@pytest.fixture(scope="module")
+async def seeded(database):
+    async with engine.begin() as conn:
+        for statement in SEED:
+            await conn.execute(text(statement))
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE"))
+    yield
+    await engine.dispose()
+
+
+@pytest.fixture(scope="module")
+async def client(seeded):
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test/api/v1"
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def captured():
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and not executemany:
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+
+def _seq_scans(plan: dict) -> list[str]:
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in LARGE_TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(_seq_scans(child))
+    return found
+
+
+async def _assert_no_seq_scans(statements):
+    assert statements, "the request issued no queries"
+    async with engine.connect() as conn:
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            plan = result.scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            tables = _seq_scans(plan[0]["Plan"])
+            assert not tables, f"sequential scan on {', '.join(tables)} for:\n{statement}"
+
+
+async def _asset_id(client, **params) -> int:
+    response = await client.get("/assets", params={"page_size": 1, **params})
+    assert response.status_code == 200
+    return response.json()["items"][0]["id"]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"status": "in_maintenance"},
+        {"status": "retired"},
+        {"category_id": 7},
+        {"location_id": 42},
+        {"department_id": 13},
+        {"category_id": 7, "page": 5},
+        {"location_id": 42, "sort": "-id"},
+        {"location_id": 41, "include_descendants": True},
+    ],
+)
+async def test_asset_list_filters(client, captured, params):
+    response = await client.get("/assets", params=params)
+    assert response.status_code == 200, response.text
+    await _assert_no_seq_scans(captured)
+
+
+@pytest.mark.parametrize("params", [{"status": "retired"}, {"location_id": 42}])
+async def test_asset_list_not_modified(client, captured, params):
+    response = await client.get("/assets", params=params)
+    etag = response.headers["ETag"]
+    captured.clear()
+    response = await client.get("/assets", params=params, headers={"If-None-Match": etag})
+    assert response.status_code == 304, response.text
+    await _assert_no_seq_scans(captured)
+
+
+@pytest.mark.parametrize("params", [{"category_id": 7}, {"location_id": 42}])
+async def test_asset_list_facets(client, captured, params):
+    response = await client.get("/assets", params={"facets": True, **params})
+    assert response.status_code == 200, response.text
+    assert response.json()["facets"]["status"]
+    await _assert_no_seq_scans(captured)
+
+
+async def test_asset_list_include(client, captured):
+    response = await client.get(
+        "/assets",
+        params={
+            "status": "assigned",
+            "page_size": 100,
+            "include": "category,location,department,vendor,current_assignment",
+        },
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["items"][0]["category"]
+    await _assert_no_seq_scans(captured)
+
+
+async def test_asset_list_filter_cursor(client, captured):
+    response = await client.get("/assets", params={"category_id": 7})
+    cursor = response.json()["next_cursor"]
+    captured.clear()
+    response = await client.get("/assets", params={"category_id": 7, "cursor": cursor})
+    assert response.status_code == 200, response.text
+    await _assert_no_seq_scans(captured)
+
+
+async def test_asset_maintenance_records(client, captured):
+    asset_id = await _asset_id(client, status="retired")
+    captured.clear()
+    response = await client.get(f"/maintenance/assets/{asset_id}/maintenance")
+    assert response.status_code == 200, response.text
+    await _assert_no_seq_scans(captured)
+
+
+async def test_asset_maintenance_schedules(client, captured):
+    response = await client.get("/maintenance/assets/123/schedules")
+    assert response.status_code == 200, response.text
+    await _assert_no_seq_scans(captured)
+
+
+async def test_upcoming_maintenance(client, captured):
+    response = await client.get("/maintenance/upcoming", params={"days": 2})
+    assert response.status_code == 200, response.text
+    await _assert_no_seq_scans(captured)
+
+
+async def test_depreciation_history(client, captured):
+    response = await client.get("/assets/321/depreciation")
+    assert response.status_code == 200, response.text
+    await _assert_no_seq_scans(captured)
+
+
+async def test_attachments(client, captured):
+    response = await client.get("/assets/456/attachments")
+    assert response.status_code == 200, response.text
+    await _assert_no_seq_scans(captured)
+
+
+async def test_current_assignment_lookup(client, captured, rollback):
+    asset_id = await _asset_id(client, status="assigned", category_id=3)
+    captured.clear()
+    response = await client.post(f"/assets/{asset_id}/return", json={})
+    assert response.status_code == 200, response.text
+    await _assert_no_seq_scans(captured)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"q": "Asset 12345"},
+        {"q": "TAG-0001234"},
+        {"q": "00042", "status": "retired"},
+        {"q": "asset", "category_id": 7, "page": 3},
+    ],
+)
+async def test_asset_search(client, captured, params):
+    response = await client.get("/assets/search", params=params)
+    assert response.status_code == 200, response.text
+    assert response.json()["items"]
+    await _assert_no_seq_scans(captured)
+
+
+async def test_stats_overview(client, captured):
+    response = await client.get("/stats/overview")
+    assert response.status_code == 200, response.text
+    assert response.json()["asset_count"] >= ASSETS
+    await _assert_no_seq_scans(captured)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"ids": list(range(1, 4000, 2))},
+        {"asset_tags": [f"TAG-{n:08d}" for n in range(100, 3100)]},
+    ],
+)
+async def test_asset_batch_get(client, captured, body):
+    response = await client.post("/assets:batchGet", json=body, params={"include": "category"})
+    assert response.status_code == 200, response.text
+    assert response.json()["items"]
+    await _assert_no_seq_scans(captured)